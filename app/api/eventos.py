@@ -1,68 +1,249 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import List, Optional
-from datetime import datetime
+from datetime import date, datetime, time
 from fastapi_pagination import Page, Params, paginate
+from app.core.config import settings
 from app.core.database import Database, logger
-from app.models.evento import EventoBase, EventoCreate, EventoUpdate, EventoResponse
-from app.services.evento_service import EventoService
+from app.core.indexes import ORDENACOES_PERMITIDAS
+from app.core.security import require_admin_token
+from app.models.evento import EventoBase, EventoCreate, EventoUpdate, EventoUpdateLote, EventoResponse, ExclusaoLote
+from app.models.estatisticas import EstatisticasEventos, FacetasEventos
+from app.models.paginacao import CursorPage, Ordem
+from app.services.estatisticas_service import EstatisticasService
+from app.services.evento_service import CAMPOS_RESPOSTA, EventoService
+from app.utils.date_utils import RELATIVE_STATUSES, date_range_filter, date_sort_field
+from app.utils.distance_utils import MODALITIES, distance_filter
+from app.utils.export_utils import csv_chunks, ndjson_chunks
+from app.utils.http_utils import build_validators, is_not_modified, validator_headers
+from app.utils.import_utils import iter_json_documents
+from app.utils.json_utils import MongoJSONResponse
+from app.utils.pagination_utils import ACTIVE_FILTER, InvalidCursorError
+from app.utils.projection_utils import parse_fields
+from app.utils.search_utils import query_terms
 
 router = APIRouter()
 
+ORDENAR_POR_PATTERN = f"^({'|'.join(ORDENACOES_PERMITIDAS)})$"
+ORDENAR_POR_DESCRIPTION = f"Campo de ordenação: {', '.join(ORDENACOES_PERMITIDAS)}"
+ORDEM_DESCRIPTION = "1 (crescente) ou -1 (decrescente)"
+DATA_INICIO_DESCRIPTION = "Eventos que terminam a partir desta data (AAAA-MM-DD)"
+DATA_FIM_DESCRIPTION = "Eventos que começam até esta data (AAAA-MM-DD)"
+DISTANCIA_MIN_DESCRIPTION = "Eventos com alguma distância a partir deste valor (km)"
+DISTANCIA_MAX_DESCRIPTION = "Eventos com alguma distância até este valor (km)"
+MODALIDADE_PATTERN = f"^({'|'.join(MODALITIES)})$"
+MODALIDADE_DESCRIPTION = f"Modalidade: {', '.join(MODALITIES)}"
+
+FIELDS_DESCRIPTION = "Campos a retornar, separados por vírgula (ex.: nome_evento,cidade,datas_realizacao)"
+
+
+def _campos(fields: Optional[str]):
+    """Valida o parâmetro fields, respondendo 400 para campos desconhecidos."""
+    try:
+        return parse_fields(fields, EventoResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+async def _validar_condicional(request: Request, filtro_status: Optional[str] = None, existe: bool = True):
+    """
+    Calcula ETag/Last-Modified a partir do estado da coleção, sem consultar a
+    página em si.
+
+    Args:
+        request: Requisição recebida
+        filtro_status: Filtro de status; pendentes/realizados dependem do dia atual
+        existe: Se o recurso existe (para ``If-None-Match: *``)
+
+    Returns:
+        tuple: (cabeçalhos de validação, resposta 304 ou None)
+    """
+    estado_colecao = await EventoService.obter_estado_colecao()
+    dia = date.today() if filtro_status in RELATIVE_STATUSES else None
+    etag, modificado_em = build_validators(estado_colecao, dia)
+    headers = validator_headers(etag, modificado_em)
+    if is_not_modified(request, etag, modificado_em, existe):
+        return headers, Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return headers, None
+
+
+def _resposta(resultado, campos, response: Response, headers: dict):
+    """
+    Na leitura confiável, o resultado (dicts do banco) é serializado uma única
+    vez com orjson. Com projeção, também é devolvido diretamente, pois o
+    response_model completo exigiria os campos que não foram buscados.
+    """
+    if settings.TRUSTED_READS:
+        return MongoJSONResponse(content=resultado, headers=headers)
+    if campos:
+        return JSONResponse(content=jsonable_encoder(resultado), headers=headers)
+    response.headers.update(headers)
+    return resultado
+
+
+def _campo_ordenacao(ordenar_por: str, ordem: int) -> str:
+    """Campo realmente ordenado: a data é ordenada pela primeira/última data (escalares)."""
+    return date_sort_field(ordem) if ordenar_por == "datas_realizacao" else ordenar_por
+
+
+def _construir_filtro(
+        estado: Optional[str] = None,
+        cidade: Optional[str] = None,
+        nome_evento: Optional[str] = None,
+        status: Optional[str] = None,
+        data_inicio: Optional[date] = None,
+        data_fim: Optional[date] = None,
+        distancia_min: Optional[float] = None,
+        distancia_max: Optional[float] = None,
+        modalidade: Optional[str] = None,
+) -> dict:
+    """Monta o filtro do MongoDB a partir dos parâmetros de consulta."""
+    # Eventos que sumiram da fonte são marcados como removidos pela sincronização
+    filtro = dict(ACTIVE_FILTER)
+
+    if estado:
+        filtro["estado"] = estado
+
+    if cidade:
+        filtro["cidade"] = cidade
+
+    if nome_evento:
+        # Cada palavra buscada deve ser prefixo de uma palavra do nome (índice multikey)
+        termos = query_terms(nome_evento)
+        if termos:
+            filtro["termos_busca"] = {"$all": termos}
+
+    # Status e período sobre a primeira/última data (campos escalares indexados).
+    # Início do dia: mantém o filtro estável para a chave do cache
+    filtro.update(date_range_filter(
+        datetime.combine(data_inicio, time.min) if data_inicio else None,
+        datetime.combine(data_fim, time.max) if data_fim else None,
+        status,
+        hoje=datetime.now().replace(hour=0, minute=0, second=0, microsecond=0),
+    ))
+
+    # Distância (alguma das distâncias no intervalo) e modalidade, campos multikey
+    filtro.update(distance_filter(distancia_min, distancia_max, modalidade))
+
+    return filtro
+
 
 @router.get("/", response_model=Page[EventoResponse])
 async def listar_eventos(
+        request: Request,
+        response: Response,
         estado: Optional[str] = None,
         cidade: Optional[str] = None,
         nome_evento: Optional[str] = None,
         status: Optional[str] = None,  # "pendentes", "realizados" ou "todos"
-        ordenar_por: str = "datas_realizacao",
-        ordem: int = -1,
+        data_inicio: Optional[date] = Query(None, description=DATA_INICIO_DESCRIPTION),
+        data_fim: Optional[date] = Query(None, description=DATA_FIM_DESCRIPTION),
+        distancia_min: Optional[float] = Query(None, ge=0, description=DISTANCIA_MIN_DESCRIPTION),
+        distancia_max: Optional[float] = Query(None, ge=0, description=DISTANCIA_MAX_DESCRIPTION),
+        modalidade: Optional[str] = Query(None, pattern=MODALIDADE_PATTERN, description=MODALIDADE_DESCRIPTION),
+        ordenar_por: str = Query("datas_realizacao", pattern=ORDENAR_POR_PATTERN, description=ORDENAR_POR_DESCRIPTION),
+        ordem: Ordem = Query(Ordem.DECRESCENTE, description=ORDEM_DESCRIPTION),
+        total: str = Query(
+            "exato",
+            pattern="^(exato|estimado|nenhum)$",
+            description="Contagem do total: exato, estimado (sem filtros) ou nenhum"
+        ),
+        fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
         params: Params = Depends(),
 ):
     """
     Lista eventos com filtros, ordenação e paginação.
     """
+    campos = _campos(fields)
     try:
-        # Construir filtro
-        filtro = {}
+        headers, nao_modificado = await _validar_condicional(request, status)
+        if nao_modificado:
+            return nao_modificado
 
-        if estado:
-            filtro["estado"] = estado
+        # Construir filtro
+        filtro = _construir_filtro(
+            estado, cidade, nome_evento, status, data_inicio, data_fim, distancia_min, distancia_max, modalidade
+        )
 
-        if cidade:
-            filtro["cidade"] = cidade
+        # Construir ordenação
+        order = {_campo_ordenacao(ordenar_por, ordem): int(ordem)}
 
-        if nome_evento:
-            filtro["nome_evento"] = {"$regex": nome_evento, "$options": "i"}
+        # Buscar eventos (ordenados por relevância quando há busca por nome)
+        pagina = await EventoService.listar_eventos(
+            filtro, order, params, total, busca=nome_evento, campos=campos
+        )
+        return _resposta(pagina, campos, response, headers)
+    except Exception as e:
+        logger.error(f"Erro ao listar eventos: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Filtrar por status (pendentes ou realizados)
-        if status:
-            hoje = datetime.now()
-            if status == "pendentes":
-                filtro["datas_realizacao"] = {"$gte": hoje}
-            elif status == "realizados":
-                filtro["datas_realizacao"] = {"$lt": hoje}
 
-        # Construir ordenação
-        order = {ordenar_por: ordem}
+@router.get("/cursor", response_model=CursorPage[EventoResponse])
+async def listar_eventos_cursor(
+        request: Request,
+        response: Response,
+        estado: Optional[str] = None,
+        cidade: Optional[str] = None,
+        nome_evento: Optional[str] = None,
+        status: Optional[str] = None,  # "pendentes", "realizados" ou "todos"
+        data_inicio: Optional[date] = Query(None, description=DATA_INICIO_DESCRIPTION),
+        data_fim: Optional[date] = Query(None, description=DATA_FIM_DESCRIPTION),
+        distancia_min: Optional[float] = Query(None, ge=0, description=DISTANCIA_MIN_DESCRIPTION),
+        distancia_max: Optional[float] = Query(None, ge=0, description=DISTANCIA_MAX_DESCRIPTION),
+        modalidade: Optional[str] = Query(None, pattern=MODALIDADE_PATTERN, description=MODALIDADE_DESCRIPTION),
+        ordenar_por: str = Query("datas_realizacao", pattern=ORDENAR_POR_PATTERN, description=ORDENAR_POR_DESCRIPTION),
+        ordem: Ordem = Query(Ordem.DECRESCENTE, description=ORDEM_DESCRIPTION),
+        size: int = Query(50, ge=1, le=100, description="Quantidade de eventos por página"),
+        cursor: Optional[str] = Query(None, description="Token next_cursor da página anterior"),
+        fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+):
+    """
+    Lista eventos com filtros e paginação por cursor.
+    O custo de cada página independe da profundidade, ao contrário de page/size.
+    """
+    campos = _campos(fields)
+    try:
+        headers, nao_modificado = await _validar_condicional(request, status)
+        if nao_modificado:
+            return nao_modificado
 
-        # Buscar eventos
-        return await EventoService.listar_eventos(filtro, order, params)
+        filtro = _construir_filtro(
+            estado, cidade, nome_evento, status, data_inicio, data_fim, distancia_min, distancia_max, modalidade
+        )
+        pagina = await EventoService.listar_eventos_cursor(
+            filtro, _campo_ordenacao(ordenar_por, ordem), int(ordem), size, cursor, campos=campos
+        )
+        return _resposta(pagina, campos, response, headers)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Erro ao listar eventos: {e}")
+        logger.error(f"Erro ao listar eventos por cursor: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/sem-paginacao", response_model=List[EventoResponse])
 async def listar_eventos_sem_paginacao(
-        limit: Optional[int] = Query(100, description="Limite de eventos a retornar")
+        request: Request,
+        response: Response,
+        limit: Optional[int] = Query(
+            100, ge=1, le=settings.SEM_PAGINACAO_MAX_LIMIT,
+            description="Limite de eventos a retornar (para volumes maiores, use /exportar)"
+        ),
+        fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
 ):
     """
     Retorna uma lista de eventos sem paginação.
     Útil para obter dados para filtros ou seleções.
     """
+    campos = _campos(fields)
     try:
-        return await EventoService.listar_eventos_sem_paginacao(limit)
+        headers, nao_modificado = await _validar_condicional(request)
+        if nao_modificado:
+            return nao_modificado
+
+        eventos = await EventoService.listar_eventos_sem_paginacao(limit, _construir_filtro(), campos=campos)
+        return _resposta(eventos, campos, response, headers)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -70,18 +251,226 @@ async def listar_eventos_sem_paginacao(
         )
 
 
+@router.get("/exportar")
+async def exportar_eventos(
+        estado: Optional[str] = None,
+        cidade: Optional[str] = None,
+        nome_evento: Optional[str] = None,
+        status: Optional[str] = None,  # "pendentes", "realizados" ou "todos"
+        data_inicio: Optional[date] = Query(None, description=DATA_INICIO_DESCRIPTION),
+        data_fim: Optional[date] = Query(None, description=DATA_FIM_DESCRIPTION),
+        distancia_min: Optional[float] = Query(None, ge=0, description=DISTANCIA_MIN_DESCRIPTION),
+        distancia_max: Optional[float] = Query(None, ge=0, description=DISTANCIA_MAX_DESCRIPTION),
+        modalidade: Optional[str] = Query(None, pattern=MODALIDADE_PATTERN, description=MODALIDADE_DESCRIPTION),
+        ordenar_por: str = Query("datas_realizacao", pattern=ORDENAR_POR_PATTERN, description=ORDENAR_POR_DESCRIPTION),
+        ordem: Ordem = Query(Ordem.DECRESCENTE, description=ORDEM_DESCRIPTION),
+        formato: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson ou csv"),
+        fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+):
+    """
+    Exporta os eventos filtrados em NDJSON ou CSV, em streaming.
+    A memória usada não depende da quantidade de eventos exportados.
+    """
+    campos = _campos(fields)
+    filtro = _construir_filtro(
+        estado, cidade, nome_evento, status, data_inicio, data_fim, distancia_min, distancia_max, modalidade
+    )
+    eventos = EventoService.exportar_eventos(filtro, {_campo_ordenacao(ordenar_por, ordem): int(ordem)}, campos)
+
+    if formato == "csv":
+        colunas = campos or CAMPOS_RESPOSTA
+        return StreamingResponse(
+            csv_chunks(eventos, colunas),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": 'attachment; filename="eventos.csv"'}
+        )
+
+    return StreamingResponse(
+        ndjson_chunks(eventos),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="eventos.ndjson"'}
+    )
+
+
+@router.get("/facetas", response_model=FacetasEventos, response_model_exclude_none=True)
+async def listar_facetas(
+        request: Request,
+        response: Response,
+        estado: Optional[str] = None,
+        cidade: Optional[str] = None,
+        nome_evento: Optional[str] = None,
+        status: Optional[str] = None,  # "pendentes", "realizados" ou "todos"
+        data_inicio: Optional[date] = Query(None, description=DATA_INICIO_DESCRIPTION),
+        data_fim: Optional[date] = Query(None, description=DATA_FIM_DESCRIPTION),
+        distancia_min: Optional[float] = Query(None, ge=0, description=DISTANCIA_MIN_DESCRIPTION),
+        distancia_max: Optional[float] = Query(None, ge=0, description=DISTANCIA_MAX_DESCRIPTION),
+        modalidade: Optional[str] = Query(None, pattern=MODALIDADE_PATTERN, description=MODALIDADE_DESCRIPTION),
+):
+    """
+    Valores distintos e quantidades de estado, cidade, organizador e faixa de
+    distância para os filtros aplicados, para preencher as opções dos filtros.
+    """
+    try:
+        headers, nao_modificado = await _validar_condicional(request, status)
+        if nao_modificado:
+            return nao_modificado
+
+        filtro = _construir_filtro(
+            estado, cidade, nome_evento, status, data_inicio, data_fim, distancia_min, distancia_max, modalidade
+        )
+        response.headers.update(headers)
+        return await EventoService.listar_facetas(filtro)
+    except Exception as e:
+        logger.error(f"Erro ao listar facetas: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/estatisticas", response_model=EstatisticasEventos, response_model_exclude_none=True)
+async def obter_estatisticas():
+    """
+    Totais de eventos por estado, cidade, mês, faixa de distância e site de coleta.
+    Lê o documento materializado, atualizado após as escritas.
+    """
+    try:
+        return await EstatisticasService.obter()
+    except Exception as e:
+        logger.error(f"Erro ao obter estatísticas: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/import", dependencies=[Depends(require_admin_token)])
+async def importar_eventos(
+        request: Request,
+        chunk_size: Optional[int] = Query(None, ge=1, le=10000, description="Eventos por lote gravado"),
+):
+    """
+    Importa eventos (upsert por nome e datas) a partir de um array JSON ou de
+    NDJSON, lido em streaming e gravado em lotes não ordenados.
+    Retorna as contagens de inseridos, atualizados e com falha de cada lote.
+    """
+    eventos = iter_json_documents(request.stream(), settings.IMPORT_MAX_DOCUMENT_BYTES)
+    try:
+        relatorio = await EventoService.importar_eventos_stream(eventos, chunk_size)
+    except Exception as e:
+        logger.error(f"Erro ao importar eventos: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if "erro" in relatorio:
+        return JSONResponse(status_code=400, content=jsonable_encoder(relatorio))
+    return relatorio
+
+
+@router.post("/lote", dependencies=[Depends(require_admin_token)])
+async def criar_eventos_lote(eventos: List[EventoCreate] = Body(..., max_length=10000)):
+    """
+    Cria vários eventos com um único bulk_write.
+    Retorna as contagens, os erros por posição e os IDs criados.
+    """
+    try:
+        return await EventoService.criar_eventos_lote(eventos)
+    except Exception as e:
+        logger.error(f"Erro ao criar eventos em lote: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.patch("/lote", dependencies=[Depends(require_admin_token)])
+async def atualizar_eventos_lote(alteracoes: List[EventoUpdateLote] = Body(..., max_length=10000)):
+    """
+    Atualiza vários eventos (campos informados de cada um) com um único bulk_write.
+    """
+    try:
+        return await EventoService.atualizar_eventos_lote([
+            (alteracao.id, EventoUpdate(**alteracao.model_dump(exclude={"id"})))
+            for alteracao in alteracoes
+        ])
+    except Exception as e:
+        logger.error(f"Erro ao atualizar eventos em lote: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/lote", dependencies=[Depends(require_admin_token)])
+async def excluir_eventos_lote(exclusao: ExclusaoLote):
+    """
+    Exclui vários eventos pelos IDs, com um único comando.
+    """
+    try:
+        return await EventoService.excluir_eventos_lote(exclusao.ids)
+    except Exception as e:
+        logger.error(f"Erro ao excluir eventos em lote: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/", response_model=EventoResponse, status_code=201, dependencies=[Depends(require_admin_token)])
+async def criar_evento(evento: EventoCreate):
+    """
+    Cria um evento.
+    """
+    try:
+        return await EventoService.criar_evento(evento)
+    except Exception as e:
+        logger.error(f"Erro ao criar evento: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.patch("/{id}", response_model=EventoResponse, dependencies=[Depends(require_admin_token)])
+async def atualizar_evento(id: str, evento: EventoUpdate):
+    """
+    Atualiza os campos informados de um evento.
+    """
+    try:
+        evento_atualizado = await EventoService.atualizar_evento(id, evento)
+
+        if not evento_atualizado:
+            raise HTTPException(status_code=404, detail="Evento não encontrado")
+
+        return evento_atualizado
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error(f"Erro ao atualizar evento: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/{id}", status_code=204, dependencies=[Depends(require_admin_token)])
+async def excluir_evento(id: str):
+    """
+    Exclui um evento.
+    """
+    try:
+        if not await EventoService.excluir_evento(id):
+            raise HTTPException(status_code=404, detail="Evento não encontrado")
+
+        return Response(status_code=204)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error(f"Erro ao excluir evento: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/{id}", response_model=EventoResponse)
-async def obter_evento(id: str):
+async def obter_evento(
+        id: str,
+        request: Request,
+        response: Response,
+        fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+):
     """
     Obtém um evento pelo ID.
     """
+    campos = _campos(fields)
     try:
-        evento = await EventoService.buscar_evento_por_id(id)
+        evento = await EventoService.buscar_evento_por_id(id, campos=campos)
+
+        # Validação após a busca: If-None-Match: * não vale para um evento inexistente
+        headers, nao_modificado = await _validar_condicional(request, existe=evento is not None)
+        if nao_modificado:
+            return nao_modificado
 
         if not evento:
             raise HTTPException(status_code=404, detail="Evento não encontrado")
 
-        return evento
+        return _resposta(evento, campos, response, headers)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -0,0 +1,102 @@
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from app.core.database import Database
+from app.core.metrics import REGISTRY
+from app.core.middleware import HTTP_DURATION, HTTP_REQUESTS
+from app.core.profiling import list_profiles, summarize_profile
+from app.core.security import require_admin_token
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Rotas de métricas, servidas na raiz (/metrics)
+metricas_router = APIRouter()
+
+
+@router.get("/live")
+async def vivo():
+    """Indica que o processo está respondendo (sem consultar o banco)."""
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+async def pronto():
+    """
+    Indica se a API consegue atender: faz um ping no MongoDB e informa a
+    latência e as estatísticas do pool de conexões. Responde 503 se o banco
+    não estiver acessível.
+    """
+    try:
+        latencia = await Database.ping()
+    except Exception as e:
+        logger.warning(f"Verificação de prontidão falhou: {e}")
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "indisponivel", "erro": str(e), "pool": Database.pool_stats()}
+        )
+
+    return {"status": "pronto", "ping_ms": round(latencia, 2), "pool": Database.pool_stats()}
+
+
+@metricas_router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metricas():
+    """Métricas no formato de exposição do Prometheus."""
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@metricas_router.get("/metrics/resumo")
+async def resumo_metricas():
+    """
+    Latência (p50/p95/p99, estimadas pelos buckets) e taxa de erro por rota,
+    para consulta sem um servidor Prometheus.
+    """
+    erros = {}
+    totais = {}
+    for (method, route, status_code), valor in HTTP_REQUESTS.snapshot().items():
+        totais[(method, route)] = totais.get((method, route), 0) + valor
+        if status_code.startswith("5"):
+            erros[(method, route)] = erros.get((method, route), 0) + valor
+
+    rotas = []
+    for (method, route), (contagens, soma) in sorted(HTTP_DURATION.snapshot().items()):
+        total = sum(contagens)
+        quantis = {
+            f"p{int(q * 100)}_ms": round(HTTP_DURATION.quantile_from_counts(q, contagens) * 1000, 2)
+            for q in (0.5, 0.95, 0.99)
+        }
+        rotas.append({
+            "method": method,
+            "route": route,
+            "requisicoes": total,
+            "media_ms": round(soma / total * 1000, 2) if total else None,
+            **quantis,
+            "taxa_erro": round(erros.get((method, route), 0) / totais[(method, route)], 4)
+            if totais.get((method, route)) else 0.0,
+        })
+    return {"rotas": rotas}
+
+
+@router.get("/profiles", dependencies=[Depends(require_admin_token)])
+def listar_perfis():
+    """Perfis de requisição gravados (mais recentes primeiro)."""
+    return {"perfis": list_profiles()}
+
+
+@router.get("/profiles/{perfil_id}", dependencies=[Depends(require_admin_token)])
+def resumo_perfil(
+        perfil_id: str,
+        limit: int = Query(30, ge=1, le=200),
+        ordenar: str = Query("cumulative", pattern="^(cumulative|tottime)$"),
+):
+    """
+    Funções com maior tempo acumulado (ou próprio) em um perfil, e as maiores
+    alocações de memória se o perfil incluiu o tracemalloc.
+    """
+    resumo = summarize_profile(perfil_id, limit, ordenar)
+    if resumo is None:
+        raise HTTPException(status_code=404, detail="Perfil não encontrado")
+    return resumo
@@ -0,0 +1,226 @@
+import hashlib
+import json
+import logging
+import pickle
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.utils.json_utils import JSONEncoder
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend:
+    """Interface mínima de um backend de cache (compatível com Redis)."""
+
+    async def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, expire: int) -> None:
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def incr(self, key: str) -> int:
+        raise NotImplementedError
+
+    async def get_counter(self, key: str) -> int:
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+
+class InMemoryCache(CacheBackend):
+    """
+    Cache em memória do processo com política LRU e expiração (TTL).
+
+    Os contadores (usados como geração de escrita) ficam separados das
+    entradas, para que a evicção LRU nunca reinicie uma geração.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        # Marcar como usado recentemente
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, expire: int) -> None:
+        self._entries[key] = (time.monotonic() + expire, value)
+        self._entries.move_to_end(key)
+
+        # Remover as entradas menos usadas ao exceder o limite
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+    async def get_counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCache(CacheBackend):
+    """
+    Cache sobre um cliente compatível com Redis (``redis.asyncio`` ou um
+    substituto local que implemente ``get``, ``set(ex=)``, ``delete`` e ``incr``).
+    """
+
+    def __init__(self, client, prefix: str = "correpb:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "correpb:") -> "RedisCache":
+        """Cria o backend a partir de uma URL, exigindo o pacote ``redis``."""
+        try:
+            from redis import asyncio as aioredis
+        except ImportError as e:
+            raise ImportError(
+                "O backend 'redis' requer o pacote redis (pip install redis)"
+            ) from e
+        return cls(aioredis.from_url(url), prefix=prefix)
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self.client.get(self.prefix + key)
+        return pickle.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, expire: int) -> None:
+        await self.client.set(self.prefix + key, pickle.dumps(value), ex=expire)
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+
+    async def incr(self, key: str) -> int:
+        return int(await self.client.incr(self.prefix + key))
+
+    async def get_counter(self, key: str) -> int:
+        raw = await self.client.get(self.prefix + key)
+        return int(raw) if raw is not None else 0
+
+    async def clear(self) -> None:
+        # As entradas expiram sozinhas; a invalidação é feita por geração
+        pass
+
+
+def make_key(*parts: Any) -> str:
+    """
+    Gera uma chave determinística a partir de filtros, ordenação e paginação.
+
+    Args:
+        *parts: Partes que identificam a consulta
+
+    Returns:
+        str: Hash da representação normalizada das partes
+    """
+    normalized = json.dumps(parts, sort_keys=True, cls=JSONEncoder, ensure_ascii=False)
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+class Cache:
+    """Cache de leitura (read-through) com invalidação por geração de escrita."""
+
+    backend: CacheBackend = None
+
+    @classmethod
+    def get_backend(cls) -> CacheBackend:
+        """
+        Retorna o backend configurado, criando-o na primeira chamada.
+
+        Returns:
+            CacheBackend: Backend de cache
+        """
+        if cls.backend is None:
+            if settings.CACHE_BACKEND == "redis":
+                cls.backend = RedisCache.from_url(settings.CACHE_REDIS_URL)
+            else:
+                cls.backend = InMemoryCache(max_entries=settings.CACHE_MAX_ENTRIES)
+            logger.info(f"Cache inicializado com backend {settings.CACHE_BACKEND}")
+        return cls.backend
+
+    @classmethod
+    async def get_generation(cls, namespace: str) -> int:
+        """Retorna a geração de escrita atual de um namespace."""
+        return await cls.get_backend().get_counter(f"{namespace}:geracao")
+
+    @classmethod
+    async def invalidate(cls, namespace: str) -> None:
+        """
+        Invalida todas as entradas de um namespace incrementando sua geração.
+
+        Args:
+            namespace: Namespace a invalidar (ex.: nome da coleção)
+        """
+        try:
+            await cls.get_backend().incr(f"{namespace}:geracao")
+        except Exception as e:
+            logger.error(f"Erro ao invalidar cache {namespace}: {e}")
+
+    @classmethod
+    async def get_or_set(
+            cls,
+            namespace: str,
+            key_parts: tuple,
+            loader: Callable[[], Awaitable[Any]],
+            expire: Optional[int] = None
+    ) -> Any:
+        """
+        Busca o valor no cache ou o carrega com ``loader`` e armazena.
+
+        Args:
+            namespace: Namespace da entrada (invalidado em escritas)
+            key_parts: Partes normalizadas que identificam a consulta
+            loader: Função assíncrona que produz o valor em caso de falta
+            expire: Tempo de expiração em segundos (padrão: CACHE_EXPIRE)
+
+        Returns:
+            Valor armazenado ou recém-carregado
+        """
+        if not settings.CACHE_ENABLED:
+            return await loader()
+
+        backend = cls.get_backend()
+        try:
+            generation = await cls.get_generation(namespace)
+            key = f"{namespace}:{generation}:{make_key(*key_parts)}"
+            value = await backend.get(key)
+        except Exception as e:
+            # Uma falha no cache nunca deve derrubar a leitura
+            logger.error(f"Erro ao ler do cache: {e}")
+            return await loader()
+
+        if value is not None:
+            return value
+
+        value = await loader()
+        try:
+            await backend.set(key, value, settings.CACHE_EXPIRE if expire is None else expire)
+        except Exception as e:
+            logger.error(f"Erro ao gravar no cache: {e}")
+        return value
@@ -17,6 +17,41 @@ class Settings(BaseSettings):
 
     MONGODB_URI: str = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
     MONGODB_DB_NAME: str = os.getenv("MONGODB_DB_NAME", "correpb")
+    MONGODB_MAX_POOL_SIZE: int = int(os.getenv("MONGODB_MAX_POOL_SIZE", "50"))
+    MONGODB_MIN_POOL_SIZE: int = int(os.getenv("MONGODB_MIN_POOL_SIZE", "2"))
+    MONGODB_MAX_IDLE_TIME_MS: int = int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "600000"))
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+    # Comandos acima deste tempo vão para o log de consultas lentas (logs/slow_queries.log)
+    MONGODB_SLOW_QUERY_MS: int = int(os.getenv("MONGODB_SLOW_QUERY_MS", "200"))
+    # Obter também o plano (explain) das consultas lentas, no máximo uma vez por formato a cada intervalo
+    MONGODB_SLOW_QUERY_EXPLAIN: bool = os.getenv("MONGODB_SLOW_QUERY_EXPLAIN", "False").lower() == "true"
+    MONGODB_SLOW_QUERY_EXPLAIN_INTERVAL: int = int(os.getenv("MONGODB_SLOW_QUERY_EXPLAIN_INTERVAL", "300"))
+    MONGODB_ENSURE_INDEXES: bool = os.getenv("MONGODB_ENSURE_INDEXES", "True").lower() == "true"
+
+    # "find" usa find + count em paralelo (o count usa só o índice); "facet" obtém
+    # a página por agregação, com o total no mesmo $facet apenas na busca por relevância
+    PAGINATION_ENGINE: str = os.getenv("PAGINATION_ENGINE", "find")
+    # Leituras do próprio banco dispensam validação Pydantic e são serializadas com orjson
+    TRUSTED_READS: bool = os.getenv("TRUSTED_READS", "True").lower() == "true"
+
+    # Limite máximo de /sem-paginacao e tamanho dos lotes do cursor de exportação
+    SEM_PAGINACAO_MAX_LIMIT: int = int(os.getenv("SEM_PAGINACAO_MAX_LIMIT", "1000"))
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", "500"))
+
+    # Rotas de escrita exigem este token no cabeçalho X-Admin-Token (vazio desativa a escrita)
+    API_ADMIN_TOKEN: str = os.getenv("API_ADMIN_TOKEN", "")
+    # Eventos por bulk_write e tamanho máximo de um documento na importação
+    IMPORT_CHUNK_SIZE: int = int(os.getenv("IMPORT_CHUNK_SIZE", "1000"))
+    IMPORT_MAX_DOCUMENT_BYTES: int = int(os.getenv("IMPORT_MAX_DOCUMENT_BYTES", str(1024 * 1024)))
+
+    # Segundos entre uma escrita e a atualização das estatísticas, e idade máxima do documento materializado
+    ESTATISTICAS_ATRASO: float = float(os.getenv("ESTATISTICAS_ATRASO", "5"))
+    ESTATISTICAS_IDADE_MAXIMA: int = int(os.getenv("ESTATISTICAS_IDADE_MAXIMA", "3600"))
+
+    # Profiling por requisição (X-Profile: cpu ou cpu,memory + X-Admin-Token)
+    PROFILING_ENABLED: bool = os.getenv("PROFILING_ENABLED", "False").lower() == "true"
+    PROFILING_DIR: str = os.getenv("PROFILING_DIR", os.path.join("logs", "profiles"))
+    PROFILING_MAX_FILES: int = int(os.getenv("PROFILING_MAX_FILES", "20"))
 
     CORS_ORIGINS: List[str] = [
         "http://localhost:3000",
@@ -25,6 +60,13 @@ class Settings(BaseSettings):
 
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    # Níveis por módulo, ex.: "pymongo=WARNING,app.services=DEBUG"
+    LOG_LEVELS: str = os.getenv("LOG_LEVELS", "pymongo=WARNING")
+    # Rotação dos arquivos de log: "size" (LOG_MAX_BYTES) ou "time" (LOG_ROTATION_WHEN)
+    LOG_ROTATION: str = os.getenv("LOG_ROTATION", "size")
+    LOG_MAX_BYTES: int = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+    LOG_ROTATION_WHEN: str = os.getenv("LOG_ROTATION_WHEN", "midnight")
+    LOG_BACKUP_COUNT: int = int(os.getenv("LOG_BACKUP_COUNT", "5"))
 
     SCRAPER_USER_AGENT: str = os.getenv(
         "SCRAPER_USER_AGENT",
@@ -35,6 +77,11 @@ class Settings(BaseSettings):
 
     CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "True").lower() == "true"
     CACHE_EXPIRE: int = int(os.getenv("CACHE_EXPIRE", "3600"))  # 1 hora em segundos
+    CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")  # "memory" ou "redis"
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+    CACHE_REDIS_URL: str = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+    # Por quanto tempo o estado da coleção (ETag/Last-Modified) é reaproveitado
+    ETAG_STATE_TTL: int = int(os.getenv("ETAG_STATE_TTL", "5"))
 
     class Config:
         env_file = ".env"
@@ -1,24 +1,308 @@
+import asyncio
+import json
 import logging
+import math
+import time
+from typing import Any, Dict, Optional, Tuple
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase, AsyncIOMotorCollection
+from pymongo import monitoring
 from app.core.config import settings
+from app.core.indexes import ensure_indexes
+from app.core.metrics import REGISTRY
 
 logger = logging.getLogger(__name__)
 
 
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """Acompanha o pool de conexões do driver para o endpoint de prontidão."""
+
+    def __init__(self):
+        self.abertas = 0
+        self.em_uso = 0
+        self.checkouts = 0
+        self.falhas_checkout = 0
+        self.limpezas = 0
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self.limpezas += 1
+        logger.warning(f"Pool de conexões limpo: {event.address}")
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self.abertas += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self.abertas -= 1
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        self.falhas_checkout += 1
+
+    def connection_checked_out(self, event):
+        self.em_uso += 1
+        self.checkouts += 1
+
+    def connection_checked_in(self, event):
+        self.em_uso -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """Retorna os contadores atuais do pool."""
+        return {
+            "conexoes_abertas": self.abertas,
+            "conexoes_em_uso": self.em_uso,
+            "checkouts": self.checkouts,
+            "falhas_checkout": self.falhas_checkout,
+            "limpezas": self.limpezas,
+            "max_pool_size": settings.MONGODB_MAX_POOL_SIZE,
+            "min_pool_size": settings.MONGODB_MIN_POOL_SIZE,
+        }
+
+
+# Comandos internos do driver, que não interessam nas métricas
+_COMANDOS_IGNORADOS = {
+    "hello", "ismaster", "isMaster", "ping", "buildinfo", "buildInfo", "endSessions",
+    "saslStart", "saslContinue", "killCursors", "explain",
+}
+
+# Comandos cujo plano pode ser obtido com explain (sem efeitos colaterais)
+_COMANDOS_EXPLICAVEIS = {"find", "aggregate", "count", "distinct"}
+
+# Partes do comando que não descrevem a consulta
+_CHAVES_DE_SESSAO = {"lsid", "$db", "$clusterTime", "$readPreference", "txnNumber", "readConcern", "writeConcern"}
+
+COMMAND_DURATION = REGISTRY.histogram(
+    "mongodb_command_duration_seconds",
+    "Duração dos comandos enviados ao MongoDB",
+    ("collection", "operation"),
+)
+COMMAND_FAILURES = REGISTRY.counter(
+    "mongodb_command_failures_total",
+    "Comandos do MongoDB que falharam",
+    ("collection", "operation"),
+)
+
+slow_query_logger = logging.getLogger("slow_queries")
+
+
+def query_shape(value: Any) -> Any:
+    """
+    Formato de uma consulta: mantém operadores e campos e troca os valores
+    por 1, para agrupar consultas iguais com parâmetros diferentes.
+    """
+    if isinstance(value, dict):
+        return {chave: query_shape(valor) for chave, valor in value.items()}
+    if isinstance(value, (list, tuple)):
+        formas = [query_shape(item) for item in value]
+        # Listas de valores ($in, $all) viram um só elemento
+        return formas[:1] if all(not isinstance(f, dict) for f in formas) else formas
+    return 1
+
+
+def _command_shape(command_name: str, command: Dict[str, Any]) -> Dict[str, Any]:
+    """Partes relevantes de um comando (filtro, ordenação, pipeline...)."""
+    forma: Dict[str, Any] = {}
+    for chave in ("filter", "sort", "projection", "query", "key", "pipeline", "hint"):
+        if chave in command:
+            forma[chave] = query_shape(command[chave])
+    for chave in ("updates", "deletes"):
+        if command.get(chave):
+            forma["q"] = query_shape(command[chave][0].get("q", {}))
+    return forma
+
+
+def _plan_summary(plano: Dict[str, Any]) -> str:
+    """Resume o plano vencedor de um explain (ex.: "LIMIT > FETCH > IXSCAN(nome)")."""
+    planner = plano.get("queryPlanner")
+    if planner is None:
+        # Agregações: o plano fica no primeiro estágio ($cursor)
+        for estagio in plano.get("stages", []):
+            if "$cursor" in estagio:
+                planner = estagio["$cursor"].get("queryPlanner")
+                break
+    if planner is None:
+        return "plano indisponível"
+
+    partes = []
+    estagio = planner.get("winningPlan", {})
+    estagio = estagio.get("queryPlan", estagio)  # Formato do mecanismo SBE
+    while estagio:
+        nome = estagio.get("stage", "?")
+        if estagio.get("indexName"):
+            nome += f"({estagio['indexName']})"
+        partes.append(nome)
+        estagio = estagio.get("inputStage") or (estagio.get("inputStages") or [None])[0]
+    return " > ".join(partes)
+
+
+class CommandMonitor(monitoring.CommandListener):
+    """
+    Registra a duração de cada comando por coleção e operação e grava no log
+    de consultas lentas (logger ``slow_queries``) os que passarem de
+    MONGODB_SLOW_QUERY_MS, com o formato da consulta e, opcionalmente, o plano.
+
+    Os callbacks rodam nas threads do driver; o explain é agendado no event loop.
+    """
+
+    def __init__(self):
+        self._comandos: Dict[Tuple[Any, int], Tuple[str, str, Dict[str, Any]]] = {}
+        self._explicados: Dict[str, float] = {}
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def started(self, event):
+        if event.command_name in _COMANDOS_IGNORADOS:
+            return
+        colecao = event.command.get(event.command_name)
+        if event.command_name == "getMore":
+            colecao = event.command.get("collection")
+        if not isinstance(colecao, str):
+            colecao = ""
+        self._comandos[(event.connection_id, event.request_id)] = (event.command_name, colecao, event.command)
+
+    def succeeded(self, event):
+        self._finalizar(event, falhou=False)
+
+    def failed(self, event):
+        self._finalizar(event, falhou=True)
+
+    def _finalizar(self, event, falhou: bool):
+        registro = self._comandos.pop((event.connection_id, event.request_id), None)
+        if registro is None:
+            return
+        operacao, colecao, comando = registro
+        duracao = event.duration_micros / 1_000_000
+
+        COMMAND_DURATION.observe(duracao, collection=colecao, operation=operacao)
+        if falhou:
+            COMMAND_FAILURES.inc(collection=colecao, operation=operacao)
+
+        if duracao * 1000 >= settings.MONGODB_SLOW_QUERY_MS:
+            try:
+                self._registrar_lenta(operacao, colecao, comando, duracao, event.database_name)
+            except Exception as e:
+                logger.error(f"Erro ao registrar consulta lenta: {e}")
+
+    def _registrar_lenta(self, operacao: str, colecao: str, comando: Dict[str, Any], duracao: float, banco: str):
+        forma = _command_shape(operacao, comando)
+        descricao = json.dumps(forma, default=str, sort_keys=True)
+        slow_query_logger.warning(
+            f"Consulta lenta: {operacao} em {colecao} levou {duracao * 1000:.1f} ms; formato: {descricao}"
+        )
+
+        if not settings.MONGODB_SLOW_QUERY_EXPLAIN or operacao not in _COMANDOS_EXPLICAVEIS:
+            return
+        if any("$merge" in estagio or "$out" in estagio for estagio in comando.get("pipeline", [])):
+            return
+
+        # Um explain por formato de consulta a cada intervalo
+        chave = f"{colecao}:{operacao}:{descricao}"
+        agora = time.monotonic()
+        if agora - self._explicados.get(chave, -math.inf) < settings.MONGODB_SLOW_QUERY_EXPLAIN_INTERVAL:
+            return
+        self._explicados[chave] = agora
+
+        if self.loop is None or self.loop.is_closed():
+            return
+        comando_explain = {k: v for k, v in comando.items() if k not in _CHAVES_DE_SESSAO}
+        self.loop.call_soon_threadsafe(
+            lambda: asyncio.ensure_future(self._explicar(banco, operacao, colecao, comando_explain, descricao))
+        )
+
+    async def _explicar(self, banco: str, operacao: str, colecao: str, comando: Dict[str, Any], descricao: str):
+        try:
+            if Database.client is None:
+                return
+            plano = await Database.client[banco].command({"explain": comando, "verbosity": "queryPlanner"})
+            slow_query_logger.warning(
+                f"Plano de {operacao} em {colecao} ({descricao}): {_plan_summary(plano)}"
+            )
+        except Exception as e:
+            logger.error(f"Erro ao obter o plano da consulta lenta: {e}")
+
+
 class Database:
     client: AsyncIOMotorClient = None
     db: AsyncIOMotorDatabase = None
+    pool_monitor = PoolMonitor()
+    command_monitor = CommandMonitor()
+
+    # Garante um único cliente mesmo com várias requisições simultâneas na partida
+    _lock = asyncio.Lock()
 
     @classmethod
     async def connect(cls):
-        """Estabelece conexão com o banco de dados MongoDB."""
-        try:
-            cls.client = AsyncIOMotorClient(settings.MONGODB_URI)
-            cls.db = cls.client[settings.MONGODB_DB_NAME]
-            logger.info(f"Conectado ao banco de dados {settings.MONGODB_DB_NAME}")
-        except Exception as e:
-            logger.error(f"Erro ao conectar ao banco de dados: {e}")
-            raise
+        """Estabelece conexão com o banco de dados MongoDB (uma única vez)."""
+        async with cls._lock:
+            if cls.db is not None:
+                return
+
+            try:
+                cls.client = AsyncIOMotorClient(
+                    settings.MONGODB_URI,
+                    maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+                    minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+                    maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+                    serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+                    event_listeners=[cls.pool_monitor, cls.command_monitor],
+                )
+                cls.command_monitor.loop = asyncio.get_running_loop()
+                cls.db = cls.client[settings.MONGODB_DB_NAME]
+                logger.info(f"Conectado ao banco de dados {settings.MONGODB_DB_NAME}")
+            except Exception as e:
+                logger.error(f"Erro ao conectar ao banco de dados: {e}")
+                raise
+
+            if settings.MONGODB_ENSURE_INDEXES:
+                try:
+                    await ensure_indexes(cls.db)
+                except Exception as e:
+                    # Índices ausentes degradam o desempenho, mas não impedem a API
+                    logger.error(f"Erro ao reconciliar índices: {e}")
+
+    @classmethod
+    async def ping(cls) -> float:
+        """
+        Envia um ping ao servidor.
+
+        Returns:
+            float: Latência em milissegundos
+        """
+        db = await cls.get_database()
+        inicio = time.perf_counter()
+        await db.command("ping")
+        return (time.perf_counter() - inicio) * 1000
+
+    @classmethod
+    async def warm_up(cls, collection_name: Optional[str] = "eventos"):
+        """
+        Aquece o pool na partida: ping e uma consulta leve, para que a primeira
+        requisição não pague a seleção de servidor, o handshake e a autenticação.
+
+        Args:
+            collection_name: Coleção usada na consulta de aquecimento
+        """
+        latencia = await cls.ping()
+        if collection_name:
+            collection = await cls.get_collection(collection_name)
+            await collection.find_one({}, {"_id": 1})
+        logger.info(f"Pool do MongoDB aquecido (ping {latencia:.1f} ms)")
+
+    @classmethod
+    def pool_stats(cls) -> Dict[str, Any]:
+        """Estatísticas do pool de conexões."""
+        return cls.pool_monitor.stats()
 
     @classmethod
     async def close(cls):
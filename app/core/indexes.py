@@ -0,0 +1,226 @@
+"""
+Registro declarativo dos índices do MongoDB.
+
+Os índices de cada coleção são declarados em ``INDEXES`` como ``IndexModel``
+(o que cobre índices compostos, multikey, de texto e parciais). Na conexão,
+``Database.connect`` cria os que estiverem faltando. Diferenças que exigem
+remoção são apenas reportadas e aplicadas pela linha de comando:
+
+    python -m app.core.indexes            # mostra as diferenças
+    python -m app.core.indexes --apply    # cria os índices faltantes
+    python -m app.core.indexes --apply --drop   # também recria/remove divergentes
+"""
+import argparse
+import asyncio
+import logging
+from typing import Any, Dict, List
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+logger = logging.getLogger(__name__)
+
+# Campos aceitos em ``ordenar_por``: toda combinação de filtro com cada um
+# deles é coberta por um índice (verificado por benchmarks/query_plans.py)
+ORDENACOES_PERMITIDAS = ("datas_realizacao", "nome_evento")
+
+# Condição dos índices de listagem: só os eventos ativos (``ACTIVE_FILTER``),
+# que toda consulta da API inclui. Os removidos pela sincronização ficam de fora
+_ATIVOS = {"ativo": True}
+
+INDEXES: Dict[str, List[IndexModel]] = {
+    "eventos": [
+        # Filtros por status/período e ordenação por data: a ordenação decrescente
+        # usa a última data e a crescente a primeira; a outra data fica na chave
+        # para filtrar sem ler o documento
+        IndexModel(
+            [("ultima_data", DESCENDING), ("primeira_data", DESCENDING)],
+            name="ultima_data", partialFilterExpression=_ATIVOS
+        ),
+        IndexModel(
+            [("primeira_data", ASCENDING), ("ultima_data", ASCENDING)],
+            name="primeira_data", partialFilterExpression=_ATIVOS
+        ),
+        # O mesmo com filtro por estado ou cidade
+        IndexModel(
+            [("estado", ASCENDING), ("ultima_data", DESCENDING), ("primeira_data", DESCENDING)],
+            name="estado_ultima_data", partialFilterExpression=_ATIVOS
+        ),
+        IndexModel(
+            [("estado", ASCENDING), ("primeira_data", ASCENDING), ("ultima_data", ASCENDING)],
+            name="estado_primeira_data", partialFilterExpression=_ATIVOS
+        ),
+        IndexModel(
+            [("cidade", ASCENDING), ("ultima_data", DESCENDING), ("primeira_data", DESCENDING)],
+            name="cidade_ultima_data", partialFilterExpression=_ATIVOS
+        ),
+        IndexModel(
+            [("cidade", ASCENDING), ("primeira_data", ASCENDING), ("ultima_data", ASCENDING)],
+            name="cidade_primeira_data", partialFilterExpression=_ATIVOS
+        ),
+        # Ordenação por nome, sozinha ou com filtro por estado/cidade e status/período
+        IndexModel(
+            [("nome_evento", ASCENDING), ("primeira_data", ASCENDING), ("ultima_data", ASCENDING)],
+            name="nome_evento", partialFilterExpression=_ATIVOS
+        ),
+        IndexModel(
+            [("estado", ASCENDING), ("nome_evento", ASCENDING), ("primeira_data", ASCENDING),
+             ("ultima_data", ASCENDING)],
+            name="estado_nome_evento", partialFilterExpression=_ATIVOS
+        ),
+        IndexModel(
+            [("cidade", ASCENDING), ("nome_evento", ASCENDING), ("primeira_data", ASCENDING),
+             ("ultima_data", ASCENDING)],
+            name="cidade_nome_evento", partialFilterExpression=_ATIVOS
+        ),
+        # Busca por nome da sincronização com o Atlas, que também encontra os removidos
+        IndexModel([("nome_evento", ASCENDING)], name="nome_evento_sincronizacao"),
+        # Busca sem acentos por prefixos das palavras do nome (multikey),
+        # com as datas na chave para os filtros por status/período
+        IndexModel(
+            [("termos_busca", ASCENDING), ("primeira_data", ASCENDING), ("ultima_data", ASCENDING)],
+            name="termos_busca", partialFilterExpression=_ATIVOS
+        ),
+        # Filtros por distância (km) e modalidade (multikey)
+        IndexModel([("distancias_km", ASCENDING)], name="distancias_km", partialFilterExpression=_ATIVOS),
+        IndexModel([("modalidades", ASCENDING)], name="modalidades", partialFilterExpression=_ATIVOS),
+        # Último evento alterado; documentos antigos sem o campo ficam de fora
+        IndexModel(
+            [("atualizado_em", DESCENDING)],
+            name="atualizado_em",
+            partialFilterExpression={"atualizado_em": {"$exists": True}}
+        ),
+    ],
+}
+
+# Opções que tornam dois índices com a mesma chave diferentes entre si
+_COMPARED_OPTIONS = (
+    "unique", "sparse", "partialFilterExpression", "expireAfterSeconds",
+    "weights", "default_language", "collation",
+)
+
+
+def _normalize(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduz a especificação de um índice à chave e às opções comparáveis."""
+    key = spec["key"]
+    key = list(key.items()) if hasattr(key, "items") else list(key)
+    normalized = {"key": [(field, direction) for field, direction in key]}
+    for option in _COMPARED_OPTIONS:
+        if option in spec:
+            normalized[option] = spec[option]
+    return normalized
+
+
+async def diff_indexes(db, collection_name: str) -> Dict[str, List[str]]:
+    """
+    Compara os índices declarados com os existentes em uma coleção.
+
+    Args:
+        db: Banco de dados (Motor)
+        collection_name: Nome da coleção
+
+    Returns:
+        dict: Nomes dos índices a criar, a recriar (divergentes) e a remover
+    """
+    declared = {model.document["name"]: model.document for model in INDEXES.get(collection_name, [])}
+    existing = await db[collection_name].index_information()
+    existing.pop("_id_", None)
+
+    # Índices existentes indexados pela chave, para reconhecer nomes diferentes
+    existing_by_key = {tuple(info["key"]): name for name, info in existing.items()}
+
+    diff = {"criar": [], "recriar": [], "remover": []}
+    matched = set()
+
+    for name, spec in declared.items():
+        wanted = _normalize(spec)
+        current_name = name if name in existing else existing_by_key.get(tuple(wanted["key"]))
+
+        if current_name is None:
+            diff["criar"].append(name)
+            continue
+
+        matched.add(current_name)
+        current = _normalize(existing[current_name])
+        if current != wanted or current_name != name:
+            diff["recriar"].append(name)
+
+    diff["remover"] = sorted(set(existing) - matched)
+    return diff
+
+
+async def apply_indexes(db, collection_name: str, drop: bool = False) -> Dict[str, List[str]]:
+    """
+    Cria os índices faltantes e, se ``drop`` for verdadeiro, recria os
+    divergentes e remove os que não estão declarados.
+
+    Args:
+        db: Banco de dados (Motor)
+        collection_name: Nome da coleção
+        drop: Permite remover índices existentes
+
+    Returns:
+        dict: Diferenças encontradas antes da aplicação
+    """
+    diff = await diff_indexes(db, collection_name)
+    collection = db[collection_name]
+    declared = {model.document["name"]: model for model in INDEXES.get(collection_name, [])}
+
+    if drop:
+        existing = await collection.index_information()
+        for name in diff["recriar"]:
+            key = declared[name].document["key"]
+            key = list(key.items()) if hasattr(key, "items") else list(key)
+            # O índice divergente pode existir com outro nome
+            for existing_name, info in existing.items():
+                if existing_name == name or list(info["key"]) == key:
+                    await collection.drop_index(existing_name)
+        for name in diff["remover"]:
+            await collection.drop_index(name)
+        to_create = diff["criar"] + diff["recriar"]
+    else:
+        to_create = diff["criar"]
+        if diff["recriar"] or diff["remover"]:
+            logger.warning(
+                f"Índices divergentes em {collection_name} (use o CLI com --drop): "
+                f"recriar={diff['recriar']} remover={diff['remover']}"
+            )
+
+    if to_create:
+        await collection.create_indexes([declared[name] for name in to_create])
+        logger.info(f"Índices criados em {collection_name}: {to_create}")
+
+    return diff
+
+
+async def ensure_indexes(db) -> None:
+    """Cria os índices faltantes de todas as coleções declaradas."""
+    for collection_name in INDEXES:
+        await apply_indexes(db, collection_name, drop=False)
+
+
+async def _main(apply: bool, drop: bool) -> None:
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from app.core.config import settings
+
+    client = AsyncIOMotorClient(settings.MONGODB_URI)
+    db = client[settings.MONGODB_DB_NAME]
+    try:
+        for collection_name in INDEXES:
+            if apply:
+                diff = await apply_indexes(db, collection_name, drop=drop)
+            else:
+                diff = await diff_indexes(db, collection_name)
+            print(f"{collection_name}:")
+            for action, names in diff.items():
+                print(f"  {action}: {', '.join(names) if names else '-'}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gerencia os índices declarados do MongoDB")
+    parser.add_argument("--apply", action="store_true", help="Aplica as diferenças")
+    parser.add_argument("--drop", action="store_true", help="Permite remover/recriar índices divergentes")
+    args = parser.parse_args()
+
+    asyncio.run(_main(args.apply, args.drop))
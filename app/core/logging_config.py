@@ -0,0 +1,171 @@
+"""
+Configuração de logging do processo da API.
+
+Os registros são apenas enfileirados no event loop (``QueueHandler``); a
+formatação e a escrita em disco acontecem na thread de um ``QueueListener``.
+O arquivo é gravado em JSON (uma linha por registro, UTF-8) com rotação.
+"""
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# ID da requisição em andamento (definido pelo RequestContextMiddleware)
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Atributos padrão de um LogRecord; os demais vêm de ``extra`` e vão para o JSON
+_ATRIBUTOS_PADRAO = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class RequestContextFilter(logging.Filter):
+    """Anexa o ID da requisição atual a cada registro."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            record.request_id = request_id_var.get()
+        return True
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Enfileira o registro com a mensagem já montada, mas sem misturar o
+    traceback à mensagem (o JSON o grava em um campo próprio).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class JSONFormatter(logging.Formatter):
+    """Formata cada registro como um objeto JSON em uma linha."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        dados = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            dados["request_id"] = record.request_id
+        for chave, valor in vars(record).items():
+            if chave not in _ATRIBUTOS_PADRAO and chave != "request_id":
+                dados[chave] = valor
+        if record.exc_info:
+            dados["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            dados["exc_info"] = record.exc_text
+        return json.dumps(dados, ensure_ascii=False, default=str)
+
+
+def parse_levels(levels: str) -> Dict[str, str]:
+    """
+    Interpreta os níveis por módulo.
+
+    Args:
+        levels: Pares separados por vírgula, ex.: "pymongo=WARNING,app.services=DEBUG"
+
+    Returns:
+        dict: {nome do logger: nível}
+    """
+    niveis = {}
+    for par in levels.split(","):
+        if "=" not in par:
+            continue
+        nome, nivel = (parte.strip() for parte in par.split("=", 1))
+        if nome and nivel:
+            niveis[nome] = nivel.upper()
+    return niveis
+
+
+def _file_handler(path: str) -> logging.Handler:
+    """Handler de arquivo com rotação por tamanho ou por tempo (LOG_ROTATION)."""
+    if settings.LOG_ROTATION == "time":
+        handler = logging.handlers.TimedRotatingFileHandler(
+            path, when=settings.LOG_ROTATION_WHEN, backupCount=settings.LOG_BACKUP_COUNT, encoding="utf-8"
+        )
+    else:
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=settings.LOG_MAX_BYTES, backupCount=settings.LOG_BACKUP_COUNT, encoding="utf-8"
+        )
+    handler.setFormatter(JSONFormatter())
+    return handler
+
+
+class _LoggerFilter(logging.Filter):
+    """Deixa passar apenas (ou todos exceto) os registros de um logger."""
+
+    def __init__(self, name: str, exclude: bool = False):
+        super().__init__()
+        self.nome = name
+        self.exclude = exclude
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        pertence = record.name == self.nome or record.name.startswith(self.nome + ".")
+        return pertence != self.exclude
+
+
+def setup_logging(log_dir: str = "logs") -> logging.handlers.QueueListener:
+    """
+    Configura o logging: fila no processo, console em texto e arquivos JSON
+    com rotação (``api.log`` e ``slow_queries.log``).
+
+    Args:
+        log_dir: Diretório dos arquivos de log
+
+    Returns:
+        QueueListener: Listener já iniciado (encerrado automaticamente na saída)
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    os.makedirs(log_dir, exist_ok=True)
+
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter(settings.LOG_FORMAT))
+
+    api_file = _file_handler(os.path.join(log_dir, "api.log"))
+    api_file.addFilter(_LoggerFilter("slow_queries", exclude=True))
+
+    slow_file = _file_handler(os.path.join(log_dir, "slow_queries.log"))
+    slow_file.addFilter(_LoggerFilter("slow_queries"))
+
+    fila: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _QueueHandler(fila)
+    queue_handler.addFilter(RequestContextFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO))
+
+    for nome, nivel in parse_levels(settings.LOG_LEVELS).items():
+        logging.getLogger(nome).setLevel(nivel)
+
+    _listener = logging.handlers.QueueListener(
+        fila, console, api_file, slow_file, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
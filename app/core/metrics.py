@@ -0,0 +1,223 @@
+"""
+Métricas em memória no formato de exposição do Prometheus, sem dependências.
+
+Os valores são atualizados tanto pelo event loop quanto pelas threads do
+driver (listeners do pymongo), por isso cada métrica tem o próprio lock.
+"""
+import bisect
+import logging
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Limites (em segundos) dos buckets de latência
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Limites (em bytes) dos buckets de tamanho de resposta
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pares = [f'{nome}="{_escape(valor)}"' for nome, valor in zip(names, values)]
+    if extra:
+        pares.append(extra)
+    return "{" + ",".join(pares) + "}" if pares else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """Base das métricas: nome, descrição e nomes dos rótulos."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(nome, "")) for nome in self.label_names)
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Texto da métrica no formato de exposição do Prometheus."""
+        linhas = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        linhas.extend(self.samples())
+        return "\n".join(linhas)
+
+
+class Counter(Metric):
+    """Contador crescente por combinação de rótulos."""
+
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def snapshot(self) -> Dict[Tuple[str, ...], float]:
+        """Cópia dos valores, por combinação de rótulos."""
+        with self._lock:
+            return dict(self._values)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            itens = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(v)}" for key, v in itens]
+
+
+class Gauge(Counter):
+    """Valor que sobe e desce (ex.: requisições em andamento)."""
+
+    type_name = "gauge"
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    """Histograma com buckets fixos, soma e contagem por combinação de rótulos."""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Por rótulos: [contagens por bucket (não acumuladas) + excedentes, soma]
+        self._values: Dict[Tuple[str, ...], List] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        indice = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            estado = self._values.get(key)
+            if estado is None:
+                estado = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            estado[0][indice] += 1
+            estado[1] += value
+
+    def count(self, **labels) -> int:
+        estado = self._values.get(self._key(labels))
+        return sum(estado[0]) if estado else 0
+
+    def quantile(self, q: float, **labels) -> Optional[float]:
+        """
+        Estima um quantil por interpolação linear dentro do bucket, como o
+        ``histogram_quantile`` do Prometheus.
+
+        Args:
+            q: Quantil entre 0 e 1 (ex.: 0.95)
+
+        Returns:
+            float: Valor estimado, ou None se não houver observações
+        """
+        with self._lock:
+            estado = self._values.get(self._key(labels))
+            contagens = list(estado[0]) if estado else []
+        return self.quantile_from_counts(q, contagens)
+
+    def quantile_from_counts(self, q: float, contagens: List[int]) -> Optional[float]:
+        total = sum(contagens)
+        if not total:
+            return None
+        alvo = q * total
+        acumulado = 0
+        for indice, contagem in enumerate(contagens):
+            if acumulado + contagem >= alvo and contagem:
+                if indice == len(self.buckets):
+                    # Acima do último limite: o melhor que se pode dizer é o limite
+                    return self.buckets[-1]
+                inferior = self.buckets[indice - 1] if indice else 0.0
+                superior = self.buckets[indice]
+                return inferior + (superior - inferior) * (alvo - acumulado) / contagem
+            acumulado += contagem
+        return self.buckets[-1]
+
+    def snapshot(self) -> Dict[Tuple[str, ...], Tuple[List[int], float]]:
+        """Cópia das contagens e somas, por combinação de rótulos."""
+        with self._lock:
+            return {key: (list(estado[0]), estado[1]) for key, estado in self._values.items()}
+
+    def samples(self) -> List[str]:
+        linhas = []
+        for key, (contagens, soma) in sorted(self.snapshot().items()):
+            acumulado = 0
+            for limite, contagem in zip(self.buckets + (math.inf,), contagens):
+                acumulado += contagem
+                rotulos = _format_labels(self.label_names, key, f'le="{_format_value(limite)}"')
+                linhas.append(f"{self.name}_bucket{rotulos} {acumulado}")
+            rotulos = _format_labels(self.label_names, key)
+            linhas.append(f"{self.name}_sum{rotulos} {_format_value(soma)}")
+            linhas.append(f"{self.name}_count{rotulos} {acumulado}")
+        return linhas
+
+
+class Registry:
+    """Conjunto de métricas expostas pela aplicação."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: Metric) -> Metric:
+        with self._lock:
+            existente = self._metrics.get(metric.name)
+            if existente is not None:
+                # Recarregamento de módulo: reaproveita a métrica já registrada
+                return existente
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, label_names))
+
+    def histogram(self, name: str, documentation: str, label_names: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Todas as métricas no formato de exposição do Prometheus."""
+        with self._lock:
+            metricas = list(self._metrics.values())
+        return "\n".join(metrica.render() for metrica in metricas) + "\n"
+
+
+REGISTRY = Registry()
@@ -0,0 +1,130 @@
+import logging
+import time
+import uuid
+
+from app.core.logging_config import request_id_var
+from app.core.metrics import REGISTRY, SIZE_BUCKETS
+
+logger = logging.getLogger(__name__)
+
+# Rótulo das requisições que não correspondem a nenhuma rota (evita um rótulo por URL)
+ROTA_DESCONHECIDA = "nao_encontrada"
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total",
+    "Requisições HTTP atendidas, por rota e status",
+    ("method", "route", "status"),
+)
+HTTP_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Tempo até o fim do envio da resposta, por rota",
+    ("method", "route"),
+)
+HTTP_RESPONSE_SIZE = REGISTRY.histogram(
+    "http_response_size_bytes",
+    "Tamanho do corpo das respostas, por rota",
+    ("method", "route"),
+    buckets=SIZE_BUCKETS,
+)
+HTTP_EXCEPTIONS = REGISTRY.counter(
+    "http_request_exceptions_total",
+    "Exceções não tratadas durante as requisições, por rota",
+    ("method", "route"),
+)
+HTTP_IN_PROGRESS = REGISTRY.gauge(
+    "http_requests_in_progress",
+    "Requisições em andamento",
+    ("method",),
+)
+
+
+def route_label(scope) -> str:
+    """Caminho da rota com parâmetros (ex.: /api/v1/eventos/{id}), nunca a URL crua."""
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or getattr(route, "path", None) or ROTA_DESCONHECIDA
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI que mede latência, tamanho da resposta, status e
+    concorrência de cada requisição HTTP.
+
+    É um middleware ASGI puro (não BaseHTTPMiddleware) para não interferir no
+    streaming das respostas: a duração vai até o último bloco enviado.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        inicio = time.perf_counter()
+        estado = {"status": 500, "tamanho": 0}
+
+        async def send_com_metricas(message):
+            if message["type"] == "http.response.start":
+                estado["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                estado["tamanho"] += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_IN_PROGRESS.inc(method=method)
+        try:
+            await self.app(scope, receive, send_com_metricas)
+        except Exception:
+            HTTP_EXCEPTIONS.inc(method=method, route=route_label(scope))
+            raise
+        finally:
+            HTTP_IN_PROGRESS.dec(method=method)
+            rota = route_label(scope)
+            HTTP_REQUESTS.inc(method=method, route=rota, status=str(estado["status"]))
+            HTTP_DURATION.observe(time.perf_counter() - inicio, method=method, route=rota)
+            HTTP_RESPONSE_SIZE.observe(estado["tamanho"], method=method, route=rota)
+
+
+class RequestContextMiddleware:
+    """
+    Middleware ASGI que atribui um ID a cada requisição (ou reaproveita o
+    cabeçalho X-Request-ID recebido), o devolve na resposta e registra uma
+    linha de log com método, rota, status e duração.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        request_id = headers.get(b"x-request-id", b"").decode("latin-1")[:64] or uuid.uuid4().hex
+        token = request_id_var.set(request_id)
+        inicio = time.perf_counter()
+        estado = {"status": 500}
+
+        async def send_com_id(message):
+            if message["type"] == "http.response.start":
+                estado["status"] = message["status"]
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"x-request-id", request_id.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_com_id)
+        finally:
+            duracao_ms = round((time.perf_counter() - inicio) * 1000, 2)
+            logger.info(
+                f"{scope['method']} {scope['path']} {estado['status']} {duracao_ms} ms",
+                extra={
+                    "method": scope["method"],
+                    "route": route_label(scope),
+                    "status": estado["status"],
+                    "duration_ms": duracao_ms,
+                },
+            )
+            request_id_var.reset(token)
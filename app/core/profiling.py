@@ -0,0 +1,188 @@
+"""
+Profiling opcional de requisições (cProfile e, opcionalmente, tracemalloc).
+
+Ativado por PROFILING_ENABLED e, em cada requisição, pelo cabeçalho
+``X-Profile`` ou pelo parâmetro ``_profile`` (valores "cpu" ou "cpu,memory"),
+sempre acompanhados de um ``X-Admin-Token`` válido. Os perfis são gravados em
+PROFILING_DIR, que guarda apenas os PROFILING_MAX_FILES mais recentes.
+"""
+import asyncio
+import cProfile
+import json
+import logging
+import os
+import pstats
+import re
+import time
+import tracemalloc
+import uuid
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs
+
+from app.core.config import settings
+from app.core.middleware import route_label
+from app.core.security import is_admin_token
+
+logger = logging.getLogger(__name__)
+
+_ID_VALIDO = re.compile(r"^[\w.-]+$")
+
+
+def _profile_mode(scope) -> Optional[str]:
+    """Modo pedido na requisição ("cpu" ou "cpu,memory"), ou None."""
+    headers = dict(scope.get("headers") or [])
+    modo = headers.get(b"x-profile", b"").decode("latin-1")
+    if not modo:
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        modo = (query.get("_profile") or [""])[0]
+    if not modo:
+        return None
+    if not is_admin_token(headers.get(b"x-admin-token", b"").decode("latin-1") or None):
+        logger.warning("Pedido de profiling sem token administrativo válido")
+        return None
+    return modo.lower()
+
+
+def _enforce_ring(directory: str, max_files: int):
+    """Remove os perfis mais antigos além de ``max_files``."""
+    perfis = sorted(
+        (os.path.join(directory, nome) for nome in os.listdir(directory) if nome.endswith(".prof")),
+        key=os.path.getmtime,
+    )
+    for caminho in perfis[:-max_files] if max_files > 0 else perfis:
+        for arquivo in (caminho, caminho[:-len(".prof")] + ".mem.json"):
+            try:
+                os.remove(arquivo)
+            except FileNotFoundError:
+                pass
+
+
+def list_profiles() -> List[Dict[str, Any]]:
+    """Perfis gravados, do mais recente para o mais antigo."""
+    directory = settings.PROFILING_DIR
+    if not os.path.isdir(directory):
+        return []
+    perfis = []
+    for nome in os.listdir(directory):
+        if nome.endswith(".prof"):
+            caminho = os.path.join(directory, nome)
+            perfis.append({
+                "id": nome[:-len(".prof")],
+                "criado_em": os.path.getmtime(caminho),
+                "memoria": os.path.exists(caminho[:-len(".prof")] + ".mem.json"),
+            })
+    return sorted(perfis, key=lambda perfil: perfil["criado_em"], reverse=True)
+
+
+def summarize_profile(profile_id: str, limit: int = 30, sort: str = "cumulative") -> Optional[Dict[str, Any]]:
+    """
+    Resume um perfil: as funções com maior tempo (acumulado por padrão).
+
+    Args:
+        profile_id: ID do perfil (nome do arquivo sem extensão)
+        limit: Quantidade de funções
+        sort: "cumulative" (tempo acumulado) ou "tottime" (tempo próprio)
+
+    Returns:
+        dict: Tempo total e funções, ou None se o perfil não existir
+    """
+    if not _ID_VALIDO.match(profile_id):
+        return None
+    caminho = os.path.join(settings.PROFILING_DIR, f"{profile_id}.prof")
+    if not os.path.exists(caminho):
+        return None
+
+    stats = pstats.Stats(caminho)
+    indice = 3 if sort == "cumulative" else 2
+    linhas = sorted(stats.stats.items(), key=lambda item: item[1][indice], reverse=True)[:limit]
+    resumo = {
+        "id": profile_id,
+        "tempo_total_s": round(stats.total_tt, 6),
+        "funcoes": [
+            {
+                "funcao": f"{arquivo}:{linha}({nome})",
+                "chamadas": chamadas_totais,
+                "tempo_proprio_s": round(tempo_proprio, 6),
+                "tempo_acumulado_s": round(tempo_acumulado, 6),
+            }
+            for (arquivo, linha, nome), (_, chamadas_totais, tempo_proprio, tempo_acumulado, _) in linhas
+        ],
+    }
+
+    memoria = caminho[:-len(".prof")] + ".mem.json"
+    if os.path.exists(memoria):
+        with open(memoria, encoding="utf-8") as arquivo:
+            resumo["memoria"] = json.load(arquivo)
+    return resumo
+
+
+class ProfilingMiddleware:
+    """
+    Middleware ASGI que executa a requisição sob o cProfile quando pedido.
+
+    O cProfile mede a thread do event loop inteira: requisições concorrentes
+    aparecem no mesmo perfil e a espera pelo MongoDB surge como tempo no
+    seletor do loop. Por isso só um perfil é coletado por vez.
+    """
+
+    _em_andamento = False
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.PROFILING_ENABLED or ProfilingMiddleware._em_andamento:
+            await self.app(scope, receive, send)
+            return
+
+        modo = _profile_mode(scope)
+        if modo is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Gerado no servidor: o X-Request-ID do cliente não pode compor o caminho do arquivo
+        perfil_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{scope['method']}-{uuid.uuid4().hex}"
+
+        async def send_com_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", perfil_id.encode())]
+            await send(message)
+
+        memoria = "memory" in modo
+        profiler = cProfile.Profile()
+        ProfilingMiddleware._em_andamento = True
+        if memoria:
+            tracemalloc.start()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_com_id)
+        finally:
+            profiler.disable()
+            snapshot = tracemalloc.take_snapshot() if memoria else None
+            if memoria:
+                pico = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            ProfilingMiddleware._em_andamento = False
+
+            try:
+                # Gravação fora do event loop
+                await asyncio.to_thread(self._salvar, perfil_id, profiler, snapshot, pico if memoria else None)
+                logger.info(f"Perfil {perfil_id} gravado para {route_label(scope)}")
+            except Exception as e:
+                logger.error(f"Erro ao gravar perfil {perfil_id}: {e}")
+
+    @staticmethod
+    def _salvar(perfil_id: str, profiler: cProfile.Profile, snapshot, pico: Optional[int]):
+        directory = settings.PROFILING_DIR
+        os.makedirs(directory, exist_ok=True)
+        profiler.dump_stats(os.path.join(directory, f"{perfil_id}.prof"))
+
+        if snapshot is not None:
+            alocacoes = [
+                {"local": str(stat.traceback), "tamanho_kb": round(stat.size / 1024, 1), "blocos": stat.count}
+                for stat in snapshot.statistics("lineno")[:30]
+            ]
+            with open(os.path.join(directory, f"{perfil_id}.mem.json"), "w", encoding="utf-8") as arquivo:
+                json.dump({"pico_kb": round(pico / 1024, 1), "alocacoes": alocacoes}, arquivo, ensure_ascii=False)
+
+        _enforce_ring(directory, settings.PROFILING_MAX_FILES)
@@ -0,0 +1,35 @@
+import logging
+import secrets
+from typing import Optional
+
+from fastapi import Header, HTTPException, status
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """Verifica o token administrativo (sempre falso sem API_ADMIN_TOKEN configurado)."""
+    if not settings.API_ADMIN_TOKEN or not token:
+        return False
+    return secrets.compare_digest(token, settings.API_ADMIN_TOKEN)
+
+
+async def require_admin_token(x_admin_token: Optional[str] = Header(None)):
+    """
+    Dependência das rotas de escrita: exige o cabeçalho ``X-Admin-Token``.
+
+    Sem ``API_ADMIN_TOKEN`` configurado, as rotas de escrita ficam desativadas.
+
+    Raises:
+        HTTPException: 503 se a escrita estiver desativada, 401 se o token for inválido
+    """
+    if not settings.API_ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Escrita desativada: API_ADMIN_TOKEN não configurado"
+        )
+    if not is_admin_token(x_admin_token):
+        logger.warning("Tentativa de escrita com token inválido")
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token inválido")
@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+
+
+class ContagemEstatistica(BaseModel):
+    """Quantidade de eventos para um valor (estado, cidade, mês, faixa...)."""
+    valor: Optional[str] = None
+    estado: Optional[str] = None  # Apenas nas contagens por cidade
+    total: int
+
+
+class EstatisticasEventos(BaseModel):
+    """Estatísticas materializadas dos eventos."""
+    total: int = 0
+    por_estado: List[ContagemEstatistica] = []
+    por_cidade: List[ContagemEstatistica] = []
+    por_mes: List[ContagemEstatistica] = []
+    por_faixa_distancia: List[ContagemEstatistica] = []
+    por_site_coleta: List[ContagemEstatistica] = []
+    atualizado_em: Optional[datetime] = None
+
+
+class FacetasEventos(BaseModel):
+    """Valores e quantidades para os filtros da listagem de eventos."""
+    total: int = 0
+    estado: List[ContagemEstatistica] = []
+    cidade: List[ContagemEstatistica] = []
+    organizador: List[ContagemEstatistica] = []
+    faixa_distancia: List[ContagemEstatistica] = []
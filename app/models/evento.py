@@ -61,6 +61,14 @@ class EventoUpdate(BaseModel):
     data_coleta: Optional[datetime] = None
     categorias_premiadas: Optional[str] = None
 
+class EventoUpdateLote(EventoUpdate):
+    """Atualização de um evento dentro de um lote."""
+    id: str
+
+class ExclusaoLote(BaseModel):
+    """IDs dos eventos a excluir em lote."""
+    ids: List[str]
+
 class EventoResponse(EventoBase):
     """Modelo para resposta de eventos."""
     id: str = Field(alias="_id")
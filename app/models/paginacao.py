@@ -0,0 +1,18 @@
+from enum import IntEnum
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class Ordem(IntEnum):
+    """Direção da ordenação, como no MongoDB."""
+    CRESCENTE = 1
+    DECRESCENTE = -1
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """Página obtida por paginação baseada em cursor (keyset)."""
+    items: List[T]
+    size: int
+    next_cursor: Optional[str] = None
@@ -0,0 +1,102 @@
+"""
+Preenche campos derivados em eventos já existentes no banco.
+
+Uso:
+    python -m app.services.backfill busca datas distancias ativo
+"""
+import argparse
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Tuple
+
+from pymongo import UpdateOne
+
+from app.core.cache import Cache
+from app.core.database import Database
+from app.utils.date_utils import build_date_fields
+from app.utils.distance_utils import build_distance_fields
+from app.utils.search_utils import build_search_fields
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAME = "eventos"
+BATCH_SIZE = 500
+
+# Cada tarefa: campos lidos do documento e função que calcula os campos derivados
+TAREFAS: Dict[str, Tuple[Dict[str, int], Callable[[Dict[str, Any]], Dict[str, Any]]]] = {
+    "busca": (
+        {"nome_evento": 1},
+        lambda doc: build_search_fields(doc.get("nome_evento") or ""),
+    ),
+    "datas": (
+        {"datas_realizacao": 1},
+        lambda doc: build_date_fields(doc.get("datas_realizacao")),
+    ),
+    "distancias": (
+        {"distancias": 1},
+        lambda doc: build_distance_fields(doc.get("distancias")),
+    ),
+    # Eventos gravados antes de ``ativo`` ficariam fora das listagens
+    "ativo": (
+        {"removido": 1},
+        lambda doc: {"ativo": not doc.get("removido", False)},
+    ),
+}
+
+
+async def executar_backfill(tarefa: str, batch_size: int = BATCH_SIZE) -> int:
+    """
+    Recalcula os campos de uma tarefa em todos os eventos.
+
+    Args:
+        tarefa: Nome da tarefa em ``TAREFAS``
+        batch_size: Quantidade de atualizações por bulk_write
+
+    Returns:
+        int: Quantidade de eventos modificados
+    """
+    projection, derivar = TAREFAS[tarefa]
+    collection = await Database.get_collection(COLLECTION_NAME)
+
+    modificados = 0
+    operations = []
+    agora = datetime.now()
+    async for doc in collection.find({}, projection, batch_size=batch_size):
+        campos = derivar(doc)
+        # Só documentos com algum campo diferente são gravados, com atualizado_em:
+        # a API percebe a alteração (ETag e cache) mesmo sem a invalidação deste processo
+        operations.append(UpdateOne(
+            {"_id": doc["_id"], "$nor": [campos]},
+            {"$set": {**campos, "atualizado_em": agora}}
+        ))
+        if len(operations) >= batch_size:
+            result = await collection.bulk_write(operations, ordered=False)
+            modificados += result.modified_count
+            operations = []
+
+    if operations:
+        result = await collection.bulk_write(operations, ordered=False)
+        modificados += result.modified_count
+
+    if modificados:
+        await Cache.invalidate(COLLECTION_NAME)
+    logger.info(f"Backfill '{tarefa}': {modificados} eventos atualizados")
+    return modificados
+
+
+async def _main(tarefas) -> None:
+    try:
+        for tarefa in tarefas:
+            modificados = await executar_backfill(tarefa)
+            print(f"{tarefa}: {modificados} eventos atualizados")
+    finally:
+        await Database.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Preenche campos derivados dos eventos")
+    parser.add_argument("tarefas", nargs="+", choices=sorted(TAREFAS), help="Tarefas a executar")
+    args = parser.parse_args()
+
+    asyncio.run(_main(args.tarefas))
@@ -0,0 +1,144 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.database import Database
+from app.utils.aggregation_utils import city_count_stages, count_stages
+from app.utils.distance_utils import distance_bands_expression
+from app.utils.json_utils import convert_to_json
+from app.utils.pagination_utils import ACTIVE_FILTER
+
+logger = logging.getLogger(__name__)
+
+
+class EstatisticasService:
+    """
+    Estatísticas dos eventos, materializadas em um único documento.
+
+    Uma agregação ``$facet`` percorre a coleção de eventos e grava o resultado
+    com ``$merge``; a leitura do endpoint busca só esse documento.
+    """
+
+    collection_name = "estatisticas"
+    origem = "eventos"
+    documento_id = "eventos"
+
+    # Atualização agendada após escritas (uma por rajada de escritas)
+    _tarefa: Optional[asyncio.Task] = None
+    _pendente: bool = False
+    _lock = asyncio.Lock()
+
+    @classmethod
+    def pipeline(cls) -> List[Dict[str, Any]]:
+        """
+        Agregação que calcula e materializa as estatísticas.
+
+        Returns:
+            list: Pipeline terminado em ``$merge`` na coleção de estatísticas
+        """
+        return [
+            # Eventos marcados como removidos pela sincronização não entram nas estatísticas
+            {"$match": ACTIVE_FILTER},
+            {"$facet": {
+                "total": [{"$count": "total"}],
+                "por_estado": count_stages("$estado"),
+                "por_cidade": city_count_stages(),
+                # Mês da primeira data de realização
+                "por_mes": [
+                    {"$match": {"primeira_data": {"$type": "date"}}},
+                    {"$group": {
+                        "_id": {"$dateToString": {"format": "%Y-%m", "date": "$primeira_data"}},
+                        "total": {"$sum": 1},
+                    }},
+                    {"$sort": {"_id": 1}},
+                    {"$project": {"_id": 0, "valor": "$_id", "total": 1}},
+                ],
+                "por_faixa_distancia": [
+                    {"$project": {"faixa": distance_bands_expression()}},
+                    {"$unwind": "$faixa"},
+                    *count_stages("$faixa"),
+                ],
+                "por_site_coleta": count_stages("$site_coleta"),
+            }},
+            {"$set": {
+                "_id": cls.documento_id,
+                "total": {"$ifNull": [{"$arrayElemAt": ["$total.total", 0]}, 0]},
+                "atualizado_em": "$$NOW",
+            }},
+            {"$merge": {
+                "into": cls.collection_name,
+                "on": "_id",
+                "whenMatched": "replace",
+                "whenNotMatched": "insert",
+            }},
+        ]
+
+    @classmethod
+    async def atualizar(cls):
+        """Recalcula as estatísticas e regrava o documento materializado."""
+        async with cls._lock:
+            try:
+                collection = await Database.get_collection(cls.origem)
+                await collection.aggregate(cls.pipeline(), allowDiskUse=True).to_list(length=None)
+                logger.info("Estatísticas de eventos atualizadas")
+            except Exception as e:
+                logger.error(f"Erro ao atualizar estatísticas: {e}")
+                raise
+
+    @classmethod
+    def agendar_atualizacao(cls):
+        """
+        Agenda a atualização após ESTATISTICAS_ATRASO segundos.
+
+        Escritas próximas (ex.: os lotes de uma importação) resultam em uma
+        única agregação; escritas durante a agregação agendam mais uma rodada.
+        """
+        cls._pendente = True
+        if cls._tarefa is None or cls._tarefa.done():
+            cls._tarefa = asyncio.create_task(cls._atualizar_pendentes())
+
+    @classmethod
+    async def _atualizar_pendentes(cls):
+        while cls._pendente:
+            await asyncio.sleep(settings.ESTATISTICAS_ATRASO)
+            cls._pendente = False
+            try:
+                await cls.atualizar()
+            except Exception:
+                # Já registrado; a próxima escrita ou leitura tenta novamente
+                pass
+
+    @classmethod
+    async def obter(cls) -> Dict[str, Any]:
+        """
+        Obtém as estatísticas materializadas.
+
+        Calcula na hora se o documento ainda não existir; se estiver mais
+        antigo que ESTATISTICAS_IDADE_MAXIMA (ex.: escritas feitas fora da API),
+        devolve o atual e agenda a atualização.
+
+        Returns:
+            dict: Totais por estado, cidade, mês, faixa de distância e site de coleta
+        """
+        try:
+            collection = await Database.get_collection(cls.collection_name)
+            estatisticas = await collection.find_one({"_id": cls.documento_id})
+
+            if estatisticas is None:
+                await cls.atualizar()
+                estatisticas = await collection.find_one({"_id": cls.documento_id}) or {}
+            else:
+                atualizado_em = estatisticas.get("atualizado_em")
+                idade_maxima = timedelta(seconds=settings.ESTATISTICAS_IDADE_MAXIMA)
+                # $$NOW é gravado em UTC e lido sem fuso horário
+                agora = datetime.now(timezone.utc).replace(tzinfo=None)
+                if atualizado_em is None or agora - atualizado_em > idade_maxima:
+                    cls.agendar_atualizacao()
+
+            estatisticas.pop("_id", None)
+            return convert_to_json(estatisticas)
+        except Exception as e:
+            logger.error(f"Erro ao obter estatísticas: {e}")
+            raise
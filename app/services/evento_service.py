@@ -1,26 +1,133 @@
-import errno
 import logging
 import re
 from datetime import datetime
 from fastapi_pagination.ext.motor import paginate
 from fastapi_pagination import Params
-from pymongo import UpdateOne, InsertOne
+from pymongo import DeleteMany, InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 from bson import ObjectId
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple, Union
+from app.core.cache import Cache
+from app.core.config import settings
 from app.core.database import Database
+from app.services.estatisticas_service import EstatisticasService
+from app.utils.aggregation_utils import city_count_stages, count_stages
+from app.utils.date_utils import build_date_fields
+from app.utils.distance_utils import build_distance_fields, distance_bands_expression
 from app.utils.json_utils import convert_to_json
 from app.models.evento import EventoCreate, EventoUpdate, EventoResponse
-from app.utils.pagination_utils import paginate_with_objectid_conversion
+from app.utils.pagination_utils import (
+    ACTIVE_FILTER, paginate_with_objectid_conversion, paginate_with_cursor, trusted_items
+)
+from app.utils.projection_utils import build_projection, list_fields, partial_model
+from app.utils.search_utils import build_search_fields, relevance_expression
 
 logger = logging.getLogger(__name__)
 
+# Campos expostos pela API; na leitura confiável só eles são buscados
+CAMPOS_RESPOSTA = tuple(list_fields(EventoResponse))
+
+
+def _bson_datetime(valor: datetime) -> datetime:
+    """Trunca a data para a precisão do BSON (milissegundos)."""
+    return valor.replace(microsecond=valor.microsecond // 1000 * 1000)
+
+
 class EventoService:
     """Serviço para operações relacionadas a eventos."""
 
     collection_name = "eventos"
 
+    # Momento da última escrita feita por este processo (inclui exclusões)
+    _ultima_escrita: Optional[datetime] = None
+
+    @classmethod
+    async def _registrar_escrita(cls):
+        """
+        Invalida o cache, avança a geração de escrita da coleção e agenda a
+        atualização das estatísticas materializadas.
+        """
+        cls._ultima_escrita = datetime.now()
+        await Cache.invalidate(cls.collection_name)
+        EstatisticasService.agendar_atualizacao()
+
+    @classmethod
+    async def obter_estado_colecao(cls) -> Dict[str, Any]:
+        """
+        Obtém o estado da coleção usado para validar requisições condicionais:
+        geração de escrita, total estimado e última modificação.
+
+        O estado é mantido em cache por ETAG_STATE_TTL segundos, e a chave
+        muda a cada escrita feita pela API.
+
+        Returns:
+            dict: {"geracao", "total", "modificado_em"}
+        """
+        try:
+            collection = await Database.get_collection(cls.collection_name)
+            geracao = await Cache.get_generation(cls.collection_name)
+
+            async def carregar():
+                # Usa o índice parcial de atualizado_em
+                ultimo = await collection.find_one(
+                    {"atualizado_em": {"$exists": True}},
+                    {"atualizado_em": 1, "_id": 0},
+                    sort=[("atualizado_em", -1)]
+                )
+                modificado_em = ultimo["atualizado_em"] if ultimo else None
+                if cls._ultima_escrita and (modificado_em is None or cls._ultima_escrita > modificado_em):
+                    modificado_em = cls._ultima_escrita
+                return {
+                    "geracao": geracao,
+                    "total": await collection.estimated_document_count(),
+                    "modificado_em": modificado_em,
+                }
+
+            return await Cache.get_or_set(
+                cls.collection_name,
+                ("estado_colecao",),
+                carregar,
+                expire=settings.ETAG_STATE_TTL
+            )
+        except Exception as e:
+            logger.error(f"Erro ao obter estado da coleção: {e}")
+            raise
+
     @classmethod
-    async def listar_eventos(cls, filtro: Dict[str, Any], order: Dict[str, int], params: Params):
+    async def _versao_colecao(cls) -> Tuple[Any, Any]:
+        """
+        Total e última modificação da coleção, usados nas chaves de cache das
+        leituras: escritas de outros processos (sincronização com o Atlas,
+        backfill) não avançam a geração deste processo, mas mudam o estado
+        e, com ele, o ETag. Assim o corpo em cache acompanha o ETag.
+        """
+        estado = await cls.obter_estado_colecao()
+        return estado["total"], estado["modificado_em"]
+
+    @staticmethod
+    def _modelo_resposta(campos: Optional[Tuple[str, ...]]):
+        """Modelo de resposta compatível com a projeção solicitada."""
+        return partial_model(EventoResponse, campos) if campos else EventoResponse
+
+    @staticmethod
+    def _projecao(campos: Optional[Tuple[str, ...]]) -> Optional[Dict[str, int]]:
+        """Projeção de leitura: os campos pedidos ou, na leitura confiável, os do modelo."""
+        if campos:
+            return build_projection(campos)
+        if settings.TRUSTED_READS:
+            return build_projection(CAMPOS_RESPOSTA)
+        return None
+
+    @classmethod
+    async def listar_eventos(
+            cls,
+            filtro: Dict[str, Any],
+            order: Dict[str, int],
+            params: Params,
+            total: str = "exato",
+            busca: Optional[str] = None,
+            campos: Optional[Tuple[str, ...]] = None
+    ):
         """
         Lista eventos com filtros, ordenação e paginação.
 
@@ -28,6 +135,9 @@ class EventoService:
             filtro (dict): Filtros para a consulta
             order (dict): Ordenação para a consulta
             params (Params): Parâmetros de paginação
+            total (str): Modo de contagem do total ("exato", "estimado" ou "nenhum")
+            busca (str, optional): Texto buscado no nome; ordena os eventos por relevância
+            campos (tuple, optional): Campos a retornar (projeção); None retorna todos
 
         Returns:
             Page: Página de eventos
@@ -35,26 +145,94 @@ class EventoService:
         try:
             collection = await Database.get_collection(cls.collection_name)
 
-            # Usar a função personalizada
-            return await paginate_with_objectid_conversion(
-                collection,
-                query_filter=filtro,
-                sort=order,
-                params=params,
-                model_class=EventoResponse
+            async def carregar():
+                # Usar a função personalizada
+                return await paginate_with_objectid_conversion(
+                    collection,
+                    query_filter=filtro,
+                    sort=order,
+                    params=params,
+                    model_class=cls._modelo_resposta(campos),
+                    engine=settings.PAGINATION_ENGINE,
+                    total_mode=total,
+                    score=relevance_expression(busca) if busca else None,
+                    projection=cls._projecao(campos),
+                    validate=not settings.TRUSTED_READS
+                )
+
+            return await Cache.get_or_set(
+                cls.collection_name,
+                ("listar_eventos", await cls._versao_colecao(), filtro, order, params.page, params.size, total, busca,
+                 campos),
+                carregar
             )
         except Exception as e:
             logger.error(f"Erro ao listar eventos: {e}")
             raise
 
     @classmethod
-    async def listar_eventos_sem_paginacao(cls, limit: int = 100, filtro: Dict[str, Any] = None):
+    async def listar_eventos_cursor(
+            cls,
+            filtro: Dict[str, Any],
+            ordenar_por: str,
+            ordem: int,
+            size: int,
+            cursor: Optional[str] = None,
+            campos: Optional[Tuple[str, ...]] = None
+    ):
+        """
+        Lista eventos com paginação por cursor (keyset).
+
+        Args:
+            filtro (dict): Filtros para a consulta
+            ordenar_por (str): Campo de ordenação
+            ordem (int): 1 para crescente, -1 para decrescente
+            size (int): Quantidade de eventos por página
+            cursor (str, optional): Token da página anterior
+            campos (tuple, optional): Campos a retornar (projeção); None retorna todos
+
+        Returns:
+            CursorPage: Página de eventos com o token da próxima página
+        """
+        try:
+            collection = await Database.get_collection(cls.collection_name)
+
+            async def carregar():
+                return await paginate_with_cursor(
+                    collection,
+                    query_filter=filtro,
+                    sort_field=ordenar_por,
+                    direction=ordem,
+                    size=size,
+                    model_class=cls._modelo_resposta(campos),
+                    cursor=cursor,
+                    projection=cls._projecao(campos),
+                    validate=not settings.TRUSTED_READS
+                )
+
+            return await Cache.get_or_set(
+                cls.collection_name,
+                ("listar_eventos_cursor", await cls._versao_colecao(), filtro, ordenar_por, ordem, size, cursor, campos),
+                carregar
+            )
+        except Exception as e:
+            logger.error(f"Erro ao listar eventos por cursor: {e}")
+            raise
+
+    @classmethod
+    async def listar_eventos_sem_paginacao(
+            cls,
+            limit: int = 100,
+            filtro: Dict[str, Any] = None,
+            campos: Optional[Tuple[str, ...]] = None
+    ):
         """
         Lista eventos sem paginação.
 
         Args:
             limit (int): Limite de eventos a retornar
             filtro (dict, optional): Filtros para a consulta
+            campos (tuple, optional): Campos a retornar (projeção); None retorna todos
 
         Returns:
             list: Lista de eventos
@@ -63,10 +241,11 @@ class EventoService:
             collection = await Database.get_collection(cls.collection_name)
 
             # Criar um cursor para a coleção de eventos
-            cursor = collection.find(filtro or {})
+            projecao = cls._projecao(campos)
+            cursor = collection.find(filtro or {}, projecao)
 
-            # Ordenar por data de realização (decrescente)
-            cursor = cursor.sort("datas_realizacao", -1)
+            # Ordenar por data de realização (decrescente, pela última data)
+            cursor = cursor.sort("ultima_data", -1)
 
             # Aplicar limite
             cursor = cursor.limit(limit)
@@ -74,12 +253,90 @@ class EventoService:
             # Converter cursor para lista
             eventos = await cursor.to_list(length=None)
 
+            # Documentos do próprio banco: serializados diretamente pela resposta
+            if settings.TRUSTED_READS:
+                return trusted_items(eventos, projecao)
+
             # Converter para JSON
             return convert_to_json(eventos)
         except Exception as e:
             logger.error(f"Erro ao listar eventos sem paginação: {e}")
             raise
 
+    @classmethod
+    async def listar_facetas(cls, filtro: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Valores distintos e quantidades de estado, cidade, organizador e faixa
+        de distância entre os eventos filtrados, em uma única agregação.
+
+        Args:
+            filtro (dict): Filtros para a consulta (os mesmos da listagem)
+
+        Returns:
+            dict: Total filtrado e contagens por estado, cidade, organizador e faixa
+        """
+        try:
+            collection = await Database.get_collection(cls.collection_name)
+
+            async def carregar():
+                pipeline = [
+                    {"$match": filtro},
+                    {"$facet": {
+                        "total": [{"$count": "total"}],
+                        "estado": count_stages("$estado"),
+                        "cidade": city_count_stages(),
+                        "organizador": count_stages("$organizador"),
+                        "faixa_distancia": [
+                            {"$project": {"faixa": distance_bands_expression()}},
+                            {"$unwind": "$faixa"},
+                            *count_stages("$faixa"),
+                        ],
+                    }},
+                    {"$set": {"total": {"$ifNull": [{"$arrayElemAt": ["$total.total", 0]}, 0]}}},
+                ]
+                resultado = await collection.aggregate(pipeline, allowDiskUse=True).to_list(length=None)
+                return resultado[0]
+
+            return await Cache.get_or_set(
+                cls.collection_name, ("listar_facetas", await cls._versao_colecao(), filtro), carregar
+            )
+        except Exception as e:
+            logger.error(f"Erro ao listar facetas: {e}")
+            raise
+
+    @classmethod
+    async def exportar_eventos(
+            cls,
+            filtro: Dict[str, Any],
+            order: Dict[str, int],
+            campos: Optional[Tuple[str, ...]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Percorre os eventos com um cursor do servidor, sem carregar o resultado
+        inteiro em memória.
+
+        Args:
+            filtro (dict): Filtros para a consulta
+            order (dict): Ordenação para a consulta
+            campos (tuple, optional): Campos a exportar; None exporta os do modelo
+
+        Yields:
+            dict: Evento, com os campos projetados
+        """
+        collection = await Database.get_collection(cls.collection_name)
+        projecao = build_projection(campos or CAMPOS_RESPOSTA)
+
+        cursor = collection.find(filtro, projecao, batch_size=settings.EXPORT_BATCH_SIZE)
+        cursor = cursor.sort(list(order.items()))
+        try:
+            async for evento in cursor:
+                yield evento
+        except Exception as e:
+            logger.error(f"Erro ao exportar eventos: {e}")
+            raise
+        finally:
+            await cursor.close()
+
     @classmethod
     async def obter_evento(cls, evento_id: str):
         """
@@ -103,6 +360,79 @@ class EventoService:
             logger.error(f"Erro ao obter evento {evento_id}: {e}")
             raise
 
+    @staticmethod
+    def _documento_novo(evento: EventoCreate, now: datetime) -> Dict[str, Any]:
+        """Monta o documento de um evento criado pela API, já com o _id."""
+        evento_dict = evento.model_dump()
+        evento_dict["_id"] = ObjectId()
+        evento_dict["importado_em"] = now
+        evento_dict["atualizado_em"] = now
+        evento_dict["origem"] = "api"
+        evento_dict["ativo"] = True
+        evento_dict.update(build_search_fields(evento_dict["nome_evento"]))
+        evento_dict.update(build_date_fields(evento_dict["datas_realizacao"]))
+        evento_dict.update(build_distance_fields(evento_dict["distancias"]))
+
+        # O BSON guarda datas em milissegundos: assim a resposta montada
+        # localmente é idêntica ao documento gravado
+        for campo, valor in evento_dict.items():
+            if isinstance(valor, datetime):
+                evento_dict[campo] = _bson_datetime(valor)
+            elif isinstance(valor, list):
+                evento_dict[campo] = [_bson_datetime(v) if isinstance(v, datetime) else v for v in valor]
+        return evento_dict
+
+    @staticmethod
+    def _alteracoes(evento: EventoUpdate, now: datetime) -> Dict[str, Any]:
+        """Campos informados de uma atualização, com timestamp e campos derivados."""
+        evento_dict = evento.model_dump(exclude_none=True)
+        evento_dict["atualizado_em"] = now
+
+        # Manter os termos de busca coerentes com o nome
+        if "nome_evento" in evento_dict:
+            evento_dict.update(build_search_fields(evento_dict["nome_evento"]))
+        if "datas_realizacao" in evento_dict:
+            evento_dict.update(build_date_fields(evento_dict["datas_realizacao"]))
+        if "distancias" in evento_dict:
+            evento_dict.update(build_distance_fields(evento_dict["distancias"]))
+        return evento_dict
+
+    @staticmethod
+    async def _bulk_write(collection, operations: List[Any], indices: Optional[List[int]] = None) -> Dict[str, Any]:
+        """
+        Executa as operações em um único bulk_write não ordenado: uma falha não
+        impede as demais.
+
+        Args:
+            collection: Coleção de destino
+            operations (list): Operações do pymongo (InsertOne, UpdateOne...)
+            indices (list, optional): Posição de cada operação na entrada original,
+                usada nos erros reportados
+
+        Returns:
+            dict: Contagens do MongoDB e erros de escrita
+        """
+        detalhes: Dict[str, Any] = {}
+        try:
+            if operations:
+                result = await collection.bulk_write(operations, ordered=False)
+                detalhes = result.bulk_api_result
+        except BulkWriteError as e:
+            detalhes = e.details
+
+        erros = detalhes.get("writeErrors", [])
+        return {
+            "inserted": detalhes.get("nInserted", 0) + detalhes.get("nUpserted", 0),
+            "matched": detalhes.get("nMatched", 0),
+            "updated": detalhes.get("nModified", 0),
+            "deleted": detalhes.get("nRemoved", 0),
+            "failed": len(erros),
+            "erros": [
+                {"indice": indices[erro["index"]] if indices else erro["index"], "erro": erro.get("errmsg")}
+                for erro in erros
+            ],
+        }
+
     @classmethod
     async def criar_evento(cls, evento: EventoCreate):
         """
@@ -116,24 +446,13 @@ class EventoService:
         """
         try:
             collection = await Database.get_collection(cls.collection_name)
+            evento_dict = cls._documento_novo(evento, datetime.now())
 
-            # Converter modelo para dicionário
-            evento_dict = evento.dict()
+            # O documento gravado é a própria resposta: não é preciso relê-lo
+            await collection.insert_one(evento_dict)
+            await cls._registrar_escrita()
 
-            # Adicionar timestamps
-            now = datetime.now()
-            evento_dict["importado_em"] = now
-            evento_dict["atualizado_em"] = now
-            evento_dict["origem"] = "api"
-
-            # Inserir evento
-            result = await collection.insert_one(evento_dict)
-
-            # Buscar evento inserido
-            novo_evento = await collection.find_one({"_id": result.inserted_id})
-
-            # Converter para JSON
-            return convert_to_json(novo_evento)
+            return convert_to_json(evento_dict)
         except Exception as e:
             logger.error(f"Erro ao criar evento: {e}")
             raise
@@ -141,7 +460,7 @@ class EventoService:
     @classmethod
     async def atualizar_evento(cls, evento_id: str, evento: EventoUpdate):
         """
-        Atualiza um evento existente.
+        Atualiza um evento existente, em uma única ida ao banco.
 
         Args:
             evento_id (str): ID do evento a ser atualizado
@@ -151,30 +470,21 @@ class EventoService:
             dict: Evento atualizado ou None se não encontrado
         """
         try:
-            collection = await Database.get_collection(cls.collection_name)
-
-            # Converter modelo para dicionário, removendo campos None
-            evento_dict = {k: v for k, v in evento.dict().items() if v is not None}
+            if not ObjectId.is_valid(evento_id):
+                return None
 
-            # Adicionar timestamp de atualização
-            evento_dict["atualizado_em"] = datetime.now()
+            collection = await Database.get_collection(cls.collection_name)
 
-            # Atualizar evento
-            result = await collection.update_one(
+            evento_atualizado = await collection.find_one_and_update(
                 {"_id": ObjectId(evento_id)},
-                {"$set": evento_dict}
+                {"$set": cls._alteracoes(evento, datetime.now())},
+                return_document=ReturnDocument.AFTER
             )
 
-            if result.modified_count == 0:
-                # Verificar se o evento existe
-                evento_existe = await collection.find_one({"_id": ObjectId(evento_id)})
-                if not evento_existe:
-                    return None
-
-            # Buscar evento atualizado
-            evento_atualizado = await collection.find_one({"_id": ObjectId(evento_id)})
+            if evento_atualizado is None:
+                return None
 
-            # Converter para JSON
+            await cls._registrar_escrita()
             return convert_to_json(evento_atualizado)
         except Exception as e:
             logger.error(f"Erro ao atualizar evento {evento_id}: {e}")
@@ -192,101 +502,239 @@ class EventoService:
             bool: True se excluído com sucesso, False se não encontrado
         """
         try:
+            if not ObjectId.is_valid(evento_id):
+                return False
+
             collection = await Database.get_collection(cls.collection_name)
 
             # Excluir evento
             result = await collection.delete_one({"_id": ObjectId(evento_id)})
 
+            if result.deleted_count > 0:
+                await cls._registrar_escrita()
+
             return result.deleted_count > 0
         except Exception as e:
             logger.error(f"Erro ao excluir evento {evento_id}: {e}")
             raise
 
+    @classmethod
+    async def criar_eventos_lote(cls, eventos: List[EventoCreate]) -> Dict[str, Any]:
+        """
+        Cria vários eventos com um único bulk_write.
+
+        Args:
+            eventos (List[EventoCreate]): Eventos a criar
+
+        Returns:
+            dict: Contagens, erros por posição e os IDs na ordem da entrada
+        """
+        try:
+            collection = await Database.get_collection(cls.collection_name)
+            now = datetime.now()
+            documentos = [cls._documento_novo(evento, now) for evento in eventos]
+
+            resultado = await cls._bulk_write(collection, [InsertOne(doc) for doc in documentos])
+            if resultado["inserted"]:
+                await cls._registrar_escrita()
+
+            falhas = {erro["indice"] for erro in resultado["erros"]}
+            resultado["ids"] = [
+                None if indice in falhas else str(doc["_id"])
+                for indice, doc in enumerate(documentos)
+            ]
+            return resultado
+        except Exception as e:
+            logger.error(f"Erro ao criar eventos em lote: {e}")
+            raise
+
+    @classmethod
+    async def atualizar_eventos_lote(cls, alteracoes: List[Tuple[str, EventoUpdate]]) -> Dict[str, Any]:
+        """
+        Atualiza vários eventos com um único bulk_write.
+
+        Args:
+            alteracoes (list): Pares (ID do evento, dados a atualizar)
+
+        Returns:
+            dict: Contagens (encontrados, modificados, com falha) e erros por posição
+        """
+        try:
+            collection = await Database.get_collection(cls.collection_name)
+            now = datetime.now()
+
+            operations, indices, invalidos = [], [], []
+            for indice, (evento_id, evento) in enumerate(alteracoes):
+                if not ObjectId.is_valid(evento_id):
+                    invalidos.append({"indice": indice, "erro": f"ID inválido: {evento_id}"})
+                    continue
+                operations.append(UpdateOne({"_id": ObjectId(evento_id)}, {"$set": cls._alteracoes(evento, now)}))
+                indices.append(indice)
+
+            resultado = await cls._bulk_write(collection, operations, indices)
+            resultado["failed"] += len(invalidos)
+            resultado["erros"] = invalidos + resultado["erros"]
+            if resultado["updated"]:
+                await cls._registrar_escrita()
+            return resultado
+        except Exception as e:
+            logger.error(f"Erro ao atualizar eventos em lote: {e}")
+            raise
+
+    @classmethod
+    async def excluir_eventos_lote(cls, evento_ids: List[str]) -> Dict[str, Any]:
+        """
+        Exclui vários eventos com um único comando.
+
+        Args:
+            evento_ids (List[str]): IDs dos eventos
+
+        Returns:
+            dict: Quantidade excluída e IDs inválidos
+        """
+        try:
+            collection = await Database.get_collection(cls.collection_name)
+            validos = [ObjectId(evento_id) for evento_id in evento_ids if ObjectId.is_valid(evento_id)]
+            invalidos = [evento_id for evento_id in evento_ids if not ObjectId.is_valid(evento_id)]
+
+            operations = [DeleteMany({"_id": {"$in": validos}})] if validos else []
+
+            resultado = await cls._bulk_write(collection, operations)
+            resultado["invalidos"] = invalidos
+            if resultado["deleted"]:
+                await cls._registrar_escrita()
+            return resultado
+        except Exception as e:
+            logger.error(f"Erro ao excluir eventos em lote: {e}")
+            raise
+
     @classmethod
     async def importar_eventos(cls, eventos: List[Dict[str, Any]]):
         """
-        Importa múltiplos eventos (upsert).
+        Importa múltiplos eventos (upsert) em um único bulk_write.
+
+        Cada evento é validado com EventoCreate; os inválidos e os que falharem
+        no banco são contados em ``failed`` sem interromper os demais.
 
         Args:
             eventos (List[Dict]): Lista de eventos a serem importados
 
         Returns:
-            dict: Resultado da operação
+            dict: Contagens de inseridos, atualizados e com falha, e os erros
         """
-        try:
-            if not eventos:
-                return {"inserted": 0, "updated": 0, "total": 0}
+        resultado = {"inserted": 0, "updated": 0, "failed": 0, "total": len(eventos), "erros": []}
+        if not eventos:
+            return resultado
 
+        try:
             collection = await Database.get_collection(cls.collection_name)
 
+            # Um único timestamp para todo o lote
+            now = datetime.now()
+
             # Preparar operações em lote (bulk)
-            operations = []
-            for evento in eventos:
-                # Adicionar timestamp de atualização
-                evento["atualizado_em"] = datetime.now()
+            operations, indices = [], []
+            for indice, evento in enumerate(eventos):
+                try:
+                    evento = EventoCreate.model_validate(evento).model_dump()
+                except ValueError as e:
+                    resultado["failed"] += 1
+                    resultado["erros"].append({"indice": indice, "erro": str(e)})
+                    continue
+
+                evento["atualizado_em"] = now
+                evento.update(build_search_fields(evento["nome_evento"]))
+                evento.update(build_date_fields(evento["datas_realizacao"]))
+                evento.update(build_distance_fields(evento["distancias"]))
 
                 # Usar nome e data como chave única
                 filter_query = {
-                    "nome": evento["nome"]
+                    "nome_evento": evento["nome_evento"]
                 }
 
-                if "datas_realizacao" in evento and evento["datas_realizacao"]:
+                if evento.get("datas_realizacao"):
                     filter_query["datas_realizacao"] = evento["datas_realizacao"]
 
                 # Operação upsert (inserir se não existir, atualizar se existir)
                 operations.append(
                     UpdateOne(
                         filter_query,
-                        {"$set": evento},
+                        {"$set": evento, "$setOnInsert": {"importado_em": now, "origem": "importacao", "ativo": True}},
                         upsert=True
                     )
                 )
+                indices.append(indice)
 
-            # Executar operações em lote
-            if operations:
-                result = await collection.bulk_write(operations)
-                return {
-                    "inserted": result.upserted_count,
-                    "updated": result.modified_count,
-                    "total": len(operations)
-                }
-            return {"inserted": 0, "updated": 0, "total": 0}
+            if not operations:
+                return resultado
+
+            # Não ordenado: uma falha não impede as demais operações do lote
+            gravacao = await cls._bulk_write(collection, operations, indices)
+            resultado["inserted"] = gravacao["inserted"]
+            resultado["updated"] = gravacao["updated"]
+            resultado["failed"] += gravacao["failed"]
+            resultado["erros"].extend(gravacao["erros"])
+
+            await cls._registrar_escrita()
+            return resultado
         except Exception as e:
             logger.error(f"Erro ao importar eventos: {e}")
             raise
 
     @classmethod
-    async def obter_estatisticas(cls):
+    async def importar_eventos_stream(
+            cls,
+            eventos: AsyncIterator[Dict[str, Any]],
+            chunk_size: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
-        Obtém estatísticas sobre os eventos.
+        Importa eventos de um iterador assíncrono, em lotes de ``chunk_size``.
+
+        Args:
+            eventos: Eventos a importar (ex.: lidos do corpo da requisição)
+            chunk_size (int, optional): Eventos por lote; padrão IMPORT_CHUNK_SIZE
 
         Returns:
-            dict: Estatísticas dos eventos
+            dict: Totais, relatório de cada lote e, se a leitura falhar, o erro
+            (os eventos lidos antes do erro permanecem gravados)
         """
-        try:
-            collection = await Database.get_collection(cls.collection_name)
+        chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+        relatorio = {"inserted": 0, "updated": 0, "failed": 0, "total": 0, "chunks": []}
+
+        async def gravar(lote: List[Dict[str, Any]]):
+            resultado = await cls.importar_eventos(lote)
+            resultado["chunk"] = len(relatorio["chunks"]) + 1
+            relatorio["chunks"].append(resultado)
+            for chave in ("inserted", "updated", "failed", "total"):
+                relatorio[chave] += resultado[chave]
+            logger.info(
+                f"Lote {resultado['chunk']} importado: {resultado['inserted']} inseridos, "
+                f"{resultado['updated']} atualizados, {resultado['failed']} com falha"
+            )
 
-            # Total de eventos
-            total_eventos = await collection.count_documents({})
+        lote = []
+        try:
+            async for evento in eventos:
+                lote.append(evento)
+                if len(lote) >= chunk_size:
+                    await gravar(lote)
+                    lote = []
+        except ValueError as e:
+            relatorio["erro"] = str(e)
 
-            # Eventos por estado
-            pipeline_estados = [
-                {"$group": {"_id": "$estado", "count": {"$sum": 1}}},
-                {"$sort": {"count": -1}}
-            ]
-            estados_cursor = collection.aggregate(pipeline_estados)
-            eventos_por_estado = await estados_cursor.to_list(length=None)
+        if lote:
+            await gravar(lote)
 
-        except:
-            return errno.EEXIST
+        return relatorio
 
     @classmethod
-    async def buscar_evento_por_id(cls, id: str):
+    async def buscar_evento_por_id(cls, id: str, campos: Optional[Tuple[str, ...]] = None):
         """
         Busca um evento pelo ID.
 
         Args:
             id (str): ID do evento
+            campos (tuple, optional): Campos a retornar (projeção); None retorna todos
 
         Returns:
             dict: Evento encontrado ou None
@@ -297,11 +745,15 @@ class EventoService:
                 return None
 
             collection = await Database.get_collection(cls.collection_name)
-            evento = await collection.find_one({"_id": ObjectId(id)})
+            projecao = cls._projecao(campos)
+            # Eventos removidos pela sincronização não são retornados, como nas listagens
+            evento = await collection.find_one({"_id": ObjectId(id), **ACTIVE_FILTER}, projecao)
 
             if evento:
                 # Converter ObjectId para string
                 evento["_id"] = str(evento["_id"])
+                if settings.TRUSTED_READS:
+                    trusted_items([evento], projecao)
                 return evento
 
             return None
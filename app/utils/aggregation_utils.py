@@ -0,0 +1,27 @@
+from typing import Any, Dict, List, Optional
+
+
+def count_stages(group_id: Any, labels: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Estágios que contam documentos por valor, do mais para o menos frequente.
+
+    Args:
+        group_id: Expressão agrupada (ex.: "$estado" ou {"cidade": "$cidade", "estado": "$estado"})
+        labels: Campos de saída a partir de ``_id``; padrão ``{"valor": "$_id"}``
+
+    Returns:
+        list: Estágios ``$group``, ``$sort`` e ``$project`` (para uso em ``$facet``)
+    """
+    return [
+        {"$group": {"_id": group_id, "total": {"$sum": 1}}},
+        {"$sort": {"total": -1, "_id": 1}},
+        {"$project": {"_id": 0, "total": 1, **(labels or {"valor": "$_id"})}},
+    ]
+
+
+def city_count_stages() -> List[Dict[str, Any]]:
+    """Contagem por cidade, separando cidades homônimas de estados diferentes."""
+    return count_stages(
+        {"cidade": "$cidade", "estado": "$estado"},
+        {"valor": "$_id.cidade", "estado": "$_id.estado"}
+    )
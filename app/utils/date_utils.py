@@ -0,0 +1,257 @@
+"""
+Datas dos eventos: interpretação do texto dos sites e campos derivados.
+
+O texto das datas varia entre os sites ("02, 03 e 15 de Agosto de 2025",
+"12/07/2025", "12 a 14 de set. de 2025"); ``parse_dates`` reconhece todos
+esses formatos em uma única passada, com memoização.
+
+``datas_realizacao`` é um array, e o MongoDB não usa um índice multikey para
+ordenar quando o filtro limita o próprio campo. Por isso cada evento guarda
+também a primeira e a última data (escalares), usadas nos filtros por
+status/período e na ordenação por data. Este módulo não depende da API e
+também é usado pelos scripts de coleta.
+"""
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+MESES = {
+    "jan": 1, "fev": 2, "mar": 3, "abr": 4, "mai": 5, "jun": 6,
+    "jul": 7, "ago": 8, "set": 9, "out": 10, "nov": 11, "dez": 12,
+}
+
+# Nomes e abreviações dos meses
+_MES = (
+    r"jan(?:eiro)?|fev(?:ereiro)?|mar(?:[çc]o)?|abr(?:il)?|mai(?:o)?|jun(?:ho)?"
+    r"|jul(?:ho)?|ago(?:sto)?|set(?:embro)?|out(?:ubro)?|nov(?:embro)?|dez(?:embro)?"
+)
+
+# Um token por ocorrência; o restante do texto (dia da semana, "de", "e",
+# vírgulas) é ignorado. Horários vêm antes dos números para não virarem dias,
+# e também são descartados os parênteses sem data numérica ("(2 etapas)") e
+# as quantidades, números seguidos de uma palavra que não é conector nem
+# mês ("2 etapas", "5 km").
+_TOKENS = re.compile(
+    r"(?P<observacao>\((?![^)]*\d{1,2}/\d{1,2})[^)]*\))"
+    r"|(?P<quantidade>\b\d{1,2}[º°]?\s+(?!(?:de|do|e|a|ao|at[ée]|" + _MES + r")\b)[^\W\d_]+)"
+    r"|(?P<horario>\b\d{1,2}(?:\s*:\s*\d{2}|\s*h(?:\s*\d{2})?|\s*horas?)\b)"
+    r"|(?P<numerica>\b\d{1,2})[/.-](?P<mes_num>\d{1,2})[/.-](?P<ano_num>\d{4}|\d{2})\b"
+    r"|(?P<numero>\b\d{1,4})[º°]?(?!\w)"
+    r"|\b(?P<mes>" + _MES + r")\b\.?"
+    r"|(?P<intervalo>\b(?:a|at[ée]|ao)\b|[-–])",
+    re.IGNORECASE,
+)
+
+# Formatos mais comuns, interpretados sem a passada geral por tokens
+_NUMERICA = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_EXTENSO = re.compile(r"(\d{1,2}(?:(?:,| e) ?\d{1,2})*) de ([a-zç]+) de (\d{4})", re.IGNORECASE)
+_DIAS = re.compile(r"\d+")
+
+# Status calculados em relação ao dia atual
+RELATIVE_STATUSES = ("pendentes", "realizados")
+
+# Maior intervalo aceito ("12 a 14 de ..."), em dias
+_MAX_INTERVALO = 31
+
+# Quantidade de textos distintos memorizados
+_CACHE_SIZE = 16384
+
+
+class InvalidDateError(ValueError):
+    """Texto de data que não pôde ser interpretado."""
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse(text: str) -> Tuple[datetime, ...]:
+    try:
+        simples = _NUMERICA.fullmatch(text)
+        if simples:
+            dia, mes, ano = simples.groups()
+            return (datetime(int(ano), int(mes), int(dia)),)
+        extenso = _EXTENSO.fullmatch(text)
+        if extenso and extenso.group(2)[:3].lower() in MESES:
+            dias, mes, ano = extenso.groups()
+            mes, ano = MESES[mes[:3].lower()], int(ano)
+            return tuple(sorted({datetime(ano, mes, int(dia)) for dia in _DIAS.findall(dias)}))
+    except ValueError as e:
+        raise InvalidDateError(f"Data inválida em {text!r}: {e}") from None
+
+    # Cada item é [dia, mês, ano]; mês e ano são preenchidos pelos tokens seguintes
+    itens: List[List[Optional[int]]] = []
+    intervalos = set()
+    intervalo = False
+    # Itens até a última data completa; números depois dela ("- Etapa 2") são ignorados
+    completos = 0
+
+    def adicionar(dia: int, mes: Optional[int] = None, ano: Optional[int] = None):
+        nonlocal intervalo
+        if intervalo and itens:
+            intervalos.add(len(itens) - 1)
+        intervalo = False
+        itens.append([dia, mes, ano])
+
+    def definir_ano(ano: int):
+        for item in itens:
+            if item[2] is None:
+                item[2] = ano
+
+    def definir_mes(mes: int):
+        for item in itens:
+            if item[1] is None:
+                item[1] = mes
+
+    for token in _TOKENS.finditer(text):
+        if token.group("numerica"):
+            ano = int(token.group("ano_num"))
+            ano = ano + 2000 if ano < 100 else ano
+            # Completa os dias anteriores ("12 a 14/09/2025")
+            definir_mes(int(token.group("mes_num")))
+            definir_ano(ano)
+            adicionar(int(token.group("numerica")), int(token.group("mes_num")), ano)
+        elif token.group("numero"):
+            numero = int(token.group("numero"))
+            if numero > 31:
+                definir_ano(numero)
+            else:
+                adicionar(numero)
+        elif token.group("mes"):
+            definir_mes(MESES[token.group("mes")[:3].lower()])
+        elif token.group("intervalo"):
+            intervalo = True
+        # Mês e ano completam todos os itens anteriores: basta olhar o último
+        if itens and itens[-1][1] is not None and itens[-1][2] is not None:
+            completos = len(itens)
+
+    if not completos:
+        raise InvalidDateError(f"Data não reconhecida: {text!r}")
+    del itens[completos:]
+
+    try:
+        datas = [datetime(ano, mes, dia) for dia, mes, ano in itens]
+    except ValueError as e:
+        raise InvalidDateError(f"Data inválida em {text!r}: {e}") from None
+
+    resultado = set(datas)
+    for indice in intervalos:
+        if indice + 1 >= len(itens):
+            continue
+        inicio, fim = datas[indice], datas[indice + 1]
+        if not timedelta(0) <= fim - inicio <= timedelta(days=_MAX_INTERVALO):
+            raise InvalidDateError(f"Intervalo de datas inválido em {text!r}")
+        resultado.update(inicio + timedelta(days=dia) for dia in range((fim - inicio).days + 1))
+    return tuple(sorted(resultado))
+
+
+def parse_dates(text: Optional[str]) -> List[datetime]:
+    """
+    Interpreta o texto de datas de um evento.
+
+    Reconhece dias isolados ou listados ("02, 03 e 15 de Agosto de 2025"),
+    intervalos ("12 a 14 de Setembro de 2025", "30/08/2025 a 01/09/2025"),
+    datas numéricas (dd/mm/aaaa) e meses abreviados ("12 set. 2025"). O texto
+    depois da última data completa é ignorado ("12 de Julho de 2025 - Etapa 2").
+    Textos já vistos são respondidos da memória.
+
+    Args:
+        text: Texto da data, como publicado pelo site
+
+    Returns:
+        list: Datas em ordem crescente (vazia para texto vazio)
+
+    Raises:
+        InvalidDateError: Se o texto não contém uma data completa e válida
+    """
+    if not text or not text.strip():
+        return []
+    return list(_parse(" ".join(text.split())))
+
+
+def is_date_text(text: Optional[str]) -> bool:
+    """Indica se o texto contém uma data completa reconhecida por ``parse_dates``."""
+    try:
+        return bool(parse_dates(text))
+    except InvalidDateError:
+        return False
+
+
+def build_date_fields(datas_realizacao: Optional[Iterable[datetime]]) -> Dict[str, Any]:
+    """
+    Campos de data gravados em cada evento.
+
+    Args:
+        datas_realizacao: Datas de realização do evento
+
+    Returns:
+        dict: ``primeira_data`` e ``ultima_data`` (None se não houver datas)
+    """
+    datas = [data for data in datas_realizacao or [] if isinstance(data, datetime)]
+    return {
+        "primeira_data": min(datas) if datas else None,
+        "ultima_data": max(datas) if datas else None,
+    }
+
+
+def date_sort_field(direcao: int) -> str:
+    """
+    Campo escalar equivalente à ordenação por ``datas_realizacao``.
+
+    O MongoDB ordena arrays pelo maior elemento na ordem decrescente e pelo
+    menor na crescente; ``ultima_data`` e ``primeira_data`` mantêm essa ordem.
+
+    Args:
+        direcao: 1 (crescente) ou -1 (decrescente)
+
+    Returns:
+        str: ``primeira_data`` ou ``ultima_data``
+    """
+    return "primeira_data" if direcao == 1 else "ultima_data"
+
+
+def date_range_filter(
+        inicio: Optional[datetime] = None,
+        fim: Optional[datetime] = None,
+        status: Optional[str] = None,
+        hoje: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Filtro por período e status sobre ``primeira_data``/``ultima_data``.
+
+    Um evento está no período se começa até ``fim`` e termina a partir de
+    ``inicio``.
+    Pendentes são os que têm alguma data a partir de hoje; realizados, os que
+    têm alguma data anterior a hoje (um evento em andamento está nos dois).
+
+    Args:
+        inicio: Início do período (inclusive)
+        fim: Fim do período (inclusive)
+        status: "pendentes", "realizados" ou outro valor (sem filtro)
+        hoje: Início do dia atual
+
+    Returns:
+        dict: Condições a acrescentar ao filtro da consulta
+    """
+    filtro: Dict[str, Dict[str, datetime]] = {}
+
+    def limitar(campo: str, operador: str, valor: datetime):
+        condicao = filtro.setdefault(campo, {})
+        atual = condicao.get(operador)
+        if atual is None:
+            condicao[operador] = valor
+        elif operador.startswith("$g"):
+            condicao[operador] = max(atual, valor)
+        else:
+            condicao[operador] = min(atual, valor)
+
+    if inicio is not None:
+        limitar("ultima_data", "$gte", inicio)
+    if fim is not None:
+        limitar("primeira_data", "$lte", fim)
+    if status in RELATIVE_STATUSES:
+        hoje = hoje or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        if status == "pendentes":
+            limitar("ultima_data", "$gte", hoje)
+        else:
+            limitar("primeira_data", "$lt", hoje)
+    return filtro
+
@@ -0,0 +1,206 @@
+"""
+Distâncias e modalidades dos eventos.
+
+O campo ``distancias`` é texto livre vindo dos scrapers (ex.: "3km (caminhada),
+6km, 12km e 21km (corrida)", "21,1km", "Meia Maratona"). Ele é interpretado
+uma única vez, na gravação, em ``distancias_km`` (números, em km) e
+``modalidades`` (rótulos), indexados para os filtros e usados nas faixas das
+estatísticas. Este módulo não depende da API e também é usado pelos scripts
+de coleta.
+"""
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Número seguido de km (ou "k", "quilômetros") ou de metros, ou o nome de uma
+# prova clássica. Os metros exigem um número isolado ("6h30m" não é distância)
+# e aceitam ponto como separador de milhar ("1.500m").
+_DISTANCIA = re.compile(
+    r"(?<![\d.,])(?P<numero>\d+(?:[.,]\d+)?)\s*(?P<unidade>km|quil[oô]metros?|k)\b"
+    r"|(?<![\d.,])\b(?P<metros>\d{1,3}(?:\.\d{3})+|\d+)\s*(?:metros|m)\b"
+    r"|\b(?P<prova>meia[ -]maratona|maratona)\b",
+    re.IGNORECASE,
+)
+
+# Distâncias procuradas no texto de uma página inteira: só km e provas
+# nomeadas, já que "k" e "m" isolados aparecem em horários, categorias etc.
+_DISTANCIA_PAGINA = re.compile(
+    r"(?<![\d.,])(?P<numero>\d+(?:[.,]\d+)?)\s*(?P<unidade>km)\b"
+    r"|\b(?P<prova>meia[ -]maratona|maratona)\b",
+    re.IGNORECASE,
+)
+
+# Menor distância em metros aceita (valores menores são categorias, horários...)
+_MIN_METROS = 100
+
+# Distância oficial (km) das provas reconhecidas pelo nome
+_PROVAS = {"meia maratona": 21.1, "maratona": 42.2}
+
+# (modalidade, expressão regular) reconhecidas no texto das distâncias
+_MODALIDADES: List[Tuple[str, "re.Pattern[str]"]] = [
+    ("corrida", re.compile(r"\bcorrida\b", re.IGNORECASE)),
+    ("caminhada", re.compile(r"\bcaminhada\b", re.IGNORECASE)),
+    ("trail", re.compile(r"\b(trail|trilha)\b", re.IGNORECASE)),
+    ("ultra", re.compile(r"\bultra\b", re.IGNORECASE)),
+    ("infantil", re.compile(r"\b(infantil|kids)\b", re.IGNORECASE)),
+]
+
+# Modalidades aceitas no filtro da API
+MODALITIES = tuple(modalidade for modalidade, _ in _MODALIDADES)
+
+# (faixa, limite superior exclusivo em km) das estatísticas e facetas;
+# a parte inteira da distância decide a faixa (21,1 km está em 11_a_21km)
+DISTANCE_BANDS: List[Tuple[str, Optional[float]]] = [
+    ("ate_5km", 6),
+    ("6_a_10km", 11),
+    ("11_a_21km", 22),
+    ("22_a_42km", 43),
+    ("acima_42km", None),
+]
+
+# Faixa atribuída a eventos sem nenhuma distância reconhecida
+NO_BAND = "nao_informada"
+
+
+def _km(match: "re.Match[str]") -> Optional[float]:
+    """Distância em km de uma ocorrência de ``_DISTANCIA`` (None se implausível)."""
+    prova = match.group("prova")
+    if prova:
+        return _PROVAS[prova.lower().replace("-", " ")]
+    if match.groupdict().get("metros"):
+        metros = int(match.group("metros").replace(".", ""))
+        return round(metros / 1000, 3) if metros >= _MIN_METROS else None
+    return round(float(match.group("numero").replace(",", ".")), 3)
+
+
+def parse_distances(text: Optional[str]) -> List[float]:
+    """
+    Extrai as distâncias (em km) de um texto.
+
+    Args:
+        text: Texto livre, ex.: "3km (caminhada), 6km, 12km e Meia Maratona"
+
+    Returns:
+        list: Distâncias únicas em ordem crescente, ex.: [3.0, 6.0, 12.0, 21.1]
+    """
+    if not text:
+        return []
+    return sorted({km for km in map(_km, _DISTANCIA.finditer(text)) if km is not None})
+
+
+def parse_modalities(text: Optional[str]) -> List[str]:
+    """
+    Extrai as modalidades citadas em um texto (corrida, caminhada, trail,
+    ultra, infantil).
+
+    Args:
+        text: Texto livre das distâncias
+
+    Returns:
+        list: Modalidades encontradas, na ordem de ``_MODALIDADES``
+    """
+    if not text:
+        return []
+    return [modalidade for modalidade, regex in _MODALIDADES if regex.search(text)]
+
+
+def distance_labels(text: Optional[str]) -> List[str]:
+    """
+    Trechos de um texto que descrevem distâncias, sem repetição e em ordem
+    crescente de distância (ex.: texto de uma página de evento). Só reconhece
+    km e provas nomeadas, para não confundir horários ("6h30m") e categorias
+    ("40 M") com distâncias.
+
+    Args:
+        text: Texto livre
+
+    Returns:
+        list: Trechos encontrados, ex.: ["5km", "10 KM", "Meia Maratona"]
+    """
+    if not text:
+        return []
+    trechos: Dict[str, Tuple[float, str]] = {}
+    for match in _DISTANCIA_PAGINA.finditer(text):
+        trechos.setdefault(match.group(0).lower(), (_km(match), match.group(0)))
+    return [trecho for _, trecho in sorted(trechos.values())]
+
+
+def build_distance_fields(distancias: Optional[str]) -> Dict[str, Any]:
+    """
+    Campos de distância gravados em cada evento.
+
+    Args:
+        distancias: Texto livre das distâncias
+
+    Returns:
+        dict: ``distancias_km`` e ``modalidades``
+    """
+    return {
+        "distancias_km": parse_distances(distancias),
+        "modalidades": parse_modalities(distancias),
+    }
+
+
+def distance_filter(
+        minimo: Optional[float] = None,
+        maximo: Optional[float] = None,
+        modalidade: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Filtro por distância e modalidade.
+
+    Um evento atende ao intervalo se alguma de suas distâncias estiver entre
+    ``minimo`` e ``maximo`` (inclusive).
+
+    Args:
+        minimo: Distância mínima (km)
+        maximo: Distância máxima (km)
+        modalidade: Modalidade exigida
+
+    Returns:
+        dict: Condições a acrescentar ao filtro da consulta
+    """
+    filtro: Dict[str, Any] = {}
+    intervalo = {}
+    if minimo is not None:
+        intervalo["$gte"] = minimo
+    if maximo is not None:
+        intervalo["$lte"] = maximo
+    if intervalo:
+        # $elemMatch: a mesma distância deve atender aos dois limites
+        filtro["distancias_km"] = {"$elemMatch": intervalo} if len(intervalo) > 1 else intervalo
+    if modalidade:
+        filtro["modalidades"] = modalidade
+    return filtro
+
+
+def distance_bands_expression(field: str = "$distancias_km") -> Dict[str, Any]:
+    """
+    Expressão de agregação com a lista de faixas de distância de um evento.
+
+    Um evento com várias distâncias pertence a várias faixas.
+
+    Args:
+        field: Caminho do campo com as distâncias em km
+
+    Returns:
+        dict: Expressão que resulta em uma lista de nomes de faixa
+    """
+    ramos = [
+        {"case": {"$lt": ["$$km", limite]}, "then": faixa}
+        for faixa, limite in DISTANCE_BANDS if limite is not None
+    ]
+    faixas = {
+        "$setUnion": [{
+            "$map": {
+                "input": {"$ifNull": [field, []]},
+                "as": "km",
+                "in": {"$switch": {"branches": ramos, "default": DISTANCE_BANDS[-1][0]}},
+            }
+        }]
+    }
+    return {
+        "$let": {
+            "vars": {"faixas": faixas},
+            "in": {"$cond": [{"$eq": [{"$size": "$$faixas"}, 0]}, [NO_BAND], "$$faixas"]},
+        }
+    }
@@ -0,0 +1,75 @@
+import csv
+import io
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Sequence
+
+from app.utils.json_utils import dumps
+
+# Quantidade de documentos agrupados em cada bloco enviado ao cliente
+CHUNK_DOCS = 200
+
+
+def _csv_value(value: Any) -> Any:
+    """Converte um valor do MongoDB para uma célula de CSV."""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return ", ".join(str(_csv_value(v)) for v in value)
+    return str(value) if not isinstance(value, (str, int, float)) else value
+
+
+async def ndjson_chunks(docs: AsyncIterator[Dict[str, Any]], chunk_docs: int = CHUNK_DOCS) -> AsyncIterator[bytes]:
+    """
+    Serializa documentos como NDJSON (um objeto JSON por linha), em blocos.
+
+    Args:
+        docs: Iterador assíncrono de documentos
+        chunk_docs: Documentos por bloco
+
+    Yields:
+        bytes: Bloco de linhas NDJSON
+    """
+    buffer: List[bytes] = []
+    async for doc in docs:
+        buffer.append(dumps(doc))
+        if len(buffer) >= chunk_docs:
+            yield b"\n".join(buffer) + b"\n"
+            buffer = []
+    if buffer:
+        yield b"\n".join(buffer) + b"\n"
+
+
+async def csv_chunks(
+        docs: AsyncIterator[Dict[str, Any]],
+        columns: Sequence[str],
+        chunk_docs: int = CHUNK_DOCS
+) -> AsyncIterator[bytes]:
+    """
+    Serializa documentos como CSV separado por ';' (mesmo formato dos scrapers).
+
+    Args:
+        docs: Iterador assíncrono de documentos
+        columns: Colunas do CSV, na ordem
+        chunk_docs: Documentos por bloco
+
+    Yields:
+        bytes: Bloco de linhas CSV em UTF-8
+    """
+    output = io.StringIO()
+    writer = csv.writer(output, delimiter=";")
+    writer.writerow(columns)
+    rows = 0
+
+    async for doc in docs:
+        writer.writerow([_csv_value(doc.get(column)) for column in columns])
+        rows += 1
+        if rows >= chunk_docs:
+            yield output.getvalue().encode("utf-8")
+            output.seek(0)
+            output.truncate(0)
+            rows = 0
+
+    if output.tell():
+        yield output.getvalue().encode("utf-8")
@@ -0,0 +1,82 @@
+from datetime import date, datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import Request
+
+
+def build_validators(estado: Dict[str, Any], dia: Optional[date] = None) -> Tuple[str, Optional[datetime]]:
+    """
+    Gera o ETag e a data de modificação a partir do estado da coleção.
+
+    Respostas que dependem da data atual (status pendentes/realizados) mudam
+    à meia-noite sem nenhuma escrita: para elas o dia entra no ETag e não há
+    data de modificação (If-Modified-Since não é atendido).
+
+    Args:
+        estado: Estado retornado por ``EventoService.obter_estado_colecao``
+            (geração de escrita, total de documentos e última modificação)
+        dia: Dia atual, quando a resposta depende dele
+
+    Returns:
+        tuple: (ETag fraco, última modificação em UTC ou None)
+    """
+    modificado_em = estado.get("modificado_em")
+    if modificado_em is not None:
+        if modificado_em.tzinfo is None:
+            # Datas gravadas com datetime.now() estão no horário local do servidor
+            modificado_em = modificado_em.astimezone()
+        modificado_em = modificado_em.astimezone(timezone.utc).replace(microsecond=0)
+
+    marca = int(modificado_em.timestamp()) if modificado_em else 0
+    etag = f'W/"{estado.get("geracao", 0)}-{estado.get("total", 0)}-{marca}"'
+    if dia is not None:
+        return f'{etag[:-1]}-{dia:%Y%m%d}"', None
+    return etag, modificado_em
+
+
+def validator_headers(etag: str, modificado_em: Optional[datetime]) -> Dict[str, str]:
+    """Cabeçalhos de validação enviados nas respostas 200 e 304."""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if modificado_em is not None:
+        headers["Last-Modified"] = format_datetime(modificado_em, usegmt=True)
+    return headers
+
+
+def is_not_modified(
+        request: Request,
+        etag: str,
+        modificado_em: Optional[datetime],
+        existe: bool = True
+) -> bool:
+    """
+    Verifica If-None-Match e If-Modified-Since (este só na ausência do primeiro).
+
+    Args:
+        request: Requisição recebida
+        etag: ETag atual do recurso
+        modificado_em: Última modificação atual (UTC)
+        existe: Se o recurso existe; ``If-None-Match: *`` só vale para um
+            recurso existente
+
+    Returns:
+        bool: True se o cliente já possui a versão atual (responder 304)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        # Comparação fraca: ignora o prefixo W/
+        atual = etag.removeprefix("W/")
+        return ("*" in tags and existe) or any(tag.removeprefix("W/") == atual for tag in tags)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and modificado_em is not None:
+        try:
+            desde = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if desde.tzinfo is None:
+            desde = desde.replace(tzinfo=timezone.utc)
+        return modificado_em <= desde
+
+    return False
@@ -0,0 +1,74 @@
+"""
+Leitura incremental de corpos JSON grandes.
+
+Aceita um array JSON (``[{...}, {...}]``) ou NDJSON (um objeto por linha),
+decodificando cada documento assim que ele chega, sem carregar o corpo inteiro.
+"""
+import codecs
+import json
+from typing import Any, AsyncIterator, Dict
+
+_DECODER = json.JSONDecoder()
+_SEPARATORS = " \t\r\n,"
+
+
+async def iter_json_documents(
+        chunks: AsyncIterator[bytes],
+        max_document_bytes: int = 1024 * 1024
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Decodifica os objetos JSON de um corpo recebido em blocos.
+
+    Args:
+        chunks: Blocos de bytes do corpo (ex.: ``request.stream()``)
+        max_document_bytes: Tamanho máximo de um documento, completo ou não
+
+    Yields:
+        dict: Cada objeto do array ou linha do NDJSON
+
+    Raises:
+        ValueError: Se o corpo não for JSON válido ou contiver algo além de objetos
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    inicio = True
+    fim_array = False
+
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in _SEPARATORS:
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if inicio:
+                inicio = False
+                if buffer[pos] == "[":
+                    pos += 1
+                    continue
+            if buffer[pos] == "]":
+                fim_array = True
+                pos += 1
+                continue
+            if fim_array:
+                raise ValueError("Conteúdo após o fim do array JSON")
+            try:
+                documento, pos_final = _DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Documento incompleto: aguarda o próximo bloco
+                if len(buffer) - pos > max_document_bytes:
+                    raise ValueError("Documento JSON excede o tamanho máximo ou é inválido")
+                break
+            # O mesmo limite vale para um documento que chegou inteiro em um bloco
+            if pos_final - pos > max_document_bytes:
+                raise ValueError("Documento JSON excede o tamanho máximo ou é inválido")
+            if not isinstance(documento, dict):
+                raise ValueError("Cada item importado deve ser um objeto JSON")
+            pos = pos_final
+            yield documento
+        buffer = buffer[pos:]
+
+    buffer += decoder.decode(b"", final=True)
+    if buffer.strip(_SEPARATORS):
+        raise ValueError("JSON incompleto ou inválido no fim do corpo")
@@ -1,7 +1,9 @@
 # app/utils/json_utils.py
 import json
+import orjson
 from datetime import datetime
 from bson import ObjectId
+from fastapi.responses import JSONResponse
 from typing import Any, Dict, List, Union
 
 
@@ -33,4 +35,32 @@ def convert_to_json(obj: Any) -> Any:
     elif isinstance(obj, list):
         return [convert_to_json(item) for item in obj]
     else:
-        return obj
\ No newline at end of file
+        return obj
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Converte os tipos do MongoDB que o orjson não serializa nativamente."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Tipo não serializável: {type(obj).__name__}")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serializa documentos do MongoDB com orjson em uma única passada.
+    datetime é tratado nativamente (ISO 8601) e ObjectId vira string.
+
+    Args:
+        obj: Objeto a ser serializado
+
+    Returns:
+        bytes: JSON codificado em UTF-8
+    """
+    return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class MongoJSONResponse(JSONResponse):
+    """Resposta JSON serializada com orjson, aceitando documentos do MongoDB."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
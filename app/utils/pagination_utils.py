@@ -1,17 +1,157 @@
+import asyncio
+import base64
+import json
+from datetime import datetime
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.motor import paginate as motor_paginate
-from typing import Any, Dict, List, TypeVar
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
 from bson import ObjectId
+from bson.errors import InvalidId
+from app.models.paginacao import CursorPage
 
 T = TypeVar('T')
 
 
+TOTAL_MODES = ("exato", "estimado", "nenhum")
+
+# Filtro que exclui os eventos marcados como removidos pela sincronização:
+# igualdade em ``ativo``, a condição dos índices parciais de listagem. O total
+# estimado (que inclui os removidos, poucos) continua valendo para ele
+ACTIVE_FILTER = {"ativo": True}
+
+
+def trusted_items(items_list: List[Dict[str, Any]], projection: Optional[Dict[str, int]]) -> List[Dict[str, Any]]:
+    """
+    Prepara documentos confiáveis para serialização direta, sem validação:
+    os campos projetados ausentes recebem None, como faria o modelo.
+    """
+    if projection:
+        for item in items_list:
+            for field in projection:
+                if field not in item:
+                    item[field] = None
+    return items_list
+
+
+def _unfiltered(query_filter: Dict[str, Any]) -> bool:
+    """Indica se o filtro não restringe a consulta (vazio ou ``ACTIVE_FILTER``)."""
+    return not query_filter or query_filter == ACTIVE_FILTER
+
+
+async def _count_total(collection, query_filter: Dict[str, Any], total_mode: str) -> Optional[int]:
+    """Conta o total conforme o modo: exato, estimado (sem filtro) ou nenhum."""
+    if total_mode == "nenhum":
+        return None
+    if total_mode == "estimado" and _unfiltered(query_filter):
+        # Usa os metadados da coleção, sem percorrer documentos
+        return await collection.estimated_document_count()
+    return await collection.count_documents(query_filter)
+
+
+async def _find_page(collection, query_filter, sort, skip, size, total_mode, projection=None):
+    """Busca a página com find e conta o total em paralelo (duas operações)."""
+    cursor = collection.find(query_filter, projection).sort(list(sort.items())).skip(skip).limit(size)
+    return await asyncio.gather(
+        cursor.to_list(length=None),
+        _count_total(collection, query_filter, total_mode),
+    )
+
+
+def counts_in_pipeline(query_filter: Dict[str, Any], total_mode: str, score: Optional[Dict[str, Any]]) -> bool:
+    """
+    Indica se o engine "facet" conta o total dentro do $facet.
+
+    Isso só acontece na busca por relevância, quando todos os documentos
+    filtrados já são lidos e ordenados pela pontuação. Nos demais casos, um
+    $count após o $sort obrigaria a ler e ordenar todos os documentos
+    filtrados; o total vem então de um count em paralelo, que pode ser
+    respondido pelo índice.
+    """
+    return score is not None and (
+        total_mode == "exato" or (total_mode == "estimado" and not _unfiltered(query_filter))
+    )
+
+
+def facet_page_pipeline(
+        query_filter: Dict[str, Any],
+        sort: Dict[str, int],
+        skip: int,
+        size: int,
+        score: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, int]] = None,
+        count: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Agregação da página usada pelo engine "facet" (e pela busca por relevância).
+
+    Args:
+        query_filter: Filtro para a consulta
+        sort: Ordenação para a consulta
+        skip: Documentos a pular
+        size: Tamanho da página
+        score: Expressão de relevância, ordenada antes de ``sort``
+        projection: Projeção com os campos a retornar
+        count: Se True, a página e o total saem de um $facet
+
+    Returns:
+        list: Pipeline da agregação
+    """
+    pipeline = []
+    if query_filter:
+        pipeline.append({"$match": query_filter})
+    page_stages = [{"$skip": skip}, {"$limit": size}]
+
+    if score is not None:
+        # Ordenar pela relevância e, em caso de empate, pela ordenação pedida
+        pipeline.append({"$addFields": {"_relevancia": score}})
+        sort = {"_relevancia": -1, **sort}
+        if projection is None:
+            page_stages.append({"$project": {"_relevancia": 0}})
+
+    if projection is not None:
+        page_stages.append({"$project": projection})
+
+    # Ordenar antes do $facet para que o índice possa ser usado
+    if sort:
+        pipeline.append({"$sort": dict(sort)})
+
+    if not count:
+        return pipeline + page_stages
+    pipeline.append({"$facet": {
+        "items": page_stages,
+        "total": [{"$count": "total"}],
+    }})
+    return pipeline
+
+
+async def _facet_page(collection, query_filter, sort, skip, size, total_mode, score=None, projection=None):
+    """Busca a página por agregação (ver ``counts_in_pipeline``)."""
+    if not counts_in_pipeline(query_filter, total_mode, score):
+        # Apenas a página, com o total (se pedido) contado em paralelo
+        pipeline = facet_page_pipeline(query_filter, sort, skip, size, score, projection)
+        return await asyncio.gather(
+            collection.aggregate(pipeline, allowDiskUse=True).to_list(length=None),
+            _count_total(collection, query_filter, total_mode),
+        )
+
+    pipeline = facet_page_pipeline(query_filter, sort, skip, size, score, projection, count=True)
+    result = await collection.aggregate(pipeline, allowDiskUse=True).to_list(length=None)
+    facet = result[0] if result else {"items": [], "total": []}
+    total = facet["total"][0]["total"] if facet["total"] else 0
+    return facet["items"], total
+
+
 async def paginate_with_objectid_conversion(
         collection,
         query_filter: Dict[str, Any],
         sort: Dict[str, int],
         params: Params,
-        model_class
+        model_class,
+        engine: str = "find",
+        total_mode: str = "exato",
+        score: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, int]] = None,
+        validate: bool = True
 ):
     """
     Função personalizada para paginação que converte ObjectId para string
@@ -23,27 +163,49 @@ async def paginate_with_objectid_conversion(
         sort: Ordenação para a consulta
         params: Parâmetros de paginação
         model_class: Classe do modelo Pydantic para validação
+        engine: "find" (find + count em paralelo) ou "facet" (agregação; ver ``_facet_page``)
+        total_mode: "exato", "estimado" (estimated_document_count quando o
+            filtro é vazio ou ``ACTIVE_FILTER``) ou "nenhum" (total nulo)
+        score: Expressão de relevância; quando informada, os itens são ordenados
+            por ela antes de ``sort`` (sempre pelo engine "facet")
+        projection: Projeção do MongoDB com os campos a retornar
+        validate: Se False, os documentos (lidos do nosso próprio banco) não
+            passam pelo modelo e a página é retornada como dict pronto para
+            serialização
 
     Returns:
-        Page: Página de objetos do modelo
+        Page: Página de objetos do modelo (ou dict, se ``validate`` for False)
     """
-    # Obter a contagem total de documentos que correspondem ao filtro
-    total = await collection.count_documents(query_filter)
+    if total_mode not in TOTAL_MODES:
+        raise ValueError(f"Modo de total inválido: {total_mode}")
 
     # Calcular o número de documentos a pular
     skip = (params.page - 1) * params.size
 
-    # Obter os documentos para a página atual
-    cursor = collection.find(query_filter).sort(list(sort.items())).skip(skip).limit(params.size)
-
-    # Converter para lista
-    items_list = await cursor.to_list(length=None)
+    # Obter os documentos para a página atual e o total
+    if engine == "facet" or score is not None:
+        items_list, total = await _facet_page(
+            collection, query_filter, sort, skip, params.size, total_mode, score, projection
+        )
+    else:
+        items_list, total = await _find_page(
+            collection, query_filter, sort, skip, params.size, total_mode, projection
+        )
 
     # Converter ObjectId para string
     for item in items_list:
         if '_id' in item and isinstance(item['_id'], ObjectId):
             item['_id'] = str(item['_id'])
 
+    if not validate:
+        return {
+            "items": trusted_items(items_list, projection),
+            "total": total,
+            "page": params.page,
+            "size": params.size,
+            "pages": None,
+        }
+
     # Criar objetos do modelo
     items = [model_class.model_validate(item) for item in items_list]
 
@@ -53,4 +215,212 @@ async def paginate_with_objectid_conversion(
         total=total,
         page=params.page,
         size=params.size,
-    )
\ No newline at end of file
+    )
+
+
+class InvalidCursorError(ValueError):
+    """Cursor de paginação malformado ou incompatível com a ordenação."""
+
+
+def _sort_key(value: Any, direction: int) -> Tuple[Any, bool]:
+    """
+    Reproduz a chave de ordenação do MongoDB para um valor.
+
+    Campos array são ordenados pelo menor elemento (crescente) ou pelo maior
+    (decrescente). Arrays vazios são representados por ``[]``.
+
+    Returns:
+        tuple: (chave de ordenação, se o campo é um array)
+    """
+    if isinstance(value, list):
+        values = [v for v in value if v is not None]
+        if not values:
+            return ([] if not value else None), True
+        return (max(values) if direction < 0 else min(values)), True
+    return value, False
+
+
+def encode_cursor(sort_field: str, value: Any, last_id: Any, is_array: bool = False) -> str:
+    """
+    Codifica a posição (valor de ordenação, _id) do último item em um token opaco.
+
+    Args:
+        sort_field: Campo de ordenação
+        value: Chave de ordenação do último item
+        last_id: _id do último item
+        is_array: Se o campo de ordenação é um array
+
+    Returns:
+        str: Token opaco (base64 url-safe)
+    """
+    if isinstance(value, datetime):
+        value = {"$date": value.isoformat()}
+    elif isinstance(value, ObjectId):
+        value = {"$oid": str(value)}
+
+    payload = {"f": sort_field, "v": value, "id": str(last_id), "a": int(is_array)}
+    raw = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, sort_field: str) -> Tuple[Any, ObjectId, bool]:
+    """
+    Decodifica um token gerado por ``encode_cursor``.
+
+    Args:
+        token: Token recebido do cliente
+        sort_field: Campo de ordenação da requisição atual
+
+    Returns:
+        tuple: (chave de ordenação, _id, se o campo é array) do último item
+        da página anterior
+
+    Raises:
+        InvalidCursorError: Se o token for inválido ou de outra ordenação
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        value = payload["v"]
+        if isinstance(value, dict) and "$date" in value:
+            value = datetime.fromisoformat(value["$date"])
+        elif isinstance(value, dict) and "$oid" in value:
+            value = ObjectId(value["$oid"])
+        last_id = ObjectId(payload["id"])
+        is_array = bool(payload.get("a"))
+    except (ValueError, KeyError, TypeError, InvalidId) as e:
+        raise InvalidCursorError("Cursor inválido") from e
+
+    if payload.get("f") != sort_field:
+        raise InvalidCursorError("Cursor não corresponde à ordenação solicitada")
+
+    return value, last_id, is_array
+
+
+def _keyset_filter(
+        sort_field: str,
+        direction: int,
+        value: Any,
+        last_id: ObjectId,
+        is_array: bool
+) -> Dict[str, Any]:
+    """
+    Monta o filtro que seleciona os itens posteriores à posição (valor, _id).
+
+    Segue a ordem de comparação do MongoDB: arrays vazios < null/ausente < valores.
+    """
+    op = "$lt" if direction < 0 else "$gt"
+    f = sort_field
+    empty = {f: {"$size": 0}}
+
+    if value == []:
+        same_value = {f: {"$size": 0}, "_id": {op: last_id}}
+        if direction < 0:
+            return same_value
+        return {"$or": [same_value, {f: {"$not": {"$size": 0}}}]}
+
+    if value is None:
+        same_value = {f: None, "_id": {op: last_id}}
+        if direction < 0:
+            return {"$or": [same_value, empty]}
+        return {"$or": [same_value, {"$and": [{f: {"$ne": None}}, {f: {"$not": {"$size": 0}}}]}]}
+
+    if is_array:
+        # A chave de um array é seu maior (desc) ou menor (asc) elemento
+        if direction < 0:
+            after = {f: {"$not": {"$elemMatch": {"$gte": value}}}}
+            same_key = {f: {"$not": {"$elemMatch": {"$gt": value}}}}
+        else:
+            after = {f: {"$gt": value, "$not": {"$elemMatch": {"$lte": value}}}}
+            same_key = {f: {"$not": {"$elemMatch": {"$lt": value}}}}
+        return {"$or": [after, {"$and": [{f: value}, same_key], "_id": {op: last_id}}]}
+
+    conditions = [
+        {f: {op: value}},
+        {f: value, "_id": {op: last_id}},
+    ]
+    if direction < 0:
+        # Na ordem decrescente os documentos sem o campo vêm por último
+        conditions.extend([{f: None}, empty])
+    return {"$or": conditions}
+
+
+async def paginate_with_cursor(
+        collection,
+        query_filter: Dict[str, Any],
+        sort_field: str,
+        direction: int,
+        size: int,
+        model_class,
+        cursor: Optional[str] = None,
+        projection: Optional[Dict[str, int]] = None,
+        validate: bool = True
+):
+    """
+    Paginação por cursor (keyset) ordenada por (sort_field, _id).
+
+    Em vez de pular documentos com ``skip``, filtra a partir da posição do
+    último item entregue, então o custo independe da profundidade da página.
+    Campos array são suportados seguindo a regra de ordenação do MongoDB
+    (menor elemento na ordem crescente, maior na decrescente).
+
+    Args:
+        collection: Coleção do MongoDB
+        query_filter: Filtro para a consulta
+        sort_field: Campo de ordenação
+        direction: 1 para crescente, -1 para decrescente
+        size: Quantidade de itens por página
+        model_class: Classe do modelo Pydantic para validação
+        cursor: Token da página anterior (None para a primeira página)
+        projection: Projeção do MongoDB com os campos a retornar
+        validate: Se False, retorna os documentos sem validação, como dict
+
+    Returns:
+        CursorPage: Página de objetos do modelo e o token da próxima página
+    """
+    direction = -1 if direction < 0 else 1
+    effective_filter = query_filter
+
+    if cursor:
+        value, last_id, is_array = decode_cursor(cursor, sort_field)
+        keyset = _keyset_filter(sort_field, direction, value, last_id, is_array)
+        effective_filter = {"$and": [query_filter, keyset]} if query_filter else keyset
+
+    # Buscar um item a mais para saber se existe próxima página
+    query_projection = projection
+    if projection is not None:
+        # O campo de ordenação é necessário para montar o próximo cursor
+        query_projection = {**projection, sort_field: 1}
+
+    sort = [(sort_field, direction), ("_id", direction)]
+    items_list = await collection.find(effective_filter, query_projection).sort(sort).limit(size + 1).to_list(length=None)
+
+    has_next = len(items_list) > size
+    items_list = items_list[:size]
+
+    next_cursor = None
+    if has_next and items_list:
+        last = items_list[-1]
+        key, is_array = _sort_key(last.get(sort_field), direction)
+        next_cursor = encode_cursor(sort_field, key, last["_id"], is_array)
+
+    # Converter ObjectId para string
+    for item in items_list:
+        if '_id' in item and isinstance(item['_id'], ObjectId):
+            item['_id'] = str(item['_id'])
+
+    if not validate:
+        if projection is not None and sort_field not in projection:
+            for item in items_list:
+                item.pop(sort_field, None)
+        return {
+            "items": trusted_items(items_list, projection),
+            "size": size,
+            "next_cursor": next_cursor,
+        }
+
+    return CursorPage(
+        items=[model_class.model_validate(item) for item in items_list],
+        size=size,
+        next_cursor=next_cursor,
+    )
@@ -0,0 +1,88 @@
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, create_model
+
+
+def model_fields_by_alias(model_class: Type[BaseModel]) -> Dict[str, str]:
+    """
+    Mapeia o nome público (alias) de cada campo do modelo para o nome do atributo.
+
+    Args:
+        model_class: Classe do modelo Pydantic
+
+    Returns:
+        dict: {alias: nome do atributo}, ex.: {"_id": "id", "cidade": "cidade"}
+    """
+    return {(field.alias or name): name for name, field in model_class.model_fields.items()}
+
+
+def parse_fields(fields: Optional[str], model_class: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    Interpreta o parâmetro ``fields`` (nomes separados por vírgula).
+
+    Args:
+        fields: Valor do parâmetro, ex.: "nome_evento,cidade,datas_realizacao"
+        model_class: Modelo cujos campos podem ser selecionados
+
+    Returns:
+        tuple: Campos selecionados (sempre com "_id"), ordenados, ou None se
+        nenhum campo foi informado
+
+    Raises:
+        ValueError: Se algum campo não existir no modelo
+    """
+    if not fields:
+        return None
+
+    allowed = model_fields_by_alias(model_class)
+    selected = {"_id"}
+    for field in fields.split(","):
+        field = field.strip()
+        if not field:
+            continue
+        if field == "id":
+            field = "_id"
+        if field not in allowed:
+            raise ValueError(f"Campo inválido em fields: {field}")
+        selected.add(field)
+
+    return tuple(sorted(selected))
+
+
+def build_projection(campos: Optional[Tuple[str, ...]]) -> Optional[Dict[str, int]]:
+    """Converte os campos selecionados em uma projeção do MongoDB."""
+    if not campos:
+        return None
+    return {campo: 1 for campo in campos}
+
+
+@lru_cache(maxsize=128)
+def partial_model(model_class: Type[BaseModel], campos: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    Cria (e memoriza) um modelo contendo apenas os campos projetados.
+
+    Args:
+        model_class: Modelo completo
+        campos: Campos selecionados (aliases)
+
+    Returns:
+        Type[BaseModel]: Modelo parcial com a mesma configuração do original
+    """
+    by_alias = model_fields_by_alias(model_class)
+    definitions = {}
+    for campo in campos:
+        name = by_alias[campo]
+        field = model_class.model_fields[name]
+        definitions[name] = (field.annotation, field)
+
+    return create_model(
+        f"{model_class.__name__}Parcial",
+        __config__=model_class.model_config,
+        **definitions
+    )
+
+
+def list_fields(model_class: Type[BaseModel]) -> List[str]:
+    """Lista os campos selecionáveis de um modelo (para documentação)."""
+    return sorted(model_fields_by_alias(model_class))
@@ -0,0 +1,97 @@
+"""
+Normalização e termos de busca por nome de evento.
+
+Os termos são gravados junto ao documento (``termos_busca``) para que a busca
+use um índice multikey em vez de uma expressão regular sobre todos os nomes.
+Este módulo não depende da API e também é usado pelos scripts de coleta.
+"""
+import re
+import unicodedata
+from typing import Any, Dict, List
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Remove acentos, converte para minúsculas e troca pontuação por espaços.
+
+    Args:
+        text: Texto original (ex.: "João Pessoa Run")
+
+    Returns:
+        str: Texto normalizado (ex.: "joao pessoa run")
+    """
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", text)
+    folded = "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+    return _NON_ALNUM.sub(" ", folded).strip()
+
+
+def search_terms(text: str) -> List[str]:
+    """
+    Gera os termos indexáveis de um texto: todos os prefixos de cada palavra,
+    permitindo buscar "joa" ou "pess" em "João Pessoa".
+
+    Args:
+        text: Texto original
+
+    Returns:
+        list: Termos únicos, em ordem de aparição
+    """
+    terms = {}
+    for word in normalize_text(text).split():
+        for size in range(1, len(word) + 1):
+            terms.setdefault(word[:size], None)
+    return list(terms)
+
+
+def query_terms(query: str) -> List[str]:
+    """Retorna as palavras normalizadas (sem repetição) de uma busca."""
+    return list(dict.fromkeys(normalize_text(query).split()))
+
+
+def build_search_fields(nome_evento: str) -> Dict[str, Any]:
+    """
+    Campos de busca gravados em cada evento.
+
+    Args:
+        nome_evento: Nome do evento
+
+    Returns:
+        dict: ``termos_busca`` e ``nome_normalizado``
+    """
+    return {
+        "termos_busca": search_terms(nome_evento),
+        "nome_normalizado": normalize_text(nome_evento),
+    }
+
+
+def relevance_expression(query: str) -> Dict[str, Any]:
+    """
+    Expressão de agregação que pontua a relevância de um evento para a busca.
+
+    Nome idêntico vale mais que nome iniciado pela busca, que vale mais que
+    nome contendo a busca; cada palavra completa encontrada soma um ponto.
+
+    Args:
+        query: Texto buscado
+
+    Returns:
+        dict: Expressão para uso em ``$addFields``
+    """
+    normalized = re.escape(normalize_text(query))
+
+    def matches(regex: str) -> Dict[str, Any]:
+        return {"$regexMatch": {"input": {"$ifNull": ["$nome_normalizado", ""]}, "regex": regex}}
+
+    parts: List[Any] = [
+        {"$cond": [matches(f"^{normalized}$"), 4, 0]},
+        {"$cond": [matches(f"^{normalized}"), 2, 0]},
+        {"$cond": [matches(normalized), 1, 0]},
+    ]
+    for word in query_terms(query):
+        parts.append({"$cond": [matches(f"(^| ){re.escape(word)}( |$)"), 1, 0]})
+
+    return {"$add": parts}
@@ -0,0 +1,251 @@
+"""
+Benchmark da API de eventos.
+
+Carrega N eventos sintéticos em um MongoDB local (ou no mongomock, em
+memória) e dispara requisições concorrentes pela aplicação ASGI, sem rede,
+medindo latência (p50/p99) e vazão de cada cenário.
+
+    python -m benchmarks.api_bench                               # mongod em localhost
+    python -m benchmarks.api_bench --sizes 1000,100000,1000000 --concurrency 16
+    python -m benchmarks.api_bench --mock --sizes 1000,10000     # sem mongod
+
+Os resultados são gravados em JSON (por padrão em benchmarks/resultados/)
+para comparação entre commits.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from app.core.cache import Cache
+from app.core.config import settings
+from app.core.database import Database
+from app.core.indexes import ensure_indexes
+from benchmarks.gerador import CIDADES, gerar_eventos, lotes
+
+logger = logging.getLogger(__name__)
+
+BENCH_DB_NAME = "correpb_benchmark"
+INSERT_BATCH_SIZE = 10000
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "resultados")
+
+
+def _percentil(valores: List[float], p: float) -> float:
+    """Percentil por interpolação linear (valores já ordenados)."""
+    if not valores:
+        return 0.0
+    posicao = (len(valores) - 1) * p
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(valores) - 1)
+    return valores[inferior] + (valores[superior] - valores[inferior]) * (posicao - inferior)
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+async def conectar(mongo_uri: str, mock: bool):
+    """Aponta o ``Database`` da aplicação para o banco do benchmark."""
+    if mock:
+        try:
+            from mongomock_motor import AsyncMongoMockClient
+        except ImportError:
+            sys.exit("--mock exige o pacote mongomock-motor (pip install -r benchmarks/requirements.txt)")
+        Database.client = AsyncMongoMockClient()
+        Database.db = Database.client[BENCH_DB_NAME]
+        return
+
+    settings.MONGODB_URI = mongo_uri
+    settings.MONGODB_DB_NAME = BENCH_DB_NAME
+    # Os índices são criados depois da carga, que fica mais rápida sem eles
+    settings.MONGODB_ENSURE_INDEXES = False
+    await Database.connect()
+
+
+async def carregar(quantidade: int, seed: int) -> List[str]:
+    """
+    Recria a coleção de eventos com ``quantidade`` eventos sintéticos.
+
+    Returns:
+        list: Amostra de IDs para o cenário de busca por ID
+    """
+    collection = await Database.get_collection("eventos")
+    await collection.drop()
+
+    inicio = time.perf_counter()
+    for lote in lotes(gerar_eventos(quantidade, seed), INSERT_BATCH_SIZE):
+        await collection.insert_many(lote, ordered=False)
+    await ensure_indexes(Database.db)
+    print(f"  {quantidade} eventos carregados em {time.perf_counter() - inicio:.1f} s")
+
+    await Cache.invalidate("eventos")
+    ids = await collection.find({}, {"_id": 1}).limit(1000).to_list(length=None)
+    return [str(evento["_id"]) for evento in ids]
+
+
+def cenarios(quantidade: int, ids: List[str]) -> Dict[str, Callable[[random.Random], str]]:
+    """URLs de cada cenário, sorteadas a cada requisição."""
+    paginas = max(1, min(50, quantidade // 20))
+    cidades = [cidade for cidade, *_ in CIDADES]
+
+    def filtro(rng: random.Random) -> str:
+        sorteio = rng.random()
+        if sorteio < 0.25:
+            return "&estado=PB"
+        if sorteio < 0.45:
+            return f"&cidade={rng.choice(cidades)}"
+        if sorteio < 0.6:
+            return "&status=pendentes"
+        return ""
+
+    return {
+        "listar_eventos": lambda rng: f"/api/v1/eventos/?page={rng.randint(1, paginas)}&size=20{filtro(rng)}",
+        # /sem-paginacao só aceita limit e fields: sem variação de filtros
+        "sem_paginacao": lambda rng: "/api/v1/eventos/sem-paginacao?limit=100",
+        "por_id": lambda rng: f"/api/v1/eventos/{rng.choice(ids)}",
+    }
+
+
+async def executar_cenario(
+        client: httpx.AsyncClient,
+        url: Callable[[random.Random], str],
+        requisicoes: int,
+        concorrencia: int,
+        seed: int
+) -> Dict[str, Any]:
+    """
+    Executa ``requisicoes`` requisições com ``concorrencia`` clientes simultâneos.
+
+    Returns:
+        dict: Latências (ms), vazão (req/s) e erros
+    """
+    rng = random.Random(seed)
+    urls = [url(rng) for _ in range(requisicoes)]
+    latencias: List[float] = []
+    erros = 0
+    proxima = 0
+
+    async def cliente():
+        nonlocal erros, proxima
+        while proxima < len(urls):
+            atual = urls[proxima]
+            proxima += 1
+            inicio = time.perf_counter()
+            resposta = await client.get(atual)
+            latencias.append((time.perf_counter() - inicio) * 1000)
+            if resposta.status_code >= 400:
+                erros += 1
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente() for _ in range(concorrencia)))
+    duracao = time.perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        "requisicoes": len(latencias),
+        "erros": erros,
+        "p50_ms": round(_percentil(latencias, 0.5), 3),
+        "p99_ms": round(_percentil(latencias, 0.99), 3),
+        "media_ms": round(statistics.fmean(latencias), 3) if latencias else 0.0,
+        "req_s": round(len(latencias) / duracao, 1) if duracao else 0.0,
+    }
+
+
+async def main(args: argparse.Namespace):
+    # Sem cache, cada requisição exercita a consulta (o objetivo é medir regressões)
+    settings.CACHE_ENABLED = args.cache
+    # A aplicação é importada depois de ajustar as configurações
+    from main import app
+    # O log de cada requisição do cliente httpx não faz parte do que é medido
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    await conectar(args.mongo_uri, args.mock)
+    transport = httpx.ASGITransport(app=app)
+
+    resultados = []
+    for quantidade in args.sizes:
+        if args.mock and quantidade > 100_000:
+            print(f"Aviso: {quantidade} eventos no mongomock exigem muita memória e tempo")
+        print(f"Base com {quantidade} eventos")
+        ids = await carregar(quantidade, args.seed)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            for nome, url in cenarios(quantidade, ids).items():
+                if args.scenarios and nome not in args.scenarios:
+                    continue
+                # Aquecimento (não medido)
+                await executar_cenario(client, url, min(50, args.requests), args.concurrency, args.seed + 1)
+                resultado = await executar_cenario(client, url, args.requests, args.concurrency, args.seed)
+                resultado.update({"documentos": quantidade, "cenario": nome})
+                resultados.append(resultado)
+                print(
+                    f"  {nome:<15} p50 {resultado['p50_ms']:>9.2f} ms  p99 {resultado['p99_ms']:>9.2f} ms  "
+                    f"{resultado['req_s']:>8.1f} req/s  erros {resultado['erros']}"
+                )
+
+    relatorio = {
+        "executado_em": datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "configuracao": {
+            "banco": "mongomock" if args.mock else "mongod",
+            "concorrencia": args.concurrency,
+            "requisicoes": args.requests,
+            "cache": args.cache,
+            "seed": args.seed,
+            "pagination_engine": settings.PAGINATION_ENGINE,
+            "trusted_reads": settings.TRUSTED_READS,
+        },
+        "resultados": resultados,
+    }
+
+    saida = args.output or os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(saida)), exist_ok=True)
+    with open(saida, "w", encoding="utf-8") as arquivo:
+        json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+    print(f"Resultados gravados em {saida}")
+
+    if not args.keep:
+        collection = await Database.get_collection("eventos")
+        await collection.drop()
+    await Database.close()
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark da API de eventos")
+    parser.add_argument("--sizes", default="1000,100000,1000000",
+                        type=lambda valor: [int(parte) for parte in valor.split(",")],
+                        help="Quantidades de eventos, separadas por vírgula")
+    parser.add_argument("--requests", type=int, default=500, help="Requisições por cenário")
+    parser.add_argument("--concurrency", type=int, default=10, help="Clientes simultâneos")
+    parser.add_argument("--scenarios", type=lambda valor: valor.split(","), default=None,
+                        help="Cenários a executar (listar_eventos,sem_paginacao,por_id)")
+    parser.add_argument("--mongo-uri", default=os.getenv("BENCH_MONGODB_URI", "mongodb://localhost:27017"),
+                        help=f"MongoDB local; usa o banco {BENCH_DB_NAME}, que é recriado")
+    parser.add_argument("--mock", action="store_true", help="Usa o mongomock em memória em vez de um mongod")
+    parser.add_argument("--cache", action="store_true", help="Mantém o cache da aplicação ligado")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Arquivo JSON de resultados")
+    parser.add_argument("--keep", action="store_true", help="Não apaga os eventos do benchmark ao final")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(_parse_args()))
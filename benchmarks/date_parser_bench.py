@@ -0,0 +1,112 @@
+"""
+Benchmark do parser de datas (``app.utils.date_utils.parse_dates``).
+
+Gera linhas de data nos formatos publicados pelos sites e mede a vazão do
+parser com a memoização (caso real: as mesmas datas se repetem entre os
+eventos) e sem ela, comparando com a interpretação anterior do
+``EventoDeCorrida.from_csv_row`` (só o formato "02 e 03 de Agosto de 2025").
+
+    python -m benchmarks.date_parser_bench --rows 300000
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from app.utils.date_utils import InvalidDateError, _parse, parse_dates
+
+MESES_EXTENSO = [
+    "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+    "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro",
+]
+
+
+def gerar_linhas(quantidade: int, seed: int = 42) -> List[str]:
+    """Textos de data em formatos variados (extenso, dd/mm/aaaa, intervalos, abreviados)."""
+    rng = random.Random(seed)
+    inicio = datetime(2024, 1, 1)
+    linhas = []
+    for _ in range(quantidade):
+        data = inicio + timedelta(days=rng.randint(0, 3 * 365))
+        mes = MESES_EXTENSO[data.month - 1]
+        formato = rng.random()
+        if formato < 0.4:
+            linhas.append(f"{data.day:02d} de {mes} de {data.year}")
+        elif formato < 0.6:
+            linhas.append(f"{data:%d/%m/%Y}")
+        elif formato < 0.9:
+            # Eventos de vários dias, no mesmo mês
+            dia = min(data.day, 25)
+            if formato < 0.75:
+                linhas.append(f"{dia:02d} e {dia + 1:02d} de {mes} de {data.year}")
+            else:
+                linhas.append(f"{dia} a {dia + rng.randint(1, 3)} de {mes} de {data.year}")
+        else:
+            linhas.append(f"{data.day} {mes[:3].lower()}. {data.year}")
+    return linhas
+
+
+def _parser_anterior(data_str: str) -> List[datetime]:
+    """Interpretação feita antes por ``from_csv_row``, para comparação."""
+    datas_realizacao = []
+    try:
+        meses = {
+            'janeiro': 1, 'fevereiro': 2, 'março': 3, 'abril': 4, 'maio': 5, 'junho': 6,
+            'julho': 7, 'agosto': 8, 'setembro': 9, 'outubro': 10, 'novembro': 11, 'dezembro': 12
+        }
+        data_str = data_str.lower().replace('  ', ' ').replace(' e ', ', ')
+        partes = data_str.split(' de ')
+        if len(partes) == 3:
+            dias = [d.strip() for d in partes[0].split(',')]
+            mes = meses[partes[1].strip()]
+            ano = int(partes[2])
+            for dia in dias:
+                try:
+                    datas_realizacao.append(datetime(ano, mes, int(dia)))
+                except Exception:
+                    continue
+    except Exception:
+        pass
+    return datas_realizacao
+
+
+def medir(nome: str, parser: Callable[[str], List[datetime]], linhas: List[str], antes: Callable[[], None] = None):
+    """Executa ``parser`` em todas as linhas e imprime vazão e linhas não reconhecidas."""
+    if antes:
+        antes()
+    vazias = 0
+    inicio = time.perf_counter()
+    for linha in linhas:
+        try:
+            if not parser(linha):
+                vazias += 1
+        except InvalidDateError:
+            vazias += 1
+    duracao = time.perf_counter() - inicio
+    print(
+        f"  {nome:<28} {duracao:>7.3f} s  {len(linhas) / duracao:>11,.0f} linhas/s  "
+        f"não reconhecidas: {vazias}"
+    )
+
+
+def main(args: argparse.Namespace):
+    linhas = gerar_linhas(args.rows, args.seed)
+    print(f"{len(linhas)} linhas, {len(set(linhas))} textos distintos")
+
+    medir("anterior (from_csv_row)", _parser_anterior, linhas)
+    medir("parse_dates sem cache", lambda linha: _parse.__wrapped__(" ".join(linha.split())), linhas)
+    medir("parse_dates com cache", parse_dates, linhas, antes=_parse.cache_clear)
+    info = _parse.cache_info()
+    print(f"  cache: {info.hits} acertos, {info.misses} faltas, {info.currsize}/{info.maxsize} itens")
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark do parser de datas")
+    parser.add_argument("--rows", type=int, default=300000, help="Quantidade de linhas de data")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main(_parse_args())
@@ -0,0 +1,96 @@
+"""
+Gerador de eventos sintéticos com o formato de ``EventoDeCorrida.to_dict``.
+
+Os dados são determinísticos para uma mesma semente, para que execuções de
+benchmark em máquinas e commits diferentes sejam comparáveis.
+"""
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List
+
+from app.utils.date_utils import build_date_fields
+from app.utils.distance_utils import build_distance_fields
+from app.utils.search_utils import build_search_fields
+
+CIDADES = [
+    ("João Pessoa", "PB", 30), ("Campina Grande", "PB", 15), ("Patos", "PB", 5), ("Sousa", "PB", 3),
+    ("Cabedelo", "PB", 4), ("Bayeux", "PB", 2), ("Santa Rita", "PB", 2), ("Guarabira", "PB", 2),
+    ("Cajazeiras", "PB", 2), ("Conde", "PB", 2), ("Recife", "PE", 8), ("Olinda", "PE", 2),
+    ("Caruaru", "PE", 2), ("Natal", "RN", 6), ("Mossoró", "RN", 2), ("Fortaleza", "CE", 5),
+]
+PREFIXOS = ["Corrida", "Night Run", "Meia Maratona", "Maratona", "Circuito", "Desafio", "Run", "Trail", "Corrida Solidária"]
+TEMAS = ["do Sol", "das Águas", "da Independência", "de Natal", "do Servidor", "Pink", "Kids", "da Família", "do Trabalhador", "Noturna"]
+DISTANCIAS = ["3km, 5km", "5km, 10km", "5km (corrida), 3km (caminhada)", "21km", "10km, 21,1km", "42km", "5km", "6km, 12km", "50km (ultra)", ""]
+ORGANIZADORES = ["Assessoria Corre Mais", "Prefeitura Municipal", "Sesc", "Federação de Atletismo", "Clube de Corredores", "Run Eventos"]
+SITES = ["brasilcorrida", "brasilquecorre"]
+FAIXAS_ETARIAS = ["16-19", "20-24", "25-29", "30-34", "35-39", "40-44", "45-49", "50-54", "55-59", "60-64", "65+"]
+
+
+def _categorias(rng: random.Random) -> str:
+    """Texto longo de categorias premiadas, como nos editais."""
+    partes = ["Geral masculino e feminino: 1º ao 5º lugar com troféu"]
+    for faixa in rng.sample(FAIXAS_ETARIAS, rng.randint(4, len(FAIXAS_ETARIAS))):
+        partes.append(f"Faixa etária {faixa} anos masculino e feminino: 1º ao 3º lugar com medalha")
+    if rng.random() < 0.4:
+        partes.append("PCD, equipes com maior número de inscritos e atleta local mais bem colocado")
+    return "; ".join(partes)
+
+
+def gerar_evento(indice: int, rng: random.Random, inicio: datetime) -> Dict[str, Any]:
+    """
+    Gera um evento sintético.
+
+    Args:
+        indice: Posição do evento (mantém os nomes únicos)
+        rng: Gerador aleatório
+        inicio: Data inicial do período dos eventos
+
+    Returns:
+        dict: Documento no formato gravado na coleção ``eventos``
+    """
+    cidade, estado, _ = rng.choices(CIDADES, weights=[peso for *_, peso in CIDADES])[0]
+    primeira = inicio + timedelta(days=rng.randint(0, 5 * 365), hours=rng.choice([5, 6, 7, 17, 19]))
+    datas = [primeira + timedelta(days=dia) for dia in range(rng.choice([1, 1, 1, 2, 3]))]
+    nome = f"{rng.choice(PREFIXOS)} {rng.choice(TEMAS)} {cidade} {indice}"
+    coleta = primeira - timedelta(days=rng.randint(10, 120))
+
+    evento = {
+        "nome_evento": nome,
+        "datas_realizacao": datas,
+        "cidade": cidade,
+        "estado": estado,
+        "organizador": rng.choice(ORGANIZADORES),
+        "distancias": rng.choice(DISTANCIAS),
+        "url_inscricao": f"https://inscricoes.example.com/evento/{indice}",
+        "url_imagem": f"https://imagens.example.com/evento/{indice}.jpg",
+        "categorias_premiadas": _categorias(rng),
+        "site_coleta": rng.choice(SITES),
+        "data_coleta": coleta,
+        "importado_em": coleta,
+        "atualizado_em": coleta,
+        "origem": "benchmark",
+        "ativo": True,
+    }
+    evento.update(build_search_fields(nome))
+    evento.update(build_date_fields(datas))
+    evento.update(build_distance_fields(evento["distancias"]))
+    return evento
+
+
+def gerar_eventos(quantidade: int, seed: int = 42, inicio: datetime = datetime(2023, 1, 1)) -> Iterator[Dict[str, Any]]:
+    """Gera ``quantidade`` eventos sintéticos, de forma determinística."""
+    rng = random.Random(seed)
+    for indice in range(quantidade):
+        yield gerar_evento(indice, rng, inicio)
+
+
+def lotes(eventos: Iterator[Dict[str, Any]], tamanho: int) -> Iterator[List[Dict[str, Any]]]:
+    """Agrupa os eventos em listas de até ``tamanho`` itens."""
+    lote = []
+    for evento in eventos:
+        lote.append(evento)
+        if len(lote) >= tamanho:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
@@ -0,0 +1,322 @@
+"""
+Verificação dos planos de consulta da listagem de eventos.
+
+Carrega eventos sintéticos em um MongoDB local, cria os índices declarados e
+executa ``explain("executionStats")`` das consultas que a listagem realmente
+faz (o find ou a agregação do ``PAGINATION_ENGINE``, a busca por relevância e
+o count do total) para cada combinação suportada de filtros (estado, cidade,
+nome_evento, status, período e distância) e ordenação
+(``ORDENACOES_PERMITIDAS`` x crescente/decrescente). Termina com código 1 se
+algum plano tiver COLLSCAN, SORT em memória ou examinar documentos demais
+em relação aos retornados. O total exato sem filtros é a exceção: ele conta
+todos os eventos ativos e o COLLSCAN é só reportado (``total=estimado`` usa
+os metadados da coleção).
+
+    python -m benchmarks.query_plans
+    python -m benchmarks.query_plans --engine facet --size 50000 --max-ratio 3 --output planos.json
+    python -m benchmarks.query_plans --inmemory
+
+Exige um mongod (o mongomock não implementa explain); com ``--inmemory`` um
+mongod temporário é iniciado pelo pacote pymongo_inmemory.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+from datetime import date
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+from fastapi_pagination import Params
+
+from app.api.eventos import _campo_ordenacao, _construir_filtro
+from app.core.config import settings
+from app.core.database import Database
+from app.core.indexes import ORDENACOES_PERMITIDAS, ensure_indexes
+from app.services.evento_service import EventoService
+from app.utils.pagination_utils import _unfiltered, counts_in_pipeline, facet_page_pipeline
+from app.utils.search_utils import relevance_expression
+from benchmarks.gerador import gerar_eventos, lotes
+
+PLANS_DB_NAME = "correpb_query_plans"
+INSERT_BATCH_SIZE = 10000
+ENGINES = ("find", "facet")
+
+# Valores usados em cada filtro (coerentes entre si, para que as combinações retornem eventos)
+VALORES_FILTROS = {
+    "estado": ["PB"],
+    "cidade": ["João Pessoa"],
+    "nome_evento": ["corrida"],
+    "status": ["pendentes", "realizados"],
+    "data_inicio": [date(2024, 1, 1)],
+    "data_fim": [date(2024, 6, 30)],
+    "distancia_min": [10],
+    "distancia_max": [21],
+}
+
+
+def combinacoes() -> Iterator[Tuple[Dict[str, Any], str, int]]:
+    """
+    Enumera as combinações de filtros e ordenação aceitas pela listagem.
+
+    Com ``nome_evento`` os resultados são ordenados primeiro pela relevância
+    (calculada na agregação), por isso essas combinações usam só a ordenação
+    padrão da API.
+
+    Yields:
+        tuple: (parâmetros de filtro, campo de ordenação, direção)
+    """
+    nomes = list(VALORES_FILTROS)
+    for quantidade in range(len(nomes) + 1):
+        for escolhidos in itertools.combinations(nomes, quantidade):
+            for valores in itertools.product(*(VALORES_FILTROS[nome] for nome in escolhidos)):
+                parametros = dict(zip(escolhidos, valores))
+                if "nome_evento" in parametros:
+                    yield parametros, "datas_realizacao", -1
+                    continue
+                for campo in ORDENACOES_PERMITIDAS:
+                    for direcao in (1, -1):
+                        yield parametros, campo, direcao
+
+
+def consultas(
+        parametros: Dict[str, Any],
+        campo: str,
+        direcao: int,
+        engine: str,
+        page_size: int
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Comandos executados pela listagem (``EventoService.listar_eventos``, com
+    total exato) para a primeira página de uma combinação.
+
+    Returns:
+        list: (consulta, comando) da página e, se contado à parte, do total
+    """
+    filtro = _construir_filtro(**parametros)
+    ordenacao = {_campo_ordenacao(campo, direcao): direcao}
+    busca = parametros.get("nome_evento")
+    score = relevance_expression(busca) if busca else None
+    projecao = EventoService._projecao(None)
+
+    contar_no_facet = False
+    if engine == "facet" or score is not None:
+        contar_no_facet = counts_in_pipeline(filtro, "exato", score)
+        pipeline = facet_page_pipeline(filtro, ordenacao, 0, page_size, score, projecao, count=contar_no_facet)
+        pagina = {"aggregate": "eventos", "pipeline": pipeline, "cursor": {}, "allowDiskUse": True}
+    else:
+        pagina = {"find": "eventos", "filter": filtro, "sort": ordenacao, "limit": page_size}
+        if projecao is not None:
+            pagina["projection"] = projecao
+
+    comandos = [("pagina", pagina)]
+    if not contar_no_facet:
+        # Mesma agregação enviada por count_documents
+        comandos.append(("total", {
+            "aggregate": "eventos",
+            "pipeline": [{"$match": filtro}, {"$group": {"_id": 1, "n": {"$sum": 1}}}],
+            "cursor": {},
+        }))
+    return comandos
+
+
+def _estagios(plano: Dict[str, Any]) -> Set[str]:
+    """Nomes de todos os estágios de um plano (inclusive ramos de $or)."""
+    estagios = {plano.get("stage", "")}
+    for filho in [plano.get("inputStage")] + list(plano.get("inputStages", [])):
+        if filho:
+            estagios |= _estagios(filho)
+    return estagios
+
+
+def _indices(plano: Dict[str, Any]) -> List[str]:
+    """Índices usados por um plano."""
+    indices = [plano["indexName"]] if "indexName" in plano else []
+    for filho in [plano.get("inputStage")] + list(plano.get("inputStages", [])):
+        if filho:
+            indices += _indices(filho)
+    return indices
+
+
+def _plano_e_estatisticas(explain: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], List[str]]:
+    """
+    Plano vencedor, estatísticas de execução e estágios de agregação que não
+    foram absorvidos pela consulta (ex.: $sort, $facet).
+    """
+    extras: List[str] = []
+    if "stages" in explain:
+        # Agregação com estágios executados fora da consulta: o primeiro é o $cursor
+        cursor = explain["stages"][0]["$cursor"]
+        extras = [next(iter(estagio)) for estagio in explain["stages"][1:]]
+    else:
+        cursor = explain
+    vencedor = cursor["queryPlanner"]["winningPlan"]
+    # Com o engine SBE o plano clássico fica em "queryPlan"
+    vencedor = vencedor.get("queryPlan", vencedor)
+    return vencedor, cursor["executionStats"], extras
+
+
+def avaliar(
+        explain: Dict[str, Any],
+        consulta: str,
+        relevancia: bool,
+        max_ratio: float,
+        sem_filtro: bool = False
+) -> Dict[str, Any]:
+    """
+    Avalia o resultado de um explain.
+
+    A consulta do total só é verificada quanto a COLLSCAN: ela lê todos os
+    documentos filtrados por definição. Sem filtros ela lê todos os eventos
+    ativos, e nenhum índice a evita: o COLLSCAN fica em ``avisos``. Na busca
+    por relevância a ordenação em memória é esperada.
+
+    Args:
+        explain: Resposta do comando explain (verbosity executionStats)
+        consulta: "pagina" ou "total"
+        relevancia: Se a página é ordenada pela relevância da busca
+        max_ratio: Razão máxima entre documentos examinados e retornados
+        sem_filtro: Se a listagem não tem filtros além de ``ACTIVE_FILTER``
+
+    Returns:
+        dict: Índices, estágios, contagens, razão e problemas encontrados
+    """
+    vencedor, stats, extras = _plano_e_estatisticas(explain)
+    estagios = _estagios(vencedor)
+    examinados = stats["totalDocsExamined"]
+    retornados = stats["nReturned"]
+    razao = examinados / max(retornados, 1)
+
+    problemas, avisos = [], []
+    if "COLLSCAN" in estagios:
+        (avisos if consulta == "total" and sem_filtro else problemas).append("COLLSCAN")
+    if consulta == "pagina" and not relevancia:
+        if "SORT" in estagios or "$sort" in extras:
+            problemas.append("SORT em memória")
+        if razao > max_ratio:
+            problemas.append(f"{examinados} documentos examinados para {retornados} retornados")
+
+    return {
+        "indices": _indices(vencedor),
+        "estagios": sorted(estagios) + extras,
+        "examinados": examinados,
+        "retornados": retornados,
+        "razao": round(razao, 2),
+        "problemas": problemas,
+        "avisos": avisos,
+    }
+
+
+async def carregar(quantidade: int, seed: int):
+    """Recria a coleção de eventos com ``quantidade`` eventos sintéticos e os índices declarados."""
+    collection = await Database.get_collection("eventos")
+    await collection.drop()
+    for lote in lotes(gerar_eventos(quantidade, seed), INSERT_BATCH_SIZE):
+        await collection.insert_many(lote, ordered=False)
+    await ensure_indexes(Database.db)
+
+
+async def verificar(max_ratio: float, engine: str, page_size: int) -> List[Dict[str, Any]]:
+    """
+    Executa o explain das consultas de cada combinação.
+
+    Returns:
+        list: Resultado de ``avaliar`` para cada consulta, com filtros e ordenação
+    """
+    db = await Database.get_database()
+    resultados = []
+    for parametros, campo, direcao in combinacoes():
+        relevancia = "nome_evento" in parametros
+        sem_filtro = _unfiltered(_construir_filtro(**parametros))
+        for consulta, comando in consultas(parametros, campo, direcao, engine, page_size):
+            explain = await db.command({"explain": comando, "verbosity": "executionStats"})
+            resultado = avaliar(explain, consulta, relevancia, max_ratio, sem_filtro)
+            resultado.update({
+                "consulta": consulta,
+                "filtros": parametros,
+                "ordenacao": f"relevancia,{campo}:{direcao}" if relevancia else f"{campo}:{direcao}",
+            })
+            resultados.append(resultado)
+    return resultados
+
+
+def _imprimir(resultados: List[Dict[str, Any]]):
+    for resultado in resultados:
+        filtros = ",".join(f"{chave}={valor}" for chave, valor in resultado["filtros"].items()) or "-"
+        situacao = "FALHA" if resultado["problemas"] else "ok"
+        print(
+            f"{situacao:<8} {resultado['consulta']:<7} {filtros:<55} {resultado['ordenacao']:<20} "
+            f"{'+'.join(resultado['indices']) or '-':<40} "
+            f"{resultado['examinados']:>7}/{resultado['retornados']:<7}"
+        )
+        for problema in resultado["problemas"]:
+            print(f"         - {problema}")
+        for aviso in resultado["avisos"]:
+            print(f"         ~ {aviso} (esperado)")
+
+
+def _iniciar_mongod_temporario():
+    """Inicia um mongod temporário com o pymongo_inmemory (baixado no primeiro uso)."""
+    try:
+        from pymongo_inmemory import Mongod
+        from pymongo_inmemory.context import Context
+    except ImportError:
+        sys.exit("--inmemory exige o pacote pymongo_inmemory (pip install -r benchmarks/requirements.txt)")
+    mongod = Mongod(Context())
+    mongod.start()
+    return mongod
+
+
+async def main(args: argparse.Namespace) -> int:
+    mongod = _iniciar_mongod_temporario() if args.inmemory else None
+    settings.MONGODB_URI = mongod.connection_string if mongod else args.mongo_uri
+    settings.MONGODB_DB_NAME = PLANS_DB_NAME
+    # Os índices são criados depois da carga
+    settings.MONGODB_ENSURE_INDEXES = False
+    try:
+        await Database.connect()
+        try:
+            print(f"Carregando {args.size} eventos em {PLANS_DB_NAME} (engine {args.engine})")
+            await carregar(args.size, args.seed)
+            resultados = await verificar(args.max_ratio, args.engine, args.page_size)
+            if not args.keep:
+                collection = await Database.get_collection("eventos")
+                await collection.drop()
+        finally:
+            await Database.close()
+    finally:
+        if mongod:
+            mongod.stop()
+
+    _imprimir(resultados)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as arquivo:
+            json.dump(resultados, arquivo, ensure_ascii=False, indent=2, default=str)
+
+    falhas = sum(1 for resultado in resultados if resultado["problemas"])
+    print(f"{len(resultados)} consultas verificadas, {falhas} com problemas")
+    return 1 if falhas else 0
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Verifica os planos de consulta da listagem de eventos")
+    parser.add_argument("--size", type=int, default=20000, help="Quantidade de eventos sintéticos")
+    parser.add_argument("--max-ratio", type=float, default=5.0,
+                        help="Razão máxima entre documentos examinados e retornados")
+    parser.add_argument("--mongo-uri", default=os.getenv("BENCH_MONGODB_URI", "mongodb://localhost:27017"),
+                        help=f"MongoDB local; usa o banco {PLANS_DB_NAME}, que é recriado")
+    parser.add_argument("--inmemory", action="store_true",
+                        help="Inicia um mongod temporário com o pymongo_inmemory em vez de usar --mongo-uri")
+    parser.add_argument("--engine", choices=ENGINES, default=settings.PAGINATION_ENGINE,
+                        help="Engine de paginação verificado (padrão: PAGINATION_ENGINE)")
+    parser.add_argument("--page-size", type=int, default=Params().size, help="Tamanho da página consultada")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Arquivo JSON com o resultado de cada combinação")
+    parser.add_argument("--keep", action="store_true", help="Não apaga os eventos ao final")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(_parse_args())))
@@ -1,8 +1,51 @@
+import hashlib
+import json
+import os
+import sys
 from datetime import datetime
 from typing import List, Optional
 
 from bson import ObjectId
 
+# Permite reutilizar os utilitários puros da API (app/utils) nos scripts de coleta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.date_utils import InvalidDateError, build_date_fields, parse_dates
+from app.utils.distance_utils import build_distance_fields
+from app.utils.search_utils import build_search_fields
+
+# Campos que não descrevem o evento e ficam fora do hash de conteúdo
+CAMPOS_FORA_DO_HASH = ('data_coleta', 'conteudo_hash')
+
+
+def _valor_canonico(valor):
+    """Serializa datas no JSON do hash de conteúdo."""
+    if isinstance(valor, datetime):
+        return valor.isoformat()
+    raise TypeError(f"Tipo não serializável no hash de conteúdo: {type(valor).__name__}")
+
+
+def content_hash(documento: dict) -> str:
+    """
+    Hash estável do conteúdo de um evento.
+
+    O documento é serializado em JSON com as chaves ordenadas e as datas de
+    realização em ordem crescente, ignorando ``CAMPOS_FORA_DO_HASH``; dois
+    documentos com o mesmo conteúdo têm sempre o mesmo hash.
+
+    Args:
+        documento: Documento do evento (``EventoDeCorrida.to_dict``)
+
+    Returns:
+        str: SHA-256 em hexadecimal
+    """
+    conteudo = {campo: valor for campo, valor in documento.items() if campo not in CAMPOS_FORA_DO_HASH}
+    conteudo['datas_realizacao'] = sorted(conteudo.get('datas_realizacao') or [])
+    serializado = json.dumps(
+        conteudo, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=_valor_canonico
+    )
+    return hashlib.sha256(serializado.encode('utf-8')).hexdigest()
+
 
 class EventoDeCorrida:
     def __init__(
@@ -40,8 +83,24 @@ class EventoDeCorrida:
         self.link_edital = link_edital
         self.categorias_premiadas = categorias_premiadas
 
+    def __setattr__(self, nome, valor):
+        # Alterar o conteúdo descarta o hash calculado (ver conteudo_hash)
+        if nome not in CAMPOS_FORA_DO_HASH and nome not in ('_id', '_conteudo_hash'):
+            object.__setattr__(self, '_conteudo_hash', None)
+        object.__setattr__(self, nome, valor)
+
     def to_dict(self) -> dict:
         """Converte o objeto para um dicionário compatível com MongoDB"""
+        documento = self._documento()
+        if self._conteudo_hash is None:
+            self._conteudo_hash = content_hash(documento)
+        # Hash do conteúdo (inclusive campos derivados), usado pela sincronização
+        # para detectar alterações sem comparar campo a campo
+        documento['conteudo_hash'] = self._conteudo_hash
+        return documento
+
+    def _documento(self) -> dict:
+        """Documento do evento, sem o hash de conteúdo"""
         documento = {
             'nome_evento': self.nome_evento,
             'datas_realizacao': self.datas_realizacao,
@@ -53,6 +112,13 @@ class EventoDeCorrida:
             'distancias': self.distancias
         }
 
+        # Termos de busca sem acentos usados pelo índice de busca da API
+        documento.update(build_search_fields(self.nome_evento))
+        # Primeira e última data, usadas nos filtros e na ordenação por data
+        documento.update(build_date_fields(self.datas_realizacao))
+        # Distâncias em km e modalidades, usadas nos filtros e nas estatísticas
+        documento.update(build_distance_fields(self.distancias))
+
         # Adiciona campos opcionais apenas se não forem None ou vazios
         if self.url_inscricao and self.url_inscricao.strip():
             documento['url_inscricao'] = self.url_inscricao
@@ -67,31 +133,22 @@ class EventoDeCorrida:
 
         return documento
 
+    @property
+    def conteudo_hash(self) -> str:
+        """
+        Hash do conteúdo do evento (ver ``content_hash``), calculado uma única
+        vez e reaproveitado por ``to_dict`` e ``__eq__``. Atribuir um campo
+        descarta o valor calculado; listas não devem ser alteradas no lugar.
+        """
+        if self._conteudo_hash is None:
+            self._conteudo_hash = content_hash(self._documento())
+        return self._conteudo_hash
+
     def __eq__(self, other):
-        """Compara dois eventos, ignorando campos específicos"""
+        """Compara dois eventos pelo hash de conteúdo (ignora data_coleta e _id)"""
         if not isinstance(other, EventoDeCorrida):
             return False
-            
-        # Campos a serem comparados
-        campos_comparacao = [
-            'nome_evento', 'datas_realizacao', 'cidade', 'estado',
-            'organizador', 'site_coleta', 'distancias', 'url_inscricao',
-            'url_imagem', 'categoria'
-        ]
-        
-        # Compara cada campo
-        for campo in campos_comparacao:
-            valor_self = getattr(self, campo)
-            valor_other = getattr(other, campo)
-            
-            # Trata listas de forma especial
-            if isinstance(valor_self, list) and isinstance(valor_other, list):
-                if sorted(valor_self) != sorted(valor_other):
-                    return False
-            elif valor_self != valor_other:
-                return False
-                
-        return True
+        return self.conteudo_hash == other.conteudo_hash
 
     @classmethod
     def from_csv_row(cls, row: dict, fonte: str) -> 'EventoDeCorrida':
@@ -101,31 +158,12 @@ class EventoDeCorrida:
             value = row.get(key, '')
             return value if value and value.strip() else ''
 
-        # Converter datas para lista de datetime
+        # Converter datas para lista de datetime (lista vazia se não reconhecida)
         data_str = get_value('Data')
-        datas_realizacao = []
-        if data_str:
-            try:
-                meses = {
-                    'janeiro': 1, 'fevereiro': 2, 'março': 3, 'abril': 4, 'maio': 5, 'junho': 6,
-                    'julho': 7, 'agosto': 8, 'setembro': 9, 'outubro': 10, 'novembro': 11, 'dezembro': 12
-                }
-                # Exemplo: '02, 03 e 15 de Agosto de 2025'
-                data_str = data_str.lower().replace('  ', ' ').replace(' e ', ', ')
-                partes = data_str.split(' de ')
-                if len(partes) == 3:
-                    dias = [d.strip() for d in partes[0].split(',')]
-                    mes = meses[partes[1].strip()]
-                    ano = int(partes[2])
-                    for dia in dias:
-                        try:
-                            datas_realizacao.append(datetime(ano, mes, int(dia)))
-                        except Exception:
-                            continue
-            except Exception:
-                pass
-        # Se não conseguiu converter, salva lista vazia
-        if not datas_realizacao:
+        try:
+            datas_realizacao = parse_dates(data_str)
+        except InvalidDateError as e:
+            print(f"⚠️ {get_value('Nome do Evento')}: {e}")
             datas_realizacao = []
 
         link_edital = get_value('link_edital') or get_value('Link do Edital')
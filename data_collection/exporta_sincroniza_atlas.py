@@ -1,9 +1,12 @@
 import csv
 import os
+import time
+from datetime import datetime
 
 from dotenv import load_dotenv
 from evento_de_corrida import EventoDeCorrida
-from pymongo import MongoClient
+from pymongo import InsertOne, MongoClient, ReturnDocument, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError
 
 # Carregar o .env da raiz do projeto
 env_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '.env'))
@@ -17,51 +20,193 @@ remote_client = MongoClient(REMOTE_URI)
 remote_db = remote_client['corridas_db']
 remote_collection = remote_db['eventos']
 
+# Eventos consultados no Atlas por vez (um único find com $in)
+BATCH_SIZE = 500
+
+# Operações por bulk_write
+BULK_CHUNK_SIZE = 1000
+
+# Execuções seguidas de uma fonte sem um evento até que ele seja marcado como removido
+EXECUCOES_PARA_REMOCAO = int(os.getenv('SYNC_EXECUCOES_PARA_REMOCAO', '3'))
+
+# Campos que reativam um evento marcado como removido
+REATIVACAO = {'removido': '', 'removido_em': ''}
+
+
+def iniciar_execucao(db, fonte, agora):
+    """
+    Registra uma nova execução da sincronização de uma fonte.
+
+    Returns:
+        int: Número da execução (sequencial por fonte)
+    """
+    execucao = db.execucoes_sincronizacao.find_one_and_update(
+        {'_id': fonte},
+        {'$inc': {'execucao': 1}, '$set': {'iniciada_em': agora}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    return execucao['execucao']
+
+
+def ler_eventos(csv_file, fonte):
+    """
+    Lê os eventos do CSV. Linhas com o mesmo nome são reduzidas à última,
+    como acontecia quando cada linha era gravada em sequência.
+
+    Returns:
+        list: Eventos (EventoDeCorrida) na ordem do arquivo
+    """
+    eventos = {}
+    with open(csv_file, 'r', encoding='utf-8') as file:
+        reader = csv.DictReader(file, delimiter=';')
+        for row in reader:
+            try:
+                # Garante que o campo link_edital será passado, se existir no CSV
+                if 'Link do Edital' in row:
+                    row['link_edital'] = row['Link do Edital']
+                # O campo 'Categorias Premiadas' será tratado automaticamente pelo EventoDeCorrida
+                evento = EventoDeCorrida.from_csv_row(row, fonte)
+                eventos.pop(evento.nome_evento, None)
+                eventos[evento.nome_evento] = evento
+            except Exception as e:
+                print(f"❌ Erro ao processar linha do CSV: {str(e)}")
+                print(f"Conteúdo da linha: {row}")
+    return list(eventos.values())
+
+
+def calcular_operacoes(db, eventos, agora, execucao):
+    """
+    Compara um lote de eventos com o Atlas pelo hash de conteúdo, buscando os
+    existentes em uma única consulta, e monta as operações necessárias.
+
+    Eventos sem alteração não são regravados: apenas a execução em que foram
+    vistos é atualizada, em um único update_many.
+
+    Returns:
+        tuple: (operações, quantidade de novos, quantidade de atualizados)
+    """
+    nomes = [evento.nome_evento for evento in eventos]
+    existentes = {
+        documento['nome_evento']: documento
+        for documento in db.eventos.find(
+            {'nome_evento': {'$in': nomes}},
+            {'_id': 0, 'nome_evento': 1, 'conteudo_hash': 1, 'removido': 1}
+        )
+    }
+
+    operacoes = []
+    inalterados = []
+    novos = atualizados = 0
+    for evento in eventos:
+        evento_dict = evento.to_dict()
+        existente = existentes.get(evento.nome_evento)
+        # atualizado_em alimenta o ETag/Last-Modified da API
+        if existente is None:
+            operacoes.append(InsertOne({
+                **evento_dict, 'ativo': True, 'atualizado_em': agora, 'ultima_execucao_vista': execucao
+            }))
+            novos += 1
+        elif existente.get('conteudo_hash') != evento_dict['conteudo_hash'] or existente.get('removido'):
+            print(f"🔄 Atualizando evento: {evento.nome_evento}")
+            operacoes.append(UpdateOne(
+                {'nome_evento': evento.nome_evento},
+                {
+                    '$set': {**evento_dict, 'ativo': True, 'atualizado_em': agora, 'ultima_execucao_vista': execucao},
+                    '$unset': REATIVACAO,
+                }
+            ))
+            atualizados += 1
+        else:
+            inalterados.append(evento.nome_evento)
+
+    if inalterados:
+        operacoes.append(UpdateMany(
+            {'nome_evento': {'$in': inalterados}},
+            {'$set': {'ultima_execucao_vista': execucao}}
+        ))
+    return operacoes, novos, atualizados
+
+
+def marcar_removidos(db, fonte, agora, execucao):
+    """
+    Marca como removidos, em um único update_many, os eventos da fonte que não
+    apareceram nas últimas EXECUCOES_PARA_REMOCAO execuções. Eventos coletados
+    antes do controle de execuções contam como vistos na execução 0; eventos
+    criados pela API ou importados (com ``origem``) não são marcados.
+
+    Returns:
+        int: Quantidade de eventos marcados
+    """
+    limite = execucao - EXECUCOES_PARA_REMOCAO
+    if limite < 0:
+        return 0
+    resultado = db.eventos.update_many(
+        {
+            'site_coleta': fonte,
+            'origem': {'$exists': False},
+            'removido': {'$ne': True},
+            '$or': [
+                {'ultima_execucao_vista': {'$lte': limite}},
+                {'ultima_execucao_vista': {'$exists': False}},
+            ],
+        },
+        {'$set': {'ativo': False, 'removido': True, 'removido_em': agora, 'atualizado_em': agora}}
+    )
+    return resultado.modified_count
+
+
+def aplicar_operacoes(db, operacoes):
+    """
+    Grava as operações em bulk_writes não ordenados de até BULK_CHUNK_SIZE
+    operações: uma falha não impede as demais.
+
+    Returns:
+        int: Quantidade de operações que falharam
+    """
+    falhas = 0
+    for inicio in range(0, len(operacoes), BULK_CHUNK_SIZE):
+        try:
+            db.eventos.bulk_write(operacoes[inicio:inicio + BULK_CHUNK_SIZE], ordered=False)
+        except BulkWriteError as e:
+            erros = e.details.get('writeErrors', [])
+            falhas += len(erros)
+            for erro in erros[:5]:
+                print(f"❌ Erro ao gravar evento: {erro.get('errmsg')}")
+    return falhas
+
+
 def import_csv_to_mongodb(db, csv_file, fonte):
     try:
-        with open(csv_file, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file, delimiter=';')
-            novos_eventos = 0
-            eventos_atualizados = 0
-            for row in reader:
-                try:
-                    # Garante que o campo link_edital será passado, se existir no CSV
-                    if 'Link do Edital' in row:
-                        row['link_edital'] = row['Link do Edital']
-                    # O campo 'Categorias Premiadas' será tratado automaticamente pelo EventoDeCorrida
-                    evento = EventoDeCorrida.from_csv_row(row, fonte)
-                    evento_existente = db.eventos.find_one({'nome_evento': evento.nome_evento})
-                    if not evento_existente:
-                        db.eventos.insert_one(evento.to_dict())
-                        novos_eventos += 1
-                    else:
-                        evento_dict = evento.to_dict()
-                        evento_existente_dict = {k: v for k, v in evento_existente.items() if k != '_id'}
-                        campos_nao_comparaveis = ['data_coleta']
-                        for campo in campos_nao_comparaveis:
-                            evento_dict.pop(campo, None)
-                            evento_existente_dict.pop(campo, None)
-                        # Garante que ambos os dicionários tenham o campo 'link_edital' para comparação justa
-                        if 'link_edital' not in evento_existente_dict:
-                            evento_existente_dict['link_edital'] = ''
-                        if 'link_edital' not in evento_dict:
-                            evento_dict['link_edital'] = ''
-                        if evento_dict != evento_existente_dict:
-                            print(f"Atualizando evento: {evento.nome_evento}")
-                            print(f"Antes: {evento_existente_dict}")
-                            print(f"Depois: {evento_dict}")
-                            db.eventos.update_one(
-                                {'nome_evento': evento.nome_evento},
-                                {'$set': evento.to_dict()}
-                            )
-                            eventos_atualizados += 1
-                except Exception as e:
-                    print(f"❌ Erro ao processar linha do CSV: {str(e)}")
-                    print(f"Conteúdo da linha: {row}")
-                    continue
-        print(f"✅ Dados de {fonte} processados com sucesso no Atlas")
+        inicio = time.perf_counter()
+        eventos = ler_eventos(csv_file, fonte)
+        if not eventos:
+            # Coleta vazia (falha do scraper): não conta como execução, para não remover eventos
+            print(f"⚠️ Nenhum evento lido de {csv_file}; sincronização de {fonte} ignorada")
+            return
+        agora = datetime.now()
+        execucao = iniciar_execucao(db, fonte, agora)
+
+        novos_eventos = eventos_atualizados = falhas = 0
+        for indice in range(0, len(eventos), BATCH_SIZE):
+            operacoes, novos, atualizados = calcular_operacoes(
+                db, eventos[indice:indice + BATCH_SIZE], agora, execucao
+            )
+            falhas += aplicar_operacoes(db, operacoes)
+            novos_eventos += novos
+            eventos_atualizados += atualizados
+
+        # Com falhas de gravação, eventos vistos podem não ter a execução atualizada
+        removidos = 0 if falhas else marcar_removidos(db, fonte, agora, execucao)
+
+        print(f"✅ Dados de {fonte} processados com sucesso no Atlas em {time.perf_counter() - inicio:.1f} s "
+              f"(execução {execucao})")
         print(f"📝 {novos_eventos} novos eventos adicionados")
         print(f"🔄 {eventos_atualizados} eventos atualizados")
+        print(f"✔️ {len(eventos) - novos_eventos - eventos_atualizados} eventos sem alteração")
+        print(f"🗑️ {removidos} eventos marcados como removidos")
+        if falhas:
+            print(f"❌ {falhas} eventos não puderam ser gravados")
     except Exception as e:
         print(f"❌ Erro ao importar dados de {fonte}: {str(e)}")
 
@@ -73,10 +218,10 @@ def main():
         csv_brasilquecorre = os.path.join(base_dir, 'eventos_brasilquecorre.csv')
         import_csv_to_mongodb(db, csv_brasilcorrida, 'brasilcorrida')
         import_csv_to_mongodb(db, csv_brasilquecorre, 'brasilquecorre')
-        total = db.eventos.count_documents({})
-        print(f"\n📊 Total de eventos na base Atlas: {total}")
+        total = db.eventos.count_documents({'ativo': True})
+        print(f"\n📊 Total de eventos ativos na base Atlas: {total}")
     except Exception as e:
         print(f"❌ Erro geral: {str(e)}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
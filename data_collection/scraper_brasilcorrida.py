@@ -1,7 +1,7 @@
 import csv
 import time
-import re
 import os
+import sys
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -10,6 +10,12 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver.common.action_chains import ActionChains
 
+# Permite reutilizar os utilitários puros da API (app/utils) nos scripts de coleta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.date_utils import is_date_text
+from app.utils.distance_utils import distance_labels
+
 
 def setup_driver():
     options = webdriver.ChromeOptions()
@@ -34,28 +40,11 @@ def get_event_distance(driver, event_url):
         # Capturar_todo o texto da página
         page_text = driver.find_element(By.TAG_NAME, "body").text
 
-        # Padrões de distância comuns em corridas
-        distance_patterns = [
-            r'\b\d+\s*[kK][mM]\b',  # Padrão como "5km", "10 KM", etc.
-            r'\b\d+\.\d+\s*[kK][mM]\b',  # Padrão como "5.5km", "10.5 KM", etc.
-            r'\b\d+\,\d+\s*[kK][mM]\b',  # Padrão como "5,5km", "10,5 KM", etc.
-            r'\bMeia Maratona\b',  # Padrão "Meia Maratona" (21km)
-            r'\bMaratona\b'  # Padrão "Maratona" (42km)
-        ]
-
-        all_distances = []
-        for pattern in distance_patterns:
-            matches = re.findall(pattern, page_text)
-            all_distances.extend(matches)
-
+        # Distâncias ("5km", "10,5 KM", "Meia Maratona"...) em ordem crescente,
+        # com o mesmo parser usado na gravação dos eventos
+        all_distances = distance_labels(page_text)
         if all_distances:
-            # Remover duplicatas e ordenar por tamanho (menor para maior)
-            def extract_number(text):
-                match = re.search(r'\d+', text)
-                return float(match.group()) if match else 0
-            
-            unique_distances = sorted(set(all_distances), key=extract_number)
-            return ', '.join(unique_distances)
+            return ', '.join(all_distances)
 
         return ''  # Retornar string vazia se não encontrar
 
@@ -189,19 +178,9 @@ def get_event_data(driver):
                     local_evento = get_text_safe(card, ".//h6[contains(@class, 'fs--2') and contains(text(), ',')]")
                     organizador = get_text_safe(card, ".//a[contains(@href, 'organizador')]")
 
-                    # Formatar a data para o padrão brasileiro
-                    if data_evento and '/' in data_evento:
-                        try:
-                            dia, mes, ano = data_evento.split('/')
-                            meses = {
-                                '01': 'Janeiro', '02': 'Fevereiro', '03': 'Março',
-                                '04': 'Abril', '05': 'Maio', '06': 'Junho',
-                                '07': 'Julho', '08': 'Agosto', '09': 'Setembro',
-                                '10': 'Outubro', '11': 'Novembro', '12': 'Dezembro'
-                            }
-                            data_evento = f"{dia} de {meses[mes]} de {ano}"
-                        except:
-                            pass
+                    # A data é mantida como publicada (dd/mm/aaaa); o mesmo parser a interpreta na importação
+                    if data_evento and not is_date_text(data_evento):
+                        print(f"⚠️ Data não reconhecida em '{nome_evento}': {data_evento}")
 
                     # Extrair apenas a cidade do local (remover estado)
                     if local_evento and ',' in local_evento:
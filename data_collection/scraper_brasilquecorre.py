@@ -1,5 +1,6 @@
 import csv
 import re
+import sys
 import time
 import os
 import requests
@@ -12,6 +13,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# Permite reutilizar os utilitários puros da API (app/utils) nos scripts de coleta
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.date_utils import is_date_text
+
 def setup_driver():
     """Configura o driver do Selenium."""
     options = webdriver.ChromeOptions()
@@ -34,8 +40,6 @@ def get_event_data(driver):
         event_boxes = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.cs-box")))
         
         event_data = []
-        data_pattern = re.compile(r'\d{1,2}\s+de\s+[A-Za-zçÇ]+\s+de\s+\d{4}')
-        
         # Armazena as janelas para poder navegar entre abas
         main_window = driver.current_window_handle
 
@@ -55,7 +59,7 @@ def get_event_data(driver):
                 for idx, element in enumerate(text_elements):
                     text = element.text.strip()
                     if text and not text.isspace():
-                        if data_pattern.search(text):
+                        if is_date_text(text):
                             event_info['data'] = text
                         elif any(term in text for term in ['(corrida)', '(caminhada)', '(trail)', '(ultra)', '(infantil)']):
                             distancias_encontradas.append(text)
@@ -11,25 +11,39 @@ from fastapi_pagination import add_pagination
 from app.core.config import settings
 from app.core.database import Database
 from app.api.eventos import router as eventos_router
+from app.api.monitoramento import metricas_router, router as monitoramento_router
+from app.core.logging_config import setup_logging
+from app.core.middleware import MetricsMiddleware, RequestContextMiddleware
+from app.core.profiling import ProfilingMiddleware
 
 load_dotenv()
 
-# Configurar logging
-logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL),
-    format=settings.LOG_FORMAT,
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(os.path.join('logs', 'api.log'))
-    ]
-)
+# Configurar logging (fila + arquivos JSON com rotação; ver app/core/logging_config.py)
+setup_logging()
 
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Inicialização: conecta e aquece o pool antes da primeira requisição
+    try:
+        await Database.connect()
+        await Database.warm_up()
+        logger.info("Conexão com o banco de dados estabelecida")
+    except Exception as e:
+        logger.error(f"Erro ao conectar ao banco de dados: {e}")
+
+    yield
+
+    # Finalização
+    await Database.close()
+    logger.info("Conexão com o banco de dados fechada")
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description=settings.PROJECT_DESCRIPTION,
     version=settings.VERSION,
+    lifespan=lifespan,
 )
 
 # Adicionar middleware CORS
@@ -39,28 +53,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified"],
 )
 
+# Profiling opcional por requisição (PROFILING_ENABLED + X-Profile + X-Admin-Token)
+app.add_middleware(ProfilingMiddleware)
+
+# Métricas de latência, tamanho e status por rota (expostas em /metrics)
+app.add_middleware(MetricsMiddleware)
+
+# ID de requisição e log de acesso com duração
+app.add_middleware(RequestContextMiddleware)
+
 # Adicionar paginação
 add_pagination(app)
 
 # Adicionar rotas
 app.include_router(eventos_router, prefix="/api/v1/eventos", tags=["eventos"])
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    # Inicialização
-    try:
-        await Database.connect()
-        logger.info("Conexão com o banco de dados estabelecida")
-    except Exception as e:
-        logger.error(f"Erro ao conectar ao banco de dados: {e}")
-
-    yield
-
-    # Finalização
-    await Database.close()
-    logger.info("Conexão com o banco de dados fechada")
+app.include_router(monitoramento_router, prefix="/health", tags=["monitoramento"])
+app.include_router(metricas_router, tags=["monitoramento"])
 
 @app.get("/")
 async def root():
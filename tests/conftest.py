@@ -0,0 +1,103 @@
+"""
+Fixtures dos testes da API: banco mongomock (mongomock-motor), cache em
+memória novo e estado de classe reiniciado a cada teste.
+"""
+import asyncio
+import inspect
+from datetime import datetime
+from typing import Any, Dict, List
+
+import pytest
+
+from app.core.cache import Cache, InMemoryCache
+from app.core.config import settings
+from app.core.database import Database
+from app.services.evento_service import EventoService
+from app.utils.date_utils import build_date_fields
+from app.utils.distance_utils import build_distance_fields
+from app.utils.search_utils import build_search_fields
+
+ADMIN_TOKEN = "token-de-teste"
+
+
+def _compatibilizar_mongomock():
+    """
+    O pymongo 4.x passa argumentos novos (sort, hint...) às operações de
+    bulk_write que o mongomock ainda não aceita; eles são descartados.
+    """
+    import mongomock.collection as colecao
+
+    for nome in ("add_update", "add_replace", "add_delete", "add_insert"):
+        original = getattr(colecao.BulkOperationBuilder, nome, None)
+        if original is None or getattr(original, "_compatibilizado", False):
+            continue
+        aceitos = set(inspect.signature(original).parameters)
+
+        def metodo(self, *args, _original=original, _aceitos=aceitos, **kwargs):
+            return _original(self, *args, **{chave: valor for chave, valor in kwargs.items() if chave in _aceitos})
+
+        metodo._compatibilizado = True
+        setattr(colecao.BulkOperationBuilder, nome, metodo)
+
+
+def run(coro):
+    """Executa uma corrotina de preparação fora do loop da aplicação."""
+    return asyncio.run(coro)
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """Banco mongomock ligado a ``Database`` e cache em memória vazio."""
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    _compatibilizar_mongomock()
+
+    Database.client = mongomock_motor.AsyncMongoMockClient()
+    Database.db = Database.client["correpb_testes"]
+    Cache.backend = InMemoryCache(max_entries=settings.CACHE_MAX_ENTRIES)
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "MONGODB_ENSURE_INDEXES", False)
+    monkeypatch.setattr(settings, "API_ADMIN_TOKEN", ADMIN_TOKEN)
+    monkeypatch.setattr(EventoService, "_ultima_escrita", None)
+    yield Database.db
+    Database.client = None
+    Database.db = None
+    Cache.backend = None
+
+
+@pytest.fixture
+def client(db):
+    """Cliente HTTP da aplicação, usando o banco da fixture ``db``."""
+    from fastapi.testclient import TestClient
+
+    import main
+
+    with TestClient(main.app) as cliente:
+        yield cliente
+
+
+def evento(nome: str, datas: List[datetime] = None, **campos: Any) -> Dict[str, Any]:
+    """Documento de evento com os campos derivados, como gravado pela API."""
+    datas = datas if datas is not None else [datetime(2025, 7, 12)]
+    distancias = campos.pop("distancias", "5km, 10km")
+    documento = {
+        "nome_evento": nome,
+        "datas_realizacao": datas,
+        "cidade": "João Pessoa",
+        "estado": "PB",
+        "organizador": "Organizador",
+        "site_coleta": "testes",
+        "data_coleta": datetime(2025, 1, 1),
+        "url_inscricao": "https://inscricoes.example.com",
+        "distancias": distancias,
+        "ativo": True,
+        **build_search_fields(nome),
+        **build_date_fields(datas),
+        **build_distance_fields(distancias),
+    }
+    documento.update(campos)
+    return documento
+
+
+def inserir(db, documentos: List[Dict[str, Any]]):
+    """Insere eventos diretamente no banco (como um processo externo)."""
+    run(db["eventos"].insert_many(documentos))
@@ -0,0 +1,120 @@
+from datetime import datetime
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import Cache, InMemoryCache, make_key
+from conftest import ADMIN_TOKEN, evento, inserir, run
+
+URL = "/api/v1/eventos"
+
+
+class Relogio:
+    """Substitui ``time.monotonic`` do módulo de cache."""
+
+    def __init__(self):
+        self.agora = 1000.0
+
+    def __call__(self):
+        return self.agora
+
+
+@pytest.fixture
+def relogio(monkeypatch):
+    relogio = Relogio()
+    monkeypatch.setattr(cache_module.time, "monotonic", relogio)
+    return relogio
+
+
+def test_in_memory_expira_pelo_ttl(relogio):
+    backend = InMemoryCache()
+    run(backend.set("a", 1, 10))
+
+    relogio.agora += 9
+    assert run(backend.get("a")) == 1
+    relogio.agora += 1
+    assert run(backend.get("a")) is None
+    assert len(backend) == 0
+
+
+def test_in_memory_remove_o_menos_usado(relogio):
+    backend = InMemoryCache(max_entries=2)
+    run(backend.set("a", 1, 60))
+    run(backend.set("b", 2, 60))
+    # "a" passa a ser o mais recente; "b" sai ao exceder o limite
+    assert run(backend.get("a")) == 1
+    run(backend.set("c", 3, 60))
+
+    assert run(backend.get("b")) is None
+    assert run(backend.get("a")) == 1
+    assert run(backend.get("c")) == 3
+    assert len(backend) == 2
+
+
+def test_in_memory_contadores_sobrevivem_a_eviccao_e_clear(relogio):
+    backend = InMemoryCache(max_entries=1)
+    assert run(backend.incr("eventos:geracao")) == 1
+    run(backend.set("a", 1, 60))
+    run(backend.set("b", 2, 60))
+    run(backend.clear())
+
+    assert run(backend.get_counter("eventos:geracao")) == 1
+    assert run(backend.get_counter("outro:geracao")) == 0
+
+
+def test_make_key_deterministica():
+    assert make_key({"b": 1, "a": 2}, ("x", 1)) == make_key({"a": 2, "b": 1}, ["x", 1])
+    assert make_key({"data": datetime(2025, 7, 12)}) == make_key({"data": datetime(2025, 7, 12)})
+    assert make_key({"a": 1}) != make_key({"a": 2})
+    assert make_key("a", "b") != make_key("ab")
+
+
+def test_get_or_set_e_invalidacao_por_geracao(db):
+    chamadas = []
+
+    async def carregar():
+        chamadas.append(1)
+        return len(chamadas)
+
+    assert run(Cache.get_or_set("eventos", ("lista",), carregar)) == 1
+    assert run(Cache.get_or_set("eventos", ("lista",), carregar)) == 1
+    # Outro namespace não é afetado pela invalidação
+    assert run(Cache.get_or_set("outro", ("lista",), carregar)) == 2
+
+    run(Cache.invalidate("eventos"))
+    assert run(Cache.get_generation("eventos")) == 1
+    assert run(Cache.get_or_set("eventos", ("lista",), carregar)) == 3
+    assert run(Cache.get_or_set("outro", ("lista",), carregar)) == 2
+
+
+def test_get_or_set_sem_cache_ou_com_expire_zero(db, monkeypatch):
+    chamadas = []
+
+    async def carregar():
+        chamadas.append(1)
+        return len(chamadas)
+
+    # expire=0 não é trocado por CACHE_EXPIRE: a entrada já nasce expirada
+    assert run(Cache.get_or_set("eventos", ("estado",), carregar, expire=0)) == 1
+    assert run(Cache.get_or_set("eventos", ("estado",), carregar, expire=0)) == 2
+
+    monkeypatch.setattr(cache_module.settings, "CACHE_ENABLED", False)
+    assert run(Cache.get_or_set("eventos", ("lista",), carregar)) == 3
+    assert run(Cache.get_or_set("eventos", ("lista",), carregar)) == 4
+
+
+def test_escrita_pela_api_invalida_listagens(client, db):
+    inserir(db, [evento("Corrida A")])
+    antes = client.get(f"{URL}/?size=5").json()["items"][0]
+    assert antes["cidade"] == "João Pessoa"
+    assert client.get(f"{URL}/cursor?size=5").json()["items"][0]["cidade"] == "João Pessoa"
+
+    # Mesmo total e estado da coleção ainda em cache (ETAG_STATE_TTL): só a geração muda
+    resposta = client.patch(
+        f"{URL}/{antes['_id']}", json={"cidade": "Campina Grande"}, headers={"X-Admin-Token": ADMIN_TOKEN}
+    )
+    assert resposta.status_code == 200
+    assert run(Cache.get_generation("eventos")) == 1
+
+    assert client.get(f"{URL}/?size=5").json()["items"][0]["cidade"] == "Campina Grande"
+    assert client.get(f"{URL}/cursor?size=5").json()["items"][0]["cidade"] == "Campina Grande"
@@ -0,0 +1,58 @@
+from datetime import datetime
+
+import pytest
+
+from app.utils.date_utils import InvalidDateError, is_date_text, parse_dates
+
+
+def _datas(*datas):
+    return [datetime.strptime(data, "%d/%m/%Y") for data in datas]
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    # Dias listados
+    ("02, 03 e 15 de Agosto de 2025", _datas("02/08/2025", "03/08/2025", "15/08/2025")),
+    # Intervalos, inclusive entre meses e anos
+    ("12 a 14 de Setembro de 2025", _datas("12/09/2025", "13/09/2025", "14/09/2025")),
+    ("30 de agosto a 1 de setembro de 2025", _datas("30/08/2025", "31/08/2025", "01/09/2025")),
+    ("30/12/2025 a 02/01/2026", _datas("30/12/2025", "31/12/2025", "01/01/2026", "02/01/2026")),
+    # dd/mm/aaaa
+    ("12/07/2025", _datas("12/07/2025")),
+    ("Domingo (12/07/2025)", _datas("12/07/2025")),
+    # Meses abreviados
+    ("12 set. 2025", _datas("12/09/2025")),
+    # Ordinais e horários
+    ("1º de maio de 2025", _datas("01/05/2025")),
+    ("Sábado, 12 de julho de 2025 às 7h", _datas("12/07/2025")),
+    ("12 de julho de 2025, 06:30", _datas("12/07/2025")),
+    # Quantidades e observações não são dias
+    ("12 e 19 de Julho de 2025 (2 etapas)", _datas("12/07/2025", "19/07/2025")),
+    ("12 e 19 de Julho de 2025 - 2 etapas", _datas("12/07/2025", "19/07/2025")),
+    ("12 de julho de 2025 - 5 km", _datas("12/07/2025")),
+    # Texto depois da última data completa
+    ("12 de Julho de 2025 - Etapa 2", _datas("12/07/2025")),
+    ("12 e 19 de Julho de 2025 - Etapas 1 e 2", _datas("12/07/2025", "19/07/2025")),
+    # Dias anteriores completados pela data numérica
+    ("12 a 14/09/2025", _datas("12/09/2025", "13/09/2025", "14/09/2025")),
+    ("12 e 14/09/2025", _datas("12/09/2025", "14/09/2025")),
+])
+def test_parse_dates(texto, esperado):
+    assert parse_dates(texto) == esperado
+
+
+def test_parse_dates_texto_vazio():
+    assert parse_dates("") == []
+    assert parse_dates(None) == []
+
+
+@pytest.mark.parametrize("texto", [
+    "5 km e 10 km",
+    "31/02/2025",
+    "12 de julho",
+    "Etapa 2 - 12 de julho",
+    "Inscrições abertas",
+])
+def test_parse_dates_invalidas(texto):
+    with pytest.raises(InvalidDateError):
+        parse_dates(texto)
+    assert not is_date_text(texto)
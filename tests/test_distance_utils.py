@@ -0,0 +1,31 @@
+import pytest
+
+from app.utils.distance_utils import distance_labels, parse_distances
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    ("3km (caminhada), 6km, 12km e 21km (corrida)", [3.0, 6.0, 12.0, 21.0]),
+    ("21k e 42,2 km", [21.0, 42.2]),
+    ("Meia Maratona", [21.1]),
+    ("meia-maratona e maratona", [21.1, 42.2]),
+    ("800 metros, 5km", [0.8, 5.0]),
+    ("1.500m kids", [1.5]),
+    ("500 m", [0.5]),
+])
+def test_parse_distances(texto, esperado):
+    assert parse_distances(texto) == esperado
+
+
+@pytest.mark.parametrize("texto", [
+    "Largada 6h30m, categoria 40 M",
+    "2,5 metros",
+    "",
+    None,
+])
+def test_parse_distances_ignora_valores_implausiveis(texto):
+    assert parse_distances(texto) == []
+
+
+def test_distance_labels_so_km_e_provas():
+    texto = "Largada 6h30m, categoria 40 M, kit 1.500m, 5km e 10 KM, Meia Maratona, 21k"
+    assert distance_labels(texto) == ["5km", "10 KM", "Meia Maratona"]
@@ -0,0 +1,68 @@
+from datetime import date, datetime
+from unittest import mock
+
+from conftest import evento, inserir, run
+
+URL = "/api/v1/eventos"
+
+
+def test_etag_e_304(client, db):
+    inserir(db, [evento("Corrida A", atualizado_em=datetime(2025, 1, 1))])
+
+    resposta = client.get(f"{URL}/?size=5")
+    assert resposta.status_code == 200
+    etag = resposta.headers["etag"]
+    assert resposta.headers["last-modified"]
+
+    assert client.get(f"{URL}/?size=5", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_escrita_externa_atualiza_corpo_e_etag(client, db, monkeypatch):
+    from app.core.config import settings
+
+    # Estado da coleção relido a cada requisição (sem esperar ETAG_STATE_TTL)
+    monkeypatch.setattr(settings, "ETAG_STATE_TTL", 0)
+    inserir(db, [evento("Corrida A", atualizado_em=datetime(2025, 1, 1))])
+
+    antes = client.get(f"{URL}/?size=5")
+    assert antes.json()["items"][0]["cidade"] == "João Pessoa"
+
+    # Escrita feita por outro processo (sincronização, backfill): não passa pela invalidação da API
+    run(db["eventos"].update_one(
+        {"nome_evento": "Corrida A"},
+        {"$set": {"cidade": "Campina Grande", "atualizado_em": datetime(2030, 1, 1)}}
+    ))
+
+    depois = client.get(f"{URL}/?size=5", headers={"If-None-Match": antes.headers["etag"]})
+    assert depois.status_code == 200
+    assert depois.headers["etag"] != antes.headers["etag"]
+    assert depois.json()["items"][0]["cidade"] == "Campina Grande"
+
+
+def test_status_relativo_inclui_o_dia_no_etag(client, db):
+    inserir(db, [evento("Corrida A", datas=[datetime(2099, 1, 1)], atualizado_em=datetime(2025, 1, 1))])
+
+    resposta = client.get(f"{URL}/?status=pendentes")
+    etag = resposta.headers["etag"]
+    assert "last-modified" not in resposta.headers
+    assert client.get(f"{URL}/?status=pendentes", headers={"If-None-Match": etag}).status_code == 304
+    # If-Modified-Since não é atendido para status relativos ao dia
+    assert client.get(
+        f"{URL}/?status=pendentes", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+    ).status_code == 200
+
+    class Amanha(date):
+        @classmethod
+        def today(cls):
+            return date(2099, 1, 2)
+
+    with mock.patch("app.api.eventos.date", Amanha):
+        assert client.get(f"{URL}/?status=pendentes", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_if_none_match_asterisco_so_para_evento_existente(client, db):
+    inserir(db, [evento("Corrida A")])
+    evento_id = client.get(f"{URL}/sem-paginacao").json()[0]["_id"]
+
+    assert client.get(f"{URL}/{evento_id}", headers={"If-None-Match": "*"}).status_code == 304
+    assert client.get(f"{URL}/0123456789ab0123456789ab", headers={"If-None-Match": "*"}).status_code == 404
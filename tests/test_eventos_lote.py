@@ -0,0 +1,135 @@
+import pytest
+from bson import ObjectId
+
+from app.core.cache import Cache
+from app.core.config import settings
+from conftest import ADMIN_TOKEN, evento, inserir, run
+
+URL = "/api/v1/eventos"
+LOTE = f"{URL}/lote"
+HEADERS = {"X-Admin-Token": ADMIN_TOKEN}
+
+
+def _novo(nome, **campos):
+    return {
+        "nome_evento": nome,
+        "datas_realizacao": ["2025-07-12T00:00:00"],
+        "cidade": "João Pessoa",
+        "estado": "PB",
+        "organizador": "Organizador",
+        "distancias": "5km e 10km",
+        "url_inscricao": f"https://inscricoes.example.com/{nome}",
+        "site_coleta": "testes",
+        **campos,
+    }
+
+
+def _nomes(client):
+    return sorted(item["nome_evento"] for item in client.get(f"{URL}/?size=50").json()["items"])
+
+
+def test_criar_lote_resultado_por_item(client, db):
+    # Índice único para que um item do lote falhe no banco sem impedir os demais
+    run(db["eventos"].create_index("url_inscricao", unique=True))
+    eventos = [
+        _novo("Corrida A", url_inscricao="https://inscricoes.example.com/mesma"),
+        _novo("Corrida B", url_inscricao="https://inscricoes.example.com/mesma"),
+        _novo("Corrida C"),
+    ]
+
+    resposta = client.post(LOTE, json=eventos, headers=HEADERS)
+    assert resposta.status_code == 200
+    resultado = resposta.json()
+    assert (resultado["inserted"], resultado["failed"]) == (2, 1)
+    assert [erro["indice"] for erro in resultado["erros"]] == [1]
+    assert resultado["ids"][1] is None
+    assert all(ObjectId.is_valid(resultado["ids"][indice]) for indice in (0, 2))
+
+    documento = run(db["eventos"].find_one({"_id": ObjectId(resultado["ids"][2])}))
+    # Campos derivados e de controle gravados como na criação individual
+    assert documento["origem"] == "api"
+    assert documento["ativo"] is True
+    assert documento["distancias_km"] == [5.0, 10.0]
+    assert documento["primeira_data"] == documento["ultima_data"]
+
+
+def test_criar_lote_valida_todos_os_itens(client, db):
+    resposta = client.post(LOTE, json=[_novo("Corrida A"), {"nome_evento": "Incompleto"}], headers=HEADERS)
+    assert resposta.status_code == 422
+    assert run(db["eventos"].count_documents({})) == 0
+
+
+def test_atualizar_lote_resultado_por_item(client, db):
+    existente = ObjectId()
+    inserir(db, [evento("Corrida A", _id=existente)])
+
+    resposta = client.patch(LOTE, json=[
+        {"id": "nao-e-um-id", "cidade": "Patos"},
+        {"id": str(existente), "cidade": "Campina Grande", "nome_evento": "Corrida Campina"},
+        {"id": str(ObjectId()), "cidade": "Sousa"},
+    ], headers=HEADERS)
+    assert resposta.status_code == 200
+    resultado = resposta.json()
+    assert (resultado["matched"], resultado["updated"], resultado["failed"]) == (1, 1, 1)
+    assert resultado["erros"] == [{"indice": 0, "erro": "ID inválido: nao-e-um-id"}]
+
+    documento = run(db["eventos"].find_one({"_id": existente}))
+    assert documento["cidade"] == "Campina Grande"
+    # Termos de busca acompanham o novo nome
+    assert "campina" in documento["termos_busca"]
+
+
+def test_excluir_lote(client, db):
+    ids = [ObjectId(), ObjectId()]
+    inserir(db, [evento("Corrida A", _id=ids[0]), evento("Corrida B", _id=ids[1]), evento("Corrida C")])
+
+    resposta = client.request(
+        "DELETE", LOTE, json={"ids": [str(ids[0]), "nao-e-um-id", str(ids[1]), str(ObjectId())]}, headers=HEADERS
+    )
+    assert resposta.status_code == 200
+    resultado = resposta.json()
+    assert resultado["deleted"] == 2
+    assert resultado["invalidos"] == ["nao-e-um-id"]
+    assert run(db["eventos"].count_documents({})) == 1
+
+
+@pytest.mark.parametrize("metodo, corpo", [
+    ("POST", [_novo("Corrida A")]),
+    ("PATCH", [{"id": str(ObjectId()), "cidade": "Patos"}]),
+    ("DELETE", {"ids": [str(ObjectId())]}),
+])
+@pytest.mark.parametrize("headers", [{}, {"X-Admin-Token": "errado"}, {"X-Admin-Token": ""}])
+def test_lote_exige_token(client, db, metodo, corpo, headers):
+    resposta = client.request(metodo, LOTE, json=corpo, headers=headers)
+    assert resposta.status_code == 401
+    assert run(db["eventos"].count_documents({})) == 0
+    assert run(Cache.get_generation("eventos")) == 0
+
+
+def test_lote_desativado_sem_token_configurado(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "API_ADMIN_TOKEN", None)
+    resposta = client.post(LOTE, json=[_novo("Corrida A")], headers=HEADERS)
+    assert resposta.status_code == 503
+    assert run(db["eventos"].count_documents({})) == 0
+
+
+def test_lotes_invalidam_listagens_em_cache(client, db):
+    existente = ObjectId()
+    inserir(db, [evento("Corrida A", _id=existente)])
+    assert _nomes(client) == ["Corrida A"]
+
+    client.post(LOTE, json=[_novo("Corrida B")], headers=HEADERS)
+    assert _nomes(client) == ["Corrida A", "Corrida B"]
+
+    client.patch(LOTE, json=[{"id": str(existente), "nome_evento": "Corrida Alterada"}], headers=HEADERS)
+    assert _nomes(client) == ["Corrida Alterada", "Corrida B"]
+
+    client.request("DELETE", LOTE, json={"ids": [str(existente)]}, headers=HEADERS)
+    assert _nomes(client) == ["Corrida B"]
+    assert run(Cache.get_generation("eventos")) == 3
+
+
+def test_lote_sem_alteracoes_nao_invalida(client, db):
+    client.patch(LOTE, json=[{"id": str(ObjectId()), "cidade": "Patos"}], headers=HEADERS)
+    client.request("DELETE", LOTE, json={"ids": [str(ObjectId())]}, headers=HEADERS)
+    assert run(Cache.get_generation("eventos")) == 0
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from bson import ObjectId
+
+from conftest import evento, inserir
+
+URL = "/api/v1/eventos"
+
+
+def _removido(nome):
+    return evento(nome, ativo=False, removido=True, removido_em=datetime(2025, 1, 1))
+
+
+def test_listagens_excluem_removidos(client, db):
+    inserir(db, [evento("Corrida A"), _removido("Corrida B")])
+
+    assert [item["nome_evento"] for item in client.get(f"{URL}/").json()["items"]] == ["Corrida A"]
+    assert [item["nome_evento"] for item in client.get(f"{URL}/cursor").json()["items"]] == ["Corrida A"]
+    assert [item["nome_evento"] for item in client.get(f"{URL}/sem-paginacao").json()] == ["Corrida A"]
+
+
+def test_evento_removido_retorna_404(client, db):
+    evento_id = ObjectId()
+    inserir(db, [_removido("Corrida B") | {"_id": evento_id}])
+
+    assert client.get(f"{URL}/{evento_id}").status_code == 404
+    assert client.get(f"{URL}/{evento_id}", headers={"If-None-Match": "*"}).status_code == 404
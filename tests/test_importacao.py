@@ -0,0 +1,137 @@
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.utils.import_utils import iter_json_documents
+from conftest import ADMIN_TOKEN, run
+
+URL = "/api/v1/eventos/import"
+HEADERS = {"X-Admin-Token": ADMIN_TOKEN}
+
+
+async def _blocos(corpo: bytes, tamanho: int):
+    for inicio in range(0, len(corpo), tamanho):
+        yield corpo[inicio:inicio + tamanho]
+
+
+def _ler(corpo: bytes, tamanho: int = 7, max_document_bytes: int = 1024):
+    async def ler():
+        return [documento async for documento in iter_json_documents(_blocos(corpo, tamanho), max_document_bytes)]
+    return run(ler())
+
+
+def _evento(nome, **campos):
+    return {
+        "nome_evento": nome,
+        "datas_realizacao": ["2025-07-12T00:00:00"],
+        "cidade": "João Pessoa",
+        "estado": "PB",
+        "organizador": "Organizador",
+        "distancias": "5km",
+        "url_inscricao": f"https://inscricoes.example.com/{nome}",
+        "site_coleta": "testes",
+        **campos,
+    }
+
+
+DOCUMENTOS = [{"nome": "Corrida A", "texto": "vírgula, [colchetes] e {chaves}"}, {"nome": "Corrida B"}]
+
+
+@pytest.mark.parametrize("corpo", [
+    json.dumps(DOCUMENTOS, ensure_ascii=False),
+    "\n".join(json.dumps(documento, ensure_ascii=False) for documento in DOCUMENTOS) + "\n",
+    # Sem quebra de linha final e com linhas vazias
+    "\n\n".join(json.dumps(documento, ensure_ascii=False) for documento in DOCUMENTOS),
+])
+@pytest.mark.parametrize("tamanho", [1, 7, 4096])
+def test_iter_json_documents_array_e_ndjson(corpo, tamanho):
+    # Blocos de 1 byte cortam os caracteres UTF-8 multibyte ao meio
+    assert _ler(corpo.encode("utf-8"), tamanho) == DOCUMENTOS
+
+
+@pytest.mark.parametrize("tamanho", [7, 4096])
+@pytest.mark.parametrize("corpo, erro", [
+    (b'[{"a": 1}, 2]', "objeto JSON"),
+    (b'[{"a": 1}] {"b": 2}', "fim do array"),
+    (b'{"a": 1}\n{"b": ', "incompleto"),
+    (b'{"a": "' + b"x" * 2048 + b'"}', "tamanho máximo"),
+])
+def test_iter_json_documents_invalido(corpo, erro, tamanho):
+    # O documento grande demais é rejeitado chegando aos pedaços ou em um único bloco
+    with pytest.raises(ValueError, match=erro):
+        _ler(corpo, tamanho)
+
+
+def test_iter_json_documents_limite_vale_por_documento():
+    corpo = "\n".join(json.dumps({"a": "x" * 500}) for _ in range(10)).encode()
+    assert len(_ler(corpo, max_document_bytes=1024)) == 10
+
+
+@pytest.mark.parametrize("formato", ["array", "ndjson"])
+def test_importar_upsert_em_lotes(client, db, formato):
+    eventos = [_evento(f"Corrida {indice}") for indice in range(5)]
+    if formato == "array":
+        corpo = json.dumps(eventos)
+    else:
+        corpo = "\n".join(json.dumps(evento) for evento in eventos)
+
+    resposta = client.post(f"{URL}?chunk_size=2", content=corpo, headers=HEADERS)
+    assert resposta.status_code == 200
+    relatorio = resposta.json()
+    assert (relatorio["inserted"], relatorio["updated"], relatorio["failed"], relatorio["total"]) == (5, 0, 0, 5)
+    assert [lote["total"] for lote in relatorio["chunks"]] == [2, 2, 1]
+
+    # Reimportar atualiza pela chave nome + datas (atualizado_em muda em todos)
+    eventos[0]["cidade"] = "Campina Grande"
+    relatorio = client.post(URL, content=json.dumps(eventos), headers=HEADERS).json()
+    assert (relatorio["inserted"], relatorio["updated"], relatorio["failed"]) == (0, 5, 0)
+
+    documento = run(db["eventos"].find_one({"nome_evento": "Corrida 0"}))
+    assert documento["cidade"] == "Campina Grande"
+    assert documento["origem"] == "importacao"
+    assert documento["ativo"] is True
+    assert run(db["eventos"].count_documents({})) == 5
+
+
+def test_importar_falhas_parciais(client, db):
+    # Índice único para provocar erros de chave duplicada no bulk_write não ordenado
+    run(db["eventos"].create_index("url_inscricao", unique=True))
+    eventos = [
+        _evento("Corrida A", url_inscricao="https://inscricoes.example.com/mesma"),
+        {"nome_evento": "Sem campos obrigatórios"},
+        _evento("Corrida B", url_inscricao="https://inscricoes.example.com/mesma"),
+        _evento("Corrida C"),
+    ]
+
+    resposta = client.post(URL, content=json.dumps(eventos), headers=HEADERS)
+    assert resposta.status_code == 200
+    relatorio = resposta.json()
+    assert (relatorio["inserted"], relatorio["failed"], relatorio["total"]) == (2, 2, 4)
+    erros = relatorio["chunks"][0]["erros"]
+    # Índices relativos à entrada, inclusive depois de um evento descartado na validação
+    assert sorted(erro["indice"] for erro in erros) == [1, 2]
+    assert any("duplicate" in erro["erro"].lower() for erro in erros)
+    assert sorted(documento["nome_evento"] for documento in run(db["eventos"].find().to_list(length=None))) == [
+        "Corrida A", "Corrida C"
+    ]
+
+
+def test_importar_documento_grande_demais(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "IMPORT_MAX_DOCUMENT_BYTES", 1024)
+    corpo = json.dumps(_evento("Corrida A")) + "\n" + json.dumps(_evento("Corrida B", organizador="x" * 4096))
+
+    resposta = client.post(URL, content=corpo, headers=HEADERS)
+    assert resposta.status_code == 400
+    relatorio = resposta.json()
+    assert "tamanho máximo" in relatorio["erro"]
+    # O que foi lido antes do erro permanece gravado
+    assert relatorio["inserted"] == 1
+    assert run(db["eventos"].count_documents({})) == 1
+
+
+def test_importar_exige_token(client, db):
+    corpo = json.dumps([_evento("Corrida A")])
+    assert client.post(URL, content=corpo).status_code == 401
+    assert client.post(URL, content=corpo, headers={"X-Admin-Token": "errado"}).status_code == 401
+    assert run(db["eventos"].count_documents({})) == 0
@@ -0,0 +1,117 @@
+import base64
+import json
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from app.utils.pagination_utils import InvalidCursorError, _keyset_filter, decode_cursor, encode_cursor
+from conftest import evento, inserir, run
+
+URL = "/api/v1/eventos"
+
+
+def _eventos_com_empates():
+    """Várias datas e nomes repetidos, e um evento sem datas (primeira/última data nulas)."""
+    datas = [datetime(2025, 7, 12), datetime(2025, 7, 12), datetime(2025, 8, 1)]
+    documentos = [
+        evento(f"Corrida {indice % 3}", datas=[datas[indice % 3]], _id=ObjectId())
+        for indice in range(10)
+    ]
+    documentos.append(evento("Corrida sem data", datas=[], _id=ObjectId()))
+    return documentos
+
+
+def _percorrer(client, consulta):
+    """Segue os next_cursor da listagem e retorna os _id na ordem entregue."""
+    ids, cursor = [], None
+    while True:
+        url = f"{URL}/cursor?{consulta}" + (f"&cursor={cursor}" if cursor else "")
+        resposta = client.get(url)
+        assert resposta.status_code == 200
+        pagina = resposta.json()
+        ids += [item["_id"] for item in pagina["items"]]
+        cursor = pagina["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.parametrize("ordenar_por, campo", [
+    ("datas_realizacao", None),
+    ("nome_evento", "nome_evento"),
+])
+@pytest.mark.parametrize("ordem", [1, -1])
+# Com size=1 todo evento, inclusive o sem data, é a posição de um cursor
+@pytest.mark.parametrize("size", [1, 3])
+def test_cursor_percorre_todos_os_eventos_com_empates(client, db, ordenar_por, campo, ordem, size):
+    documentos = _eventos_com_empates()
+    inserir(db, documentos)
+    campo = campo or ("primeira_data" if ordem == 1 else "ultima_data")
+
+    # Ordem do MongoDB: nulos antes dos valores na crescente; empates desfeitos pelo _id
+    def chave(documento):
+        valor = documento.get(campo)
+        return (valor is not None, valor or "", documento["_id"])
+
+    esperado = [str(documento["_id"]) for documento in sorted(documentos, key=chave, reverse=ordem == -1)]
+    assert _percorrer(client, f"ordenar_por={ordenar_por}&ordem={ordem}&size={size}") == esperado
+
+
+@pytest.mark.parametrize("ordem", [1, -1])
+def test_keyset_filter_em_campo_array(db, ordem):
+    colecao = db["eventos"]
+    documentos = [
+        {"_id": ObjectId(), "datas": [datetime(2025, 7, 12), datetime(2025, 8, 1)]},
+        {"_id": ObjectId(), "datas": [datetime(2025, 7, 12)]},
+        {"_id": ObjectId(), "datas": [datetime(2025, 8, 1)]},
+        {"_id": ObjectId(), "datas": [datetime(2025, 6, 1), datetime(2025, 9, 1)]},
+    ]
+    run(colecao.insert_many(documentos))
+
+    # Chave de ordenação de um array: menor elemento (crescente) ou maior (decrescente)
+    def chave(documento):
+        return (max(documento["datas"]) if ordem == -1 else min(documento["datas"]), documento["_id"])
+
+    ordenados = sorted(documentos, key=chave, reverse=ordem == -1)
+    for posicao, ultimo in enumerate(ordenados):
+        filtro = _keyset_filter("datas", ordem, chave(ultimo)[0], ultimo["_id"], True)
+        seguintes = run(colecao.find(filtro).to_list(length=None))
+        assert {documento["_id"] for documento in seguintes} == {
+            documento["_id"] for documento in ordenados[posicao + 1:]
+        }
+
+
+@pytest.mark.parametrize("valor", [
+    "Corrida A",
+    datetime(2025, 7, 12, 6, 30),
+    ObjectId("0123456789ab0123456789ab"),
+    None,
+    [],
+    21.1,
+])
+def test_encode_decode_cursor(valor):
+    last_id = ObjectId()
+    token = encode_cursor("campo", valor, last_id, is_array=valor == [])
+    assert "=" not in token
+    assert decode_cursor(token, "campo") == (valor, last_id, valor == [])
+
+
+def _token(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize("token", [
+    "nao-e-um-cursor",
+    _token(["lista"]),
+    _token({"f": "nome_evento", "v": "A"}),
+    _token({"f": "nome_evento", "v": "A", "id": "123"}),
+    _token({"f": "nome_evento", "v": {"$date": "ontem"}, "id": str(ObjectId())}),
+    # Cursor de outra ordenação
+    encode_cursor("ultima_data", datetime(2025, 7, 12), ObjectId()),
+])
+def test_cursor_invalido(client, db, token):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token, "nome_evento")
+
+    resposta = client.get(f"{URL}/cursor?ordenar_por=nome_evento&cursor={token}")
+    assert resposta.status_code == 400
@@ -0,0 +1,102 @@
+from datetime import datetime
+
+import pytest
+
+from app.core.config import settings
+from app.utils.pagination_utils import ACTIVE_FILTER, counts_in_pipeline, facet_page_pipeline
+from conftest import evento, inserir
+
+URL = "/api/v1/eventos"
+
+SCORE = {"$add": [1]}
+
+
+def test_facet_page_pipeline_so_pagina():
+    assert facet_page_pipeline(ACTIVE_FILTER, {"ultima_data": -1}, 20, 10, projection={"nome_evento": 1}) == [
+        {"$match": ACTIVE_FILTER},
+        {"$sort": {"ultima_data": -1}},
+        {"$skip": 20},
+        {"$limit": 10},
+        {"$project": {"nome_evento": 1}},
+    ]
+    assert facet_page_pipeline({}, {}, 0, 10) == [{"$skip": 0}, {"$limit": 10}]
+
+
+def test_facet_page_pipeline_relevancia_com_total():
+    pipeline = facet_page_pipeline(ACTIVE_FILTER, {"ultima_data": -1}, 0, 10, score=SCORE, count=True)
+    assert pipeline == [
+        {"$match": ACTIVE_FILTER},
+        {"$addFields": {"_relevancia": SCORE}},
+        # Relevância primeiro; a ordenação pedida desempata
+        {"$sort": {"_relevancia": -1, "ultima_data": -1}},
+        {"$facet": {
+            "items": [{"$skip": 0}, {"$limit": 10}, {"$project": {"_relevancia": 0}}],
+            "total": [{"$count": "total"}],
+        }},
+    ]
+    assert list(pipeline[2]["$sort"]) == ["_relevancia", "ultima_data"]
+
+    # Com projeção, ela já descarta a pontuação
+    pipeline = facet_page_pipeline(ACTIVE_FILTER, {}, 0, 10, score=SCORE, projection={"nome_evento": 1})
+    assert pipeline[-1] == {"$project": {"nome_evento": 1}}
+    assert {"$project": {"_relevancia": 0}} not in pipeline
+
+
+@pytest.mark.parametrize("filtro, total, score, esperado", [
+    (ACTIVE_FILTER, "exato", None, False),
+    (ACTIVE_FILTER, "exato", SCORE, True),
+    ({**ACTIVE_FILTER, "estado": "PB"}, "estimado", SCORE, True),
+    # Sem filtro o total estimado vem dos metadados da coleção
+    (ACTIVE_FILTER, "estimado", SCORE, False),
+    ({**ACTIVE_FILTER, "estado": "PB"}, "nenhum", SCORE, False),
+])
+def test_counts_in_pipeline(filtro, total, score, esperado):
+    assert counts_in_pipeline(filtro, total, score) is esperado
+
+
+@pytest.fixture(params=["find", "facet"])
+def engine(request, monkeypatch):
+    monkeypatch.setattr(settings, "PAGINATION_ENGINE", request.param)
+    return request.param
+
+
+def _eventos():
+    return [
+        evento("Corrida de Julho", datas=[datetime(2025, 7, 12)]),
+        evento("Corrida de Agosto", datas=[datetime(2025, 8, 2)]),
+        evento("Corrida Noturna", datas=[datetime(2025, 9, 6)], estado="RN", cidade="Natal"),
+        evento("Maratona", datas=[datetime(2025, 10, 5)]),
+        evento("Removida", datas=[datetime(2025, 11, 1)], ativo=False, removido=True),
+    ]
+
+
+@pytest.mark.parametrize("consulta, nomes, total", [
+    ("size=2", ["Maratona", "Corrida Noturna"], 4),
+    ("size=2&page=2", ["Corrida de Agosto", "Corrida de Julho"], 4),
+    ("ordem=1&size=3", ["Corrida de Julho", "Corrida de Agosto", "Corrida Noturna"], 4),
+    ("ordenar_por=nome_evento&ordem=1", ["Corrida Noturna", "Corrida de Agosto", "Corrida de Julho", "Maratona"], 4),
+    ("estado=PB&size=2", ["Maratona", "Corrida de Agosto"], 3),
+    ("total=nenhum&size=1", ["Maratona"], None),
+])
+def test_engines_retornam_a_mesma_pagina(client, db, engine, consulta, nomes, total):
+    inserir(db, _eventos())
+    pagina = client.get(f"{URL}/?{consulta}").json()
+    assert [item["nome_evento"] for item in pagina["items"]] == nomes
+    assert pagina["total"] == total
+
+
+def test_total_estimado_sem_filtro_usa_metadados(client, db, engine):
+    inserir(db, _eventos())
+    # O estimado inclui os removidos (poucos); com filtro o total é contado
+    assert client.get(f"{URL}/?total=estimado").json()["total"] == 5
+    assert client.get(f"{URL}/?total=estimado&estado=PB").json()["total"] == 3
+
+
+@pytest.mark.parametrize("consulta, total", [("", 3), ("&total=estimado", 3), ("&total=nenhum", None)])
+def test_busca_por_relevancia(client, db, engine, consulta, total):
+    inserir(db, _eventos())
+    # A busca sempre usa a agregação; o total sai do $facet quando contado
+    pagina = client.get(f"{URL}/?nome_evento=corrida&size=2{consulta}").json()
+    assert [item["nome_evento"] for item in pagina["items"]] == ["Corrida Noturna", "Corrida de Agosto"]
+    assert all("_relevancia" not in item for item in pagina["items"])
+    assert pagina["total"] == total